@@ -0,0 +1,70 @@
+"""
+Memory per 1M transactions for the domain model representations.
+
+    python -m benchmarks.domain_model_memory [--count 100000]
+
+Objects are built the way a repository read builds them: a fresh id, fresh
+address strings and a tz-aware datetime per row. Results are extrapolated
+to 1M transactions.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+import uuid
+from dataclasses import make_dataclass, fields
+from datetime import datetime, timedelta, UTC
+from typing import Callable, Iterator
+
+from src.core.models.transaction import Transaction
+
+# The pre-slots model: same fields, per-instance __dict__.
+DictTransaction = make_dataclass("DictTransaction", [(f.name, f.type) for f in fields(Transaction)])
+
+BASE = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def rows(count: int) -> Iterator[dict]:
+    for i in range(count):
+        yield {
+            "id": str(uuid.uuid4()),
+            "from_wallet_address": f"{uuid.UUID(int=i % 500)}",
+            "to_wallet_address": f"{uuid.UUID(int=i % 1000 + 500)}",
+            "amount_satoshis": 10_000 + i,
+            "fee_satoshis": 150,
+            "is_internal_transfer": False,
+            "created_at": BASE + timedelta(microseconds=i),
+        }
+
+
+def measure(count: int, build: Callable[[dict], object]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    objects = [build(row) for row in rows(count)]
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Domain model memory benchmark")
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    variants = (
+        ("dataclass with __dict__", lambda row: DictTransaction(**row)),
+        ("slots dataclass", lambda row: Transaction(**row)),
+        ("CompactTransaction", lambda row: Transaction(**row).to_compact()),
+    )
+
+    scale = 1_000_000 / args.count
+    print(f"{'representation':<26} {'MiB per 1M':>11} {'bytes/tx':>9}")
+    for label, build in variants:
+        used = measure(args.count, build)
+        print(f"{label:<26} {used * scale / 2 ** 20:>11.0f} {used / args.count:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
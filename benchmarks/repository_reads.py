@@ -0,0 +1,82 @@
+"""
+Compare ORM and Core read paths of SQLAlchemyTransactionRepository on a
+large wallet history.
+
+    python -m benchmarks.repository_reads [--rows 200000] [--repeat 3]
+
+Reports rows/s and the tracemalloc peak for loading the whole history of
+one wallet with each mode.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+from datetime import datetime, timedelta, UTC
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.core.models.transaction import Transaction
+from src.infra.database.models import Base
+from src.infra.repositories.transaction_repository import SQLAlchemyTransactionRepository
+
+WALLET = "benchmark-wallet"
+
+
+def seed(session: Session, rows: int) -> None:
+    base = datetime(2024, 1, 1, tzinfo=UTC)
+
+    def generate():
+        for i in range(rows):
+            tx = Transaction.create(WALLET, f"counterparty-{i % 1000}", 1000 + i, i % 3 == 0)
+            tx.created_at = base + timedelta(seconds=i)
+            yield tx
+
+    SQLAlchemyTransactionRepository(session).save_many(generate())
+    session.commit()
+
+
+def measure(session: Session, core_reads: bool, repeat: int) -> tuple[float, int]:
+    repo = SQLAlchemyTransactionRepository(session, core_reads=core_reads)
+    best = float("inf")
+    peak = 0
+
+    for _ in range(repeat):
+        session.expunge_all()
+        gc.collect()
+        tracemalloc.start()
+        started = time.perf_counter()
+
+        history = repo.get_by_wallet_address(WALLET)
+
+        elapsed = time.perf_counter() - started
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        best = min(best, elapsed)
+        del history
+
+    return best, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ORM vs Core repository read benchmark")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        seed(session, args.rows)
+
+        print(f"{'mode':<6} {'rows/s':>12} {'peak MiB':>10}")
+        for label, core_reads in (("orm", False), ("core", True)):
+            elapsed, peak = measure(session, core_reads, args.repeat)
+            print(f"{label:<6} {args.rows / elapsed:>12,.0f} {peak / 2 ** 20:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,39 @@
-from fastapi import Depends
+from fastapi import Depends, Header, HTTPException, Request
 from sqlalchemy.orm import Session
 
+from src.core.interfaces.exchange_rate import AsyncExchangeRateInterface, ExchangeRateInterface
+from src.core.models.user import User
+from src.core.services.rate_history_service import RateHistoryService
+from src.core.services.transaction_export_service import TransactionExportService
+from src.core.services.transfer_service import TransferService
 from src.core.services.user_service import UserService
+from src.core.services.wallet_service import WalletService
 from src.infra.database.sqlalchemy_connection import get_sqlalchemy_session
 from src.infra.database.sqlalchemy_uow import SQLAlchemyUnitOfWork
+from src.infra.database.transaction_archive import configured_archive
+from src.infra.repositories.cached_wallet_repository import CachedWalletRepository
+from src.infra.repositories.transaction_repository import SQLAlchemyTransactionRepository
 from src.infra.repositories.user_repository import SQLAlchemyUserRepository
+from src.infra.repositories.wallet_adjustment_repository import SQLAlchemyWalletAdjustmentRepository
+from src.infra.repositories.wallet_repository import SQLAlchemyWalletRepository
 from src.infra.security.api_key_generator import ApiKeyGenerator
 
+transaction_archive = configured_archive()
+
+
+def get_transaction_repository(session: Session = Depends(get_sqlalchemy_session)) -> SQLAlchemyTransactionRepository:
+    return SQLAlchemyTransactionRepository(session, archive=transaction_archive)
+
+
+def get_wallet_repository(
+        request: Request,
+        session: Session = Depends(get_sqlalchemy_session),
+) -> CachedWalletRepository:
+    return CachedWalletRepository(
+        SQLAlchemyWalletRepository(session),
+        request.app.state.wallet_cache,
+    ).bind_to_session(session)
+
 
 def get_user_service(session: Session = Depends(get_sqlalchemy_session)) -> UserService:
     user_repository = SQLAlchemyUserRepository(session)
@@ -16,4 +43,61 @@ def get_user_service(session: Session = Depends(get_sqlalchemy_session)) -> User
         uow=unit_of_work,
         user_repository=user_repository,
         api_key_generator=api_key_generator
-    )
\ No newline at end of file
+    )
+
+
+def get_current_user(
+        x_api_key: str = Header(...),
+        user_service: UserService = Depends(get_user_service),
+) -> User:
+    user = user_service.authenticate_user(x_api_key)
+    if user is None:
+        raise HTTPException(status_code=401, detail="Invalid API key")
+    return user
+
+
+def get_transaction_export_service(
+        wallet_repository: CachedWalletRepository = Depends(get_wallet_repository),
+        transaction_repository: SQLAlchemyTransactionRepository = Depends(get_transaction_repository),
+) -> TransactionExportService:
+    return TransactionExportService(
+        wallet_repository=wallet_repository,
+        transaction_repository=transaction_repository,
+    )
+
+
+def get_transfer_service(
+        session: Session = Depends(get_sqlalchemy_session),
+        wallet_repository: CachedWalletRepository = Depends(get_wallet_repository),
+        transaction_repository: SQLAlchemyTransactionRepository = Depends(get_transaction_repository),
+) -> TransferService:
+    return TransferService(
+        uow=SQLAlchemyUnitOfWork(session),
+        wallet_repository=wallet_repository,
+        transaction_repository=transaction_repository,
+    )
+
+
+def get_wallet_service(
+        request: Request,
+        session: Session = Depends(get_sqlalchemy_session),
+        wallet_repository: CachedWalletRepository = Depends(get_wallet_repository),
+) -> WalletService:
+    return WalletService(
+        wallet_repository,
+        SQLAlchemyWalletAdjustmentRepository(session),
+        max_update_attempts=request.app.state.settings.WALLET_UPDATE_MAX_ATTEMPTS,
+        metrics=request.app.state.wallet_update_metrics,
+    )
+
+
+def get_rate_history_service(request: Request) -> RateHistoryService:
+    return RateHistoryService(request.app.state.rate_history)
+
+
+def get_exchange_rate_client(request: Request) -> AsyncExchangeRateInterface:
+    return request.app.state.exchange_rate_client
+
+
+def get_exchange_rate_service(request: Request) -> ExchangeRateInterface:
+    return request.app.state.exchange_rate_refresher
@@ -1 +1,2 @@
+from .transaction import router as transaction_router
 from .user import router as user_router
\ No newline at end of file
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from enum import Enum
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+
+from src.api.dependencies import get_current_user, get_transaction_export_service
+from src.core.models.transaction import Transaction
+from src.core.models.user import User
+from src.core.services.transaction_export_service import TransactionExportService
+from src.core.services.wallet_service import UnauthorizedWalletAccessError, WalletNotFoundError
+from src.core.timestamps import from_epoch_micros, to_epoch_micros
+
+router = APIRouter(prefix="/transactions")
+
+EXPORT_FIELDS = (
+    "id",
+    "from_wallet_address",
+    "to_wallet_address",
+    "amount_satoshis",
+    "fee_satoshis",
+    "is_internal_transfer",
+    "created_at",
+)
+# Rows per chunk handed to the server: large enough that per-send overhead
+# does not dominate, small enough that the first bytes leave early.
+EXPORT_CHUNK_ROWS = 500
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+def _export_row(transaction: Transaction) -> tuple:
+    return (
+        transaction.id,
+        transaction.from_wallet_address,
+        transaction.to_wallet_address,
+        transaction.amount_satoshis,
+        transaction.fee_satoshis,
+        transaction.is_internal_transfer,
+        from_epoch_micros(to_epoch_micros(transaction.created_at)).isoformat(),
+    )
+
+
+def ndjson_chunks(transactions: Iterable[Transaction], chunk_rows: int = EXPORT_CHUNK_ROWS) -> Iterator[str]:
+    iterator = iter(transactions)
+    while chunk := list(islice(iterator, chunk_rows)):
+        yield "".join(
+            json.dumps(dict(zip(EXPORT_FIELDS, _export_row(t))), separators=(",", ":")) + "\n" for t in chunk
+        )
+
+
+def csv_chunks(transactions: Iterable[Transaction], chunk_rows: int = EXPORT_CHUNK_ROWS) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(EXPORT_FIELDS)
+
+    iterator = iter(transactions)
+    while chunk := list(islice(iterator, chunk_rows)):
+        writer.writerows(_export_row(t) for t in chunk)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        # Header only: the history was empty.
+        yield buffer.getvalue()
+
+
+_EXPORTERS = {
+    ExportFormat.NDJSON: (ndjson_chunks, "application/x-ndjson"),
+    ExportFormat.CSV: (csv_chunks, "text/csv"),
+}
+
+
+@router.get("/export")
+def export_transactions(
+        format: ExportFormat = ExportFormat.NDJSON,
+        wallet_address: Optional[str] = None,
+        user: User = Depends(get_current_user),
+        export_service: TransactionExportService = Depends(get_transaction_export_service),
+):
+    try:
+        transactions = export_service.iter_history(user_id=user.id, wallet_address=wallet_address)
+    except WalletNotFoundError:
+        raise HTTPException(status_code=404, detail="Wallet not found")
+    except UnauthorizedWalletAccessError:
+        raise HTTPException(status_code=403, detail="Unauthorized")
+
+    chunks, media_type = _EXPORTERS[format]
+    return StreamingResponse(
+        chunks(transactions),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="transactions.{format.value}"'},
+    )
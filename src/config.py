@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Optional
 
 from pydantic import Field, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -29,8 +30,41 @@ class Settings(BaseSettings):
 
     MIGRATIONS_PATH: str = str(ROOT_DIR / "src" / "migrations")
 
+    # Transactions older than TRANSACTION_ARCHIVE_AFTER_DAYS move to one SQLite
+    # file per TRANSACTION_ARCHIVE_PERIOD ("year" or "month") in this directory.
+    TRANSACTION_ARCHIVE_DIR: Path = ROOT_DIR / "data" / "archive"
+    TRANSACTION_ARCHIVE_PERIOD: str = "year"
+    TRANSACTION_ARCHIVE_AFTER_DAYS: int = 365
+    TRANSACTION_ARCHIVE_CHUNK_SIZE: int = 1000
+
+    # Shared LRU of wallets by address; writes invalidate their entries.
+    WALLET_CACHE_MAX_ENTRIES: int = 10_000
+    WALLET_CACHE_TTL_SECONDS: float = 5.0
+    WALLET_UPDATE_MAX_ATTEMPTS: int = 3
+
     ADMIN_API_KEY: str = "admin-api-key"   # declared in .env file
 
+    EXCHANGE_RATE_API_URL: str = "https://api.coinbase.com/v2/exchange-rates?currency=BTC"
+    EXCHANGE_RATE_TIMEOUT_SECONDS: float = 5.0
+    EXCHANGE_RATE_MAX_CONNECTIONS: int = 10
+    EXCHANGE_RATE_MAX_KEEPALIVE_CONNECTIONS: int = 5
+    EXCHANGE_RATE_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    EXCHANGE_RATE_REFRESH_INTERVAL_SECONDS: float = 15.0
+    EXCHANGE_RATE_MAX_STALENESS_SECONDS: float = 300.0
+    # Workers publish the rate through this memory-mapped file: one of them
+    # polls the upstream, the others read what it wrote. None polls per worker.
+    EXCHANGE_RATE_SHARED_FILE: Optional[Path] = ROOT_DIR / "data" / "exchange_rate.bin"
+
+    # Query several upstream sources with hedging instead of EXCHANGE_RATE_API_URL alone.
+    EXCHANGE_RATE_AGGREGATE_SOURCES: bool = False
+    EXCHANGE_RATE_QUORUM: int = 1
+    EXCHANGE_RATE_HEDGE_DELAY_SECONDS: float = 0.15
+    EXCHANGE_RATE_LATENCY_BUDGET_SECONDS: float = 1.0
+
+    EXCHANGE_RATE_BREAKER_FAILURE_RATE: float = 0.5
+    EXCHANGE_RATE_BREAKER_SLOW_CALL_SECONDS: float = 2.0
+    EXCHANGE_RATE_BREAKER_OPEN_SECONDS: float = 30.0
+
     model_config = SettingsConfigDict(
         env_file=str(ROOT_DIR / ".env"),
         env_file_encoding="utf-8",
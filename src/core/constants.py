@@ -1,2 +1,3 @@
 INITIAL_BALANCE_SATOSHIS = 100_000_000
 MAX_WALLETS_PER_USER = 3
+SATOSHIS_PER_BTC = 100_000_000
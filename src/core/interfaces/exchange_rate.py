@@ -1,11 +1,18 @@
 from abc import ABC, abstractmethod
 from decimal import Decimal
+from typing import Iterable
+
+from src.core.models.exchange_rate import ConversionBatch, RateSnapshot, UsdConversionBatch
 
 class ExchangeRateInterface(ABC):
     @abstractmethod
     def get_btc_to_usd_rate(self) -> Decimal:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_rate_snapshot(self) -> RateSnapshot:
+        raise NotImplementedError
+
     @abstractmethod
     def satoshis_to_usd(self, satoshis: int) -> Decimal:
         raise NotImplementedError
@@ -14,5 +21,46 @@ class ExchangeRateInterface(ABC):
     def btc_to_usd(self, btc: Decimal) -> Decimal:
         raise NotImplementedError
 
+    @abstractmethod
+    def convert_many(self, satoshi_amounts: Iterable[int]) -> UsdConversionBatch:
+        raise NotImplementedError
+
+    @abstractmethod
+    def satoshis_to(self, currency: str, satoshis: int) -> Decimal:
+        raise NotImplementedError
+
+    @abstractmethod
+    def convert_many_to(self, currency: str, satoshi_amounts: Iterable[int]) -> ConversionBatch:
+        raise NotImplementedError
+
+class AsyncExchangeRateInterface(ABC):
+    @abstractmethod
+    async def get_btc_to_usd_rate(self) -> Decimal:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_rate_snapshot(self) -> RateSnapshot:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def satoshis_to_usd(self, satoshis: int) -> Decimal:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def btc_to_usd(self, btc: Decimal) -> Decimal:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def convert_many(self, satoshi_amounts: Iterable[int]) -> UsdConversionBatch:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def satoshis_to(self, currency: str, satoshis: int) -> Decimal:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def convert_many_to(self, currency: str, satoshi_amounts: Iterable[int]) -> ConversionBatch:
+        raise NotImplementedError
+
 class ExchangeRateError(Exception):
     pass
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional, Sequence
+
+from src.core.models.exchange_rate import RateSnapshot
+
+
+class RateHistoryRepositoryInterface(ABC):
+    @abstractmethod
+    def record(self, snapshot: RateSnapshot) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def rate_at(self, at: datetime) -> Optional[Decimal]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def rates_at(self, times: Sequence[datetime]) -> list[Optional[Decimal]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def count(self) -> int:
+        raise NotImplementedError
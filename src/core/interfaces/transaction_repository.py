@@ -1,13 +1,17 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
-from src.core.models.transaction import Transaction
+from src.core.models.transaction import Transaction, TransactionFilter, TransactionPage
 
 class TransactionRepositoryInterface(ABC):
     @abstractmethod
     def save(self, transaction: Transaction) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def save_many(self, transactions: Iterable[Transaction]) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def get_by_id(self, transaction_id: str) -> Optional[Transaction]:
         raise NotImplementedError
@@ -20,10 +24,39 @@ class TransactionRepositoryInterface(ABC):
     def get_by_user_wallets(self, wallet_addresses: list[str]) -> list[Transaction]:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_page_by_wallet_address(
+            self, wallet_address: str, limit: int = 50, cursor: Optional[str] = None
+    ) -> TransactionPage:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_page_by_user_wallets(
+            self, wallet_addresses: list[str], limit: int = 50, cursor: Optional[str] = None
+    ) -> TransactionPage:
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_transactions(
+            self, transaction_filter: Optional[TransactionFilter] = None, batch_size: int = 1000
+    ) -> Iterator[Transaction]:
+        raise NotImplementedError
+
     @abstractmethod
     def get_total_fees_collected(self) -> int:
         raise NotImplementedError
 
     @abstractmethod
     def count_all(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def scan_platform_totals(self) -> tuple[int, int]:
+        """
+        (transaction count, total fees) recomputed from every transaction.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def rebuild_platform_stats(self) -> None:
         raise NotImplementedError
\ No newline at end of file
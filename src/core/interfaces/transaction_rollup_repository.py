@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Iterable, Optional
+
+from src.core.models.transaction import Transaction
+from src.core.models.transaction_rollup import RollupGranularity, TransactionRollup
+
+
+class TransactionRollupRepositoryInterface(ABC):
+    @abstractmethod
+    def add(self, transactions: Iterable[Transaction]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_rollups(self, granularity: RollupGranularity, start: datetime, end: datetime) -> list[TransactionRollup]:
+        """
+        Non-empty buckets starting in [start, end), oldest first.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def rebuild_range(self, start: datetime, end: datetime) -> None:
+        """
+        Recompute every bucket in [start, end) from the transactions table.
+        Both bounds must fall on day boundaries.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def transaction_time_range(self) -> Optional[tuple[datetime, datetime]]:
+        raise NotImplementedError
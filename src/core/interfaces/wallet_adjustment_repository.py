@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+
+class WalletAdjustmentRepositoryInterface(ABC):
+    """
+    Running totals of balance changes made outside the transaction ledger
+    (deposits and withdrawals), so the balance audit can account for them.
+    """
+
+    @abstractmethod
+    def add(self, wallet_address: str, amount_satoshis: int) -> None:
+        """
+        Add a signed change to the wallet's total, in the caller's transaction.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def total(self, wallet_address: str) -> int:
+        raise NotImplementedError
@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+
+from src.core.models.transaction import TransactionCursor
+from src.core.models.wallet_checkpoint import WalletCheckpoint
+
+
+class WalletCheckpointRepositoryInterface(ABC):
+    @abstractmethod
+    def get(self, wallet_address: str) -> Optional[WalletCheckpoint]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def latest_cursor(self) -> Optional[TransactionCursor]:
+        """
+        Position of the last transaction applied by advance(), if any.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def balance_delta(self, wallet_address: str, after: Optional[TransactionCursor]) -> int:
+        """
+        Net effect on the wallet of every transaction after the cursor:
+        recipient amounts in, full amounts out.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def advance(self, created_before: datetime, limit: int, opening_balance_satoshis: int) -> int:
+        """
+        Apply up to limit transactions past latest_cursor() and created before
+        created_before to the checkpoints of the wallets they touch. Wallets
+        without a checkpoint start from opening_balance_satoshis. Returns the
+        number of transactions applied.
+        """
+        raise NotImplementedError
@@ -1,9 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterable, Optional
 
 from src.core.models.wallet import Wallet
 
 
+class StaleWalletError(Exception):
+    """
+    The wallet changed since it was read; re-read and retry.
+    """
+
+
 class WalletRepositoryInterface(ABC):
     @abstractmethod
     def save(self, wallet: Wallet):
@@ -17,10 +23,36 @@ class WalletRepositoryInterface(ABC):
     def get_by_address(self, address: str) -> Optional[Wallet]:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_many_by_addresses(self, addresses: Iterable[str]) -> dict[str, Wallet]:
+        """
+        Wallets keyed by address; unknown addresses are left out.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_by_user_id(self, user_id: str) -> list[Wallet]:
         raise NotImplementedError
 
     @abstractmethod
     def update(self, wallet: Wallet):
+        """
+        Store the balance if the wallet is still at wallet.version, then bump
+        it; StaleWalletError otherwise.
+        """
+        raise NotImplementedError
+
+
+    @abstractmethod
+    def debit(self, address: str, amount_satoshis: int) -> bool:
+        """
+        Subtracts the amount only if the balance covers it; False otherwise.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def credit(self, address: str, amount_satoshis: int) -> bool:
+        """
+        Adds the amount; False if the wallet does not exist.
+        """
         raise NotImplementedError
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, UTC
+from decimal import Decimal
+from typing import Any, Iterable, Mapping, Optional
+
+from src.core.constants import SATOSHIS_PER_BTC
+
+
+BASE_CURRENCY = "USD"
+
+
+def parse_rate(value: Any) -> Decimal:
+    """
+    A quoted BTC price. NaN, infinities, zero and negative quotes raise
+    ValueError like any other unparsable value.
+    """
+    try:
+        rate = Decimal(str(value))
+    except ArithmeticError:
+        raise ValueError(f"Not a number: {value!r}") from None
+
+    if not rate.is_finite() or rate <= 0:
+        raise ValueError(f"Not a usable rate: {value!r}")
+    return rate
+
+
+def parse_rate_table(table: Mapping[str, Any]) -> dict[str, Decimal]:
+    rates = {}
+    for currency, value in table.items():
+        try:
+            rates[currency.upper()] = parse_rate(value)
+        except ValueError:
+            continue
+    return rates
+
+
+@dataclass(frozen=True, slots=True)
+class RateSnapshot:
+    """
+    The BTC/USD rate plus, when the upstream sent one, the whole BTC rate
+    table (currency code -> units per BTC) from the same fetch.
+    """
+    rate: Decimal
+    fetched_at: datetime
+    source: str
+    rates: Mapping[str, Decimal] = field(default_factory=dict)
+
+    @classmethod
+    def now(cls, rate: Decimal, source: str, rates: Optional[Mapping[str, Decimal]] = None) -> RateSnapshot:
+        return cls(rate=rate, fetched_at=datetime.now(UTC), source=source, rates=rates or {})
+
+    @classmethod
+    def from_rate_table(cls, table: Mapping[str, Any], source: str) -> RateSnapshot:
+        """
+        Parse a Coinbase-style `rates` object. USD is required; entries that
+        are not finite positive numbers are skipped rather than failing the
+        whole table.
+        """
+        rates = parse_rate_table(table)
+        return cls.now(rate=rates[BASE_CURRENCY], source=source, rates=rates)
+
+    def rate_for(self, currency: str) -> Decimal:
+        currency = currency.upper()
+        if currency == BASE_CURRENCY:
+            return self.rate
+
+        try:
+            return self.rates[currency]
+        except KeyError:
+            raise ValueError(f"No BTC rate for currency {currency}") from None
+
+
+@dataclass(frozen=True, slots=True)
+class UsdConversionBatch:
+    amounts_usd: list[Decimal]
+    snapshot: RateSnapshot
+
+    @property
+    def rate(self) -> Decimal:
+        return self.snapshot.rate
+
+    @property
+    def fetched_at(self) -> datetime:
+        return self.snapshot.fetched_at
+
+    @classmethod
+    def from_snapshot(cls, snapshot: RateSnapshot, satoshi_amounts: Iterable[int]) -> UsdConversionBatch:
+        return cls(amounts_usd=_convert(snapshot.rate, satoshi_amounts), snapshot=snapshot)
+
+
+@dataclass(frozen=True, slots=True)
+class ConversionBatch:
+    currency: str
+    amounts: list[Decimal]
+    snapshot: RateSnapshot
+
+    @property
+    def rate(self) -> Decimal:
+        return self.snapshot.rate_for(self.currency)
+
+    @property
+    def fetched_at(self) -> datetime:
+        return self.snapshot.fetched_at
+
+    @classmethod
+    def from_snapshot(cls, snapshot: RateSnapshot, currency: str, satoshi_amounts: Iterable[int]) -> ConversionBatch:
+        currency = currency.upper()
+        return cls(
+            currency=currency,
+            amounts=_convert(snapshot.rate_for(currency), satoshi_amounts),
+            snapshot=snapshot,
+        )
+
+
+def _convert(rate: Decimal, satoshi_amounts: Iterable[int]) -> list[Decimal]:
+    # Dividing by 10^8 only shifts the exponent, so this stays exact and
+    # every amount then costs a single multiplication.
+    per_satoshi = rate / Decimal(SATOSHIS_PER_BTC)
+
+    amounts = []
+    for satoshis in satoshi_amounts:
+        if satoshis < 0:
+            raise ValueError("Satoshis cannot be negative")
+        amounts.append(satoshis * per_satoshi)
+
+    return amounts
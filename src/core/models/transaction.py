@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import json
+import sys
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, UTC
 from typing import Optional
 from decimal import Decimal
 
-@dataclass
+from src.core.timestamps import from_epoch_micros, to_epoch_micros
+
+@dataclass(slots=True)
 class Transaction:
     from_wallet_address: str
     to_wallet_address: str
@@ -56,4 +62,104 @@ class Transaction:
         return self.amount_satoshis
 
     def get_recipient_amount(self) -> int:
-        return self.amount_satoshis - self.fee_satoshis
\ No newline at end of file
+        return self.amount_satoshis - self.fee_satoshis
+
+    def to_compact(self) -> CompactTransaction:
+        if self.id is None or self.created_at is None:
+            raise ValueError("Only persisted transactions can be compacted")
+
+        return CompactTransaction(
+            id=self.id,
+            from_wallet_address=sys.intern(self.from_wallet_address),
+            to_wallet_address=sys.intern(self.to_wallet_address),
+            amount_satoshis=self.amount_satoshis,
+            fee_satoshis=self.fee_satoshis,
+            is_internal_transfer=self.is_internal_transfer,
+            created_at_us=to_epoch_micros(self.created_at)
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CompactTransaction:
+    """
+    Read-only, memory-lean form for bulk in-memory work: wallet addresses are
+    interned so repeated counterparties share one string, and created_at is
+    an integer of epoch microseconds rather than a datetime.
+    """
+    id: str
+    from_wallet_address: str
+    to_wallet_address: str
+    amount_satoshis: int
+    fee_satoshis: int
+    is_internal_transfer: bool
+    created_at_us: int
+
+    @property
+    def created_at(self) -> datetime:
+        return from_epoch_micros(self.created_at_us)
+
+    def to_transaction(self) -> Transaction:
+        return Transaction(
+            id=self.id,
+            from_wallet_address=self.from_wallet_address,
+            to_wallet_address=self.to_wallet_address,
+            amount_satoshis=self.amount_satoshis,
+            fee_satoshis=self.fee_satoshis,
+            is_internal_transfer=self.is_internal_transfer,
+            created_at=self.created_at
+        )
+
+
+@dataclass(frozen=True)
+class TransactionFilter:
+    """
+    Criteria for iter_transactions; every field left as None matches all.
+    wallet_addresses matches either side of a transfer.
+    """
+    wallet_addresses: Optional[list[str]] = None
+    created_from: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+    is_internal_transfer: Optional[bool] = None
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class TransactionCursor:
+    """
+    Position after the last transaction of a page, in (created_at, id)
+    order. Clients only ever see the encoded, opaque form.
+    """
+    created_at: datetime
+    id: str
+
+    @classmethod
+    def after(cls, transaction: Transaction) -> TransactionCursor:
+        return cls(created_at=transaction.created_at, id=transaction.id)
+
+    def encode(self) -> str:
+        payload = json.dumps([to_epoch_micros(self.created_at), self.id], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> TransactionCursor:
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            micros, transaction_id = json.loads(raw)
+            if not isinstance(micros, int) or not isinstance(transaction_id, str):
+                raise TypeError("unexpected cursor payload")
+            return cls(created_at=from_epoch_micros(micros), id=transaction_id)
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, OverflowError) as e:
+            raise InvalidCursorError("Invalid pagination cursor") from e
+
+
+@dataclass
+class TransactionPage:
+    transactions: list[Transaction]
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
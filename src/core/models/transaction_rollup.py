@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+
+from src.core.timestamps import from_epoch_micros, to_epoch_micros
+
+
+class RollupGranularity(str, Enum):
+    HOUR = "hour"
+    DAY = "day"
+
+    @property
+    def step(self) -> timedelta:
+        return timedelta(hours=1) if self is RollupGranularity.HOUR else timedelta(days=1)
+
+    @property
+    def step_micros(self) -> int:
+        return self.step // timedelta(microseconds=1)
+
+    def floor_micros(self, micros: int) -> int:
+        return micros - micros % self.step_micros
+
+    def floor(self, value: datetime) -> datetime:
+        """
+        Start of the UTC bucket containing value.
+        """
+        return from_epoch_micros(self.floor_micros(to_epoch_micros(value)))
+
+
+@dataclass(slots=True)
+class TransactionRollup:
+    bucket_start: datetime
+    transaction_count: int = 0
+    internal_count: int = 0
+    volume_satoshis: int = 0
+    internal_volume_satoshis: int = 0
+    fees_satoshis: int = 0
+
+    @property
+    def external_count(self) -> int:
+        return self.transaction_count - self.internal_count
+
+    @property
+    def external_volume_satoshis(self) -> int:
+        return self.volume_satoshis - self.internal_volume_satoshis
@@ -7,7 +7,7 @@ from typing import Optional
 class WalletLimitReachedError(Exception):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class User:
     api_key: str
     id: Optional[str] = None
@@ -4,12 +4,14 @@ from uuid import uuid4
 from src.core.constants import INITIAL_BALANCE_SATOSHIS
 
 
-@dataclass
+@dataclass(slots=True)
 class Wallet:
     id: str
     address: str
     user_id: str
     balance_satoshis: int
+    # Bumped on every balance change; updates only apply to the version read.
+    version: int = 0
 
     @classmethod
     def create(cls, user_id: str) -> "Wallet":
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from src.core.models.transaction import TransactionCursor
+
+
+@dataclass(frozen=True, slots=True)
+class WalletCheckpoint:
+    """
+    A wallet's ledger balance after every transaction up to and including
+    the one at cursor, in (created_at, id) order.
+    """
+    wallet_address: str
+    balance_satoshis: int
+    cursor: TransactionCursor
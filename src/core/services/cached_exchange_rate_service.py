@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Callable, Optional
+
+from src.core.interfaces.exchange_rate import ExchangeRateInterface, ExchangeRateError
+from src.core.models.exchange_rate import RateSnapshot
+from src.core.services.exchange_rate_service import BaseExchangeRateService
+
+
+@dataclass(frozen=True, slots=True)
+class _CacheEntry:
+    snapshot: RateSnapshot
+    stored_at: float
+
+
+class CachedExchangeRateService(BaseExchangeRateService):
+    """
+    Caches the rate of another provider.
+
+    - Within ttl_seconds the cached rate is returned as is.
+    - Between ttl_seconds and max_staleness_seconds the stale rate is returned
+      and a single background refresh is started.
+    - Past max_staleness_seconds (or before the first fetch) the caller waits
+      for a refresh and gets ExchangeRateError if it fails.
+    """
+    DEFAULT_TTL_SECONDS = 30.0
+    DEFAULT_MAX_STALENESS_SECONDS = 300.0
+
+    def __init__(
+            self,
+            provider: ExchangeRateInterface,
+            ttl_seconds: float = DEFAULT_TTL_SECONDS,
+            max_staleness_seconds: float = DEFAULT_MAX_STALENESS_SECONDS,
+            clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl_seconds <= 0:
+            raise ValueError("TTL must be positive")
+        if max_staleness_seconds < ttl_seconds:
+            raise ValueError("Max staleness cannot be shorter than TTL")
+
+        self._provider = provider
+        self._ttl_seconds = ttl_seconds
+        self._max_staleness_seconds = max_staleness_seconds
+        self._clock = clock
+
+        self._entry: Optional[_CacheEntry] = None
+        self._fetch_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self.last_refresh_error: Optional[ExchangeRateError] = None
+
+    def get_btc_to_usd_rate(self) -> Decimal:
+        return self.get_rate_snapshot().rate
+
+    def get_rate_snapshot(self) -> RateSnapshot:
+        entry = self._entry
+        if entry is not None:
+            age = self._clock() - entry.stored_at
+            if age <= self._ttl_seconds:
+                return entry.snapshot
+            if age <= self._max_staleness_seconds:
+                self._schedule_refresh()
+                return entry.snapshot
+
+        return self._refresh_blocking()
+
+    def invalidate(self) -> None:
+        self._entry = None
+
+    def _refresh_blocking(self) -> RateSnapshot:
+        with self._fetch_lock:
+            # Another caller may have refreshed while we waited for the lock.
+            entry = self._entry
+            if entry is not None and self._clock() - entry.stored_at <= self._max_staleness_seconds:
+                return entry.snapshot
+
+            try:
+                return self._fetch()
+            except ExchangeRateError as e:
+                self.last_refresh_error = e
+                raise ExchangeRateError(f"No BTC rate within max staleness: {str(e)}") from e
+
+    def _schedule_refresh(self) -> None:
+        with self._state_lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_in_background,
+                name="exchange-rate-refresh",
+                daemon=True,
+            )
+            self._refresh_thread.start()
+
+    def _refresh_in_background(self) -> None:
+        with self._fetch_lock:
+            entry = self._entry
+            if entry is not None and self._clock() - entry.stored_at <= self._ttl_seconds:
+                return
+
+            try:
+                self._fetch()
+            except ExchangeRateError as e:
+                # Keep serving the stale value until max staleness is reached.
+                self.last_refresh_error = e
+
+    def _fetch(self) -> RateSnapshot:
+        snapshot = self._provider.get_rate_snapshot()
+        self._entry = _CacheEntry(snapshot=snapshot, stored_at=self._clock())
+        self.last_refresh_error = None
+        return snapshot
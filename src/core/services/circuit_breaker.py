@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable
+
+from src.core.interfaces.exchange_rate import ExchangeRateError
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(ExchangeRateError):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class CircuitBreakerStats:
+    state: CircuitState
+    total_calls: int
+    successful_calls: int
+    failed_calls: int
+    slow_calls: int
+    rejected_calls: int
+    state_changes: int
+    window_failure_rate: float
+    window_slow_call_rate: float
+
+
+class CircuitBreaker:
+    """
+    Tracks the outcome of recent calls and stops calling a failing dependency.
+
+    - CLOSED: calls go through; the last window_size outcomes are kept.
+      Once min_calls are recorded and the failure rate (or the share of calls
+      slower than slow_call_seconds) reaches its threshold, the breaker opens.
+    - OPEN: calls are rejected with CircuitOpenError without touching the
+      dependency, until open_seconds have passed.
+    - HALF_OPEN: up to half_open_max_calls probes go through. A successful
+      probe closes the breaker, a failed one opens it again.
+    """
+
+    def __init__(
+            self,
+            *,
+            window_size: int = 20,
+            min_calls: int = 5,
+            failure_rate_threshold: float = 0.5,
+            slow_call_seconds: float = 2.0,
+            slow_call_rate_threshold: float = 1.0,
+            open_seconds: float = 30.0,
+            half_open_max_calls: int = 1,
+            clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if min_calls > window_size:
+            raise ValueError("min_calls cannot exceed window_size")
+
+        self._min_calls = min_calls
+        self._failure_rate_threshold = failure_rate_threshold
+        self._slow_call_seconds = slow_call_seconds
+        self._slow_call_rate_threshold = slow_call_rate_threshold
+        self._open_seconds = open_seconds
+        self._half_open_max_calls = half_open_max_calls
+        self._clock = clock
+
+        # Re-entrant so state-change listeners may read stats().
+        self._lock = threading.RLock()
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        # (failed, slow) per call
+        self._window: deque[tuple[bool, bool]] = deque(maxlen=window_size)
+
+        self._total_calls = 0
+        self._successful_calls = 0
+        self._failed_calls = 0
+        self._slow_calls = 0
+        self._rejected_calls = 0
+        self._state_changes = 0
+        self._listeners: list[Callable[[CircuitState, CircuitState], None]] = []
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def add_listener(self, listener: Callable[[CircuitState, CircuitState], None]) -> None:
+        """
+        listener(old_state, new_state) is called on every transition.
+        """
+        self._listeners.append(listener)
+
+    def before_call(self) -> None:
+        """
+        Raises CircuitOpenError when the call must not reach the dependency.
+        """
+        with self._lock:
+            self._maybe_half_open()
+
+            if self._state == CircuitState.OPEN:
+                self._rejected_calls += 1
+                remaining = self._open_seconds - (self._clock() - self._opened_at)
+                raise CircuitOpenError(f"Circuit open, retry in {remaining:.1f}s")
+
+            if self._state == CircuitState.HALF_OPEN:
+                if self._half_open_in_flight >= self._half_open_max_calls:
+                    self._rejected_calls += 1
+                    raise CircuitOpenError("Circuit half-open, probe already in flight")
+                self._half_open_in_flight += 1
+
+    def now(self) -> float:
+        """
+        The breaker's clock, for timing calls against slow_call_seconds.
+        """
+        return self._clock()
+
+    def release(self) -> None:
+        """
+        Give back the slot taken by before_call() without recording an
+        outcome, for calls that were cancelled rather than answered.
+        """
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+
+    def record_success(self, duration_seconds: float) -> None:
+        self._record(failed=False, duration_seconds=duration_seconds)
+
+    def record_failure(self, duration_seconds: float) -> None:
+        self._record(failed=True, duration_seconds=duration_seconds)
+
+    def stats(self) -> CircuitBreakerStats:
+        with self._lock:
+            self._maybe_half_open()
+            failure_rate, slow_rate = self._window_rates()
+            return CircuitBreakerStats(
+                state=self._state,
+                total_calls=self._total_calls,
+                successful_calls=self._successful_calls,
+                failed_calls=self._failed_calls,
+                slow_calls=self._slow_calls,
+                rejected_calls=self._rejected_calls,
+                state_changes=self._state_changes,
+                window_failure_rate=failure_rate,
+                window_slow_call_rate=slow_rate,
+            )
+
+    def _record(self, *, failed: bool, duration_seconds: float) -> None:
+        slow = duration_seconds >= self._slow_call_seconds
+
+        with self._lock:
+            self._total_calls += 1
+            if failed:
+                self._failed_calls += 1
+            else:
+                self._successful_calls += 1
+            if slow:
+                self._slow_calls += 1
+
+            if self._state == CircuitState.HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+                if failed or slow:
+                    self._transition(CircuitState.OPEN)
+                else:
+                    self._transition(CircuitState.CLOSED)
+                return
+
+            self._window.append((failed, slow))
+            if self._state == CircuitState.CLOSED and len(self._window) >= self._min_calls:
+                failure_rate, slow_rate = self._window_rates()
+                if failure_rate >= self._failure_rate_threshold or slow_rate >= self._slow_call_rate_threshold:
+                    self._transition(CircuitState.OPEN)
+
+    def _window_rates(self) -> tuple[float, float]:
+        if not self._window:
+            return 0.0, 0.0
+
+        failures = sum(1 for failed, _ in self._window if failed)
+        slow = sum(1 for _, is_slow in self._window if is_slow)
+        return failures / len(self._window), slow / len(self._window)
+
+    def _maybe_half_open(self) -> None:
+        if self._state == CircuitState.OPEN and self._clock() - self._opened_at >= self._open_seconds:
+            self._transition(CircuitState.HALF_OPEN)
+
+    def _transition(self, new_state: CircuitState) -> None:
+        old_state = self._state
+        if old_state == new_state:
+            return
+
+        self._state = new_state
+        self._state_changes += 1
+        if new_state == CircuitState.OPEN:
+            self._opened_at = self._clock()
+        elif new_state == CircuitState.HALF_OPEN:
+            self._half_open_in_flight = 0
+        elif new_state == CircuitState.CLOSED:
+            self._window.clear()
+
+        for listener in self._listeners:
+            listener(old_state, new_state)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Optional
+
+from src.core.interfaces.exchange_rate import AsyncExchangeRateInterface, ExchangeRateInterface
+from src.core.models.exchange_rate import RateSnapshot
+from src.core.services.circuit_breaker import CircuitBreaker
+from src.core.services.exchange_rate_service import BaseAsyncExchangeRateService, BaseExchangeRateService
+
+
+class CircuitBreakerExchangeRateService(BaseExchangeRateService):
+    """
+    Fails fast with CircuitOpenError while the wrapped provider is degraded,
+    instead of waiting out its timeout on every call. Any exception counts as
+    a failure; a cancelled call only gives back its slot.
+    """
+
+    def __init__(self, provider: ExchangeRateInterface, breaker: Optional[CircuitBreaker] = None) -> None:
+        self._provider = provider
+        self.breaker = breaker or CircuitBreaker()
+
+    def get_btc_to_usd_rate(self) -> Decimal:
+        return self.get_rate_snapshot().rate
+
+    def get_rate_snapshot(self) -> RateSnapshot:
+        self.breaker.before_call()
+
+        started = self.breaker.now()
+        try:
+            snapshot = self._provider.get_rate_snapshot()
+        except Exception:
+            self.breaker.record_failure(self.breaker.now() - started)
+            raise
+        except BaseException:
+            # Cancelled: no verdict on the dependency, but free a half-open slot.
+            self.breaker.release()
+            raise
+
+        self.breaker.record_success(self.breaker.now() - started)
+        return snapshot
+
+
+class AsyncCircuitBreakerExchangeRateClient(BaseAsyncExchangeRateService):
+    def __init__(self, client: AsyncExchangeRateInterface, breaker: Optional[CircuitBreaker] = None) -> None:
+        self._client = client
+        self.breaker = breaker or CircuitBreaker()
+
+    async def get_btc_to_usd_rate(self) -> Decimal:
+        return (await self.get_rate_snapshot()).rate
+
+    async def get_rate_snapshot(self) -> RateSnapshot:
+        self.breaker.before_call()
+
+        started = self.breaker.now()
+        try:
+            snapshot = await self._client.get_rate_snapshot()
+        except Exception:
+            self.breaker.record_failure(self.breaker.now() - started)
+            raise
+        except BaseException:
+            # Cancelled: no verdict on the dependency, but free a half-open slot.
+            self.breaker.release()
+            raise
+
+        self.breaker.record_success(self.breaker.now() - started)
+        return snapshot
@@ -1,24 +1,14 @@
-import requests
 from decimal import Decimal
+from typing import Iterable, Optional
 
-from src.core.interfaces.exchange_rate import ExchangeRateInterface, ExchangeRateError
+import httpx
 
+from src.core.interfaces.exchange_rate import AsyncExchangeRateInterface, ExchangeRateInterface, ExchangeRateError
+from src.core.models.exchange_rate import ConversionBatch, RateSnapshot, UsdConversionBatch
 
-class ExchangeRateService(ExchangeRateInterface):
-    SATOSHIS_PER_BTC = 100_000_000
-    API_URL = "https://api.coinbase.com/v2/exchange-rates?currency=BTC"
 
-    def get_btc_to_usd_rate(self) -> Decimal:
-        try:
-            response = requests.get(self.API_URL, timeout=5)
-            response.raise_for_status()
-            data = response.json()
-
-            rate = Decimal(str(data['data']['rates']['USD']))
-            return rate
-
-        except (requests.RequestException, KeyError, ValueError, TypeError) as e:
-            raise ExchangeRateError(f"Failed to fetch BTC rate: {str(e)}")
+class BaseExchangeRateService(ExchangeRateInterface):
+    SATOSHIS_PER_BTC = 100_000_000
 
     def satoshis_to_usd(self, satoshis: int) -> Decimal:
         if satoshis < 0:
@@ -32,4 +22,72 @@ class ExchangeRateService(ExchangeRateInterface):
             raise ValueError("BTC amount cannot be negative")
 
         rate = self.get_btc_to_usd_rate()
-        return btc * rate
\ No newline at end of file
+        return btc * rate
+
+    def get_rate_snapshot(self) -> RateSnapshot:
+        return RateSnapshot.now(rate=self.get_btc_to_usd_rate(), source=type(self).__name__)
+
+    def convert_many(self, satoshi_amounts: Iterable[int]) -> UsdConversionBatch:
+        return UsdConversionBatch.from_snapshot(self.get_rate_snapshot(), satoshi_amounts)
+
+    def satoshis_to(self, currency: str, satoshis: int) -> Decimal:
+        return self.convert_many_to(currency, [satoshis]).amounts[0]
+
+    def convert_many_to(self, currency: str, satoshi_amounts: Iterable[int]) -> ConversionBatch:
+        return ConversionBatch.from_snapshot(self.get_rate_snapshot(), currency, satoshi_amounts)
+
+
+class BaseAsyncExchangeRateService(AsyncExchangeRateInterface):
+    SATOSHIS_PER_BTC = 100_000_000
+
+    async def satoshis_to_usd(self, satoshis: int) -> Decimal:
+        if satoshis < 0:
+            raise ValueError("Satoshis cannot be negative")
+
+        btc = Decimal(satoshis) / Decimal(self.SATOSHIS_PER_BTC)
+        return await self.btc_to_usd(btc)
+
+    async def btc_to_usd(self, btc: Decimal) -> Decimal:
+        if btc < 0:
+            raise ValueError("BTC amount cannot be negative")
+
+        rate = await self.get_btc_to_usd_rate()
+        return btc * rate
+
+    async def get_rate_snapshot(self) -> RateSnapshot:
+        return RateSnapshot.now(rate=await self.get_btc_to_usd_rate(), source=type(self).__name__)
+
+    async def convert_many(self, satoshi_amounts: Iterable[int]) -> UsdConversionBatch:
+        return UsdConversionBatch.from_snapshot(await self.get_rate_snapshot(), satoshi_amounts)
+
+    async def satoshis_to(self, currency: str, satoshis: int) -> Decimal:
+        return (await self.convert_many_to(currency, [satoshis])).amounts[0]
+
+    async def convert_many_to(self, currency: str, satoshi_amounts: Iterable[int]) -> ConversionBatch:
+        return ConversionBatch.from_snapshot(await self.get_rate_snapshot(), currency, satoshi_amounts)
+
+
+class ExchangeRateService(BaseExchangeRateService):
+    API_URL = "https://api.coinbase.com/v2/exchange-rates?currency=BTC"
+    TIMEOUT_SECONDS = 5
+
+    def __init__(self, client: Optional[httpx.Client] = None, api_url: str = API_URL) -> None:
+        self._client = client
+        self._api_url = api_url
+
+    def get_btc_to_usd_rate(self) -> Decimal:
+        return self.get_rate_snapshot().rate
+
+    def get_rate_snapshot(self) -> RateSnapshot:
+        try:
+            if self._client is not None:
+                response = self._client.get(self._api_url)
+            else:
+                response = httpx.get(self._api_url, timeout=self.TIMEOUT_SECONDS)
+            response.raise_for_status()
+            data = response.json()
+
+            return RateSnapshot.from_rate_table(data['data']['rates'], source="coinbase")
+
+        except (httpx.HTTPError, KeyError, ValueError, TypeError, AttributeError) as e:
+            raise ExchangeRateError(f"Failed to fetch BTC rate: {str(e)}")
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Optional, Sequence
+
+from src.core.constants import SATOSHIS_PER_BTC
+from src.core.interfaces.rate_history_repository import RateHistoryRepositoryInterface
+from src.core.models.exchange_rate import RateSnapshot
+from src.core.models.transaction import Transaction
+
+
+@dataclass(frozen=True, slots=True)
+class TransactionValuation:
+    transaction_id: Optional[str]
+    rate: Optional[Decimal]
+    amount_usd: Optional[Decimal]
+    fee_usd: Optional[Decimal]
+
+
+class RateHistoryService:
+    def __init__(self, rate_history_repository: RateHistoryRepositoryInterface) -> None:
+        self._rate_history_repository = rate_history_repository
+
+    def record(self, snapshot: RateSnapshot) -> None:
+        self._rate_history_repository.record(snapshot)
+
+    def value_transactions(self, transactions: Sequence[Transaction]) -> list[TransactionValuation]:
+        """
+        Values each transaction at the rate in effect when it was created.
+        Rates are looked up in bulk; no network calls are made.
+        """
+        dated = [t for t in transactions if t.created_at is not None]
+        rates = iter(self._rate_history_repository.rates_at([t.created_at for t in dated]))
+
+        valuations = []
+        for transaction in transactions:
+            rate = next(rates) if transaction.created_at is not None else None
+            if rate is None:
+                valuations.append(TransactionValuation(transaction.id, None, None, None))
+                continue
+
+            usd_per_satoshi = rate / Decimal(SATOSHIS_PER_BTC)
+            valuations.append(TransactionValuation(
+                transaction_id=transaction.id,
+                rate=rate,
+                amount_usd=transaction.amount_satoshis * usd_per_satoshi,
+                fee_usd=transaction.fee_satoshis * usd_per_satoshi,
+            ))
+
+        return valuations
@@ -1,6 +1,12 @@
 from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
 
 from src.core.interfaces.transaction_repository import TransactionRepositoryInterface
+from src.core.interfaces.transaction_rollup_repository import TransactionRollupRepositoryInterface
+from src.core.interfaces.unit_of_work import UnitOfWorkInterface
+from src.core.models.transaction_rollup import RollupGranularity, TransactionRollup
+from src.core.timestamps import from_epoch_micros, to_epoch_micros
 
 
 @dataclass
@@ -9,12 +15,107 @@ class PlatformStatistics:
     platform_profit_satoshis: int
 
 
+@dataclass
+class PlatformStatisticsCheck:
+    stored: PlatformStatistics
+    actual: PlatformStatistics
+
+    @property
+    def is_consistent(self) -> bool:
+        return self.stored == self.actual
+
+
 class StatisticsService:
-    def __init__(self, transaction_repository: TransactionRepositoryInterface):
+    MAX_SERIES_POINTS = 10_000
+
+    def __init__(
+            self,
+            transaction_repository: TransactionRepositoryInterface,
+            uow: Optional[UnitOfWorkInterface] = None,
+            rollup_repository: Optional[TransactionRollupRepositoryInterface] = None
+    ):
         self._transaction_repository = transaction_repository
+        self._uow = uow
+        self._rollup_repository = rollup_repository
 
     def get_platform_statistics(self) -> PlatformStatistics:
         return PlatformStatistics(
             total_transactions=self._transaction_repository.count_all(),
             platform_profit_satoshis=self._transaction_repository.get_total_fees_collected()
-        )
\ No newline at end of file
+        )
+
+    def check_platform_statistics(self) -> PlatformStatisticsCheck:
+        """
+        Compare the maintained counters with a full scan of the ledger.
+        """
+        count, fees = self._transaction_repository.scan_platform_totals()
+        return PlatformStatisticsCheck(
+            stored=self.get_platform_statistics(),
+            actual=PlatformStatistics(total_transactions=count, platform_profit_satoshis=fees)
+        )
+
+    def rebuild_platform_statistics(self) -> PlatformStatistics:
+        if self._uow is None:
+            raise ValueError("Rebuilding statistics requires a unit of work")
+
+        self._transaction_repository.rebuild_platform_stats()
+        self._uow.commit()
+        return self.get_platform_statistics()
+
+    def get_transaction_time_series(
+            self,
+            start: datetime,
+            end: datetime,
+            granularity: RollupGranularity = RollupGranularity.HOUR
+    ) -> list[TransactionRollup]:
+        """
+        One bucket per hour or day from the bucket containing start up to end,
+        read from the rollup tables; buckets without transactions are zero.
+        """
+        if self._rollup_repository is None:
+            raise ValueError("Time series require a rollup repository")
+
+        first = granularity.floor(start)
+        end = from_epoch_micros(to_epoch_micros(end))
+        if end <= first:
+            raise ValueError("Time series end must be after start")
+        if (end - first) / granularity.step > self.MAX_SERIES_POINTS:
+            raise ValueError(f"Time series cannot exceed {self.MAX_SERIES_POINTS} points")
+
+        stored = {r.bucket_start: r for r in self._rollup_repository.get_rollups(granularity, first, end)}
+
+        series = []
+        bucket = first
+        while bucket < end:
+            series.append(stored.get(bucket) or TransactionRollup(bucket_start=bucket))
+            bucket += granularity.step
+        return series
+
+    def rebuild_transaction_rollups(self, chunk_days: int = 7) -> int:
+        """
+        Recompute the rollups from the transactions table, chunk_days at a time,
+        committing after each chunk so the write lock is released in between.
+        Returns the number of chunks processed.
+        """
+        if self._uow is None or self._rollup_repository is None:
+            raise ValueError("Rebuilding rollups requires a unit of work and a rollup repository")
+        if chunk_days < 1:
+            raise ValueError("Chunk size must be at least one day")
+
+        time_range = self._rollup_repository.transaction_time_range()
+        if time_range is None:
+            return 0
+
+        day = RollupGranularity.DAY
+        start = day.floor(time_range[0])
+        end = day.floor(time_range[1]) + day.step
+        chunks = 0
+
+        while start < end:
+            chunk_end = min(start + chunk_days * day.step, end)
+            self._rollup_repository.rebuild_range(start, chunk_end)
+            self._uow.commit()
+            start = chunk_end
+            chunks += 1
+
+        return chunks
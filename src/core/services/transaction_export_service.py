@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import Iterator, Optional
+
+from src.core.interfaces.transaction_repository import TransactionRepositoryInterface
+from src.core.interfaces.wallet_repository import WalletRepositoryInterface
+from src.core.models.transaction import Transaction, TransactionFilter
+from src.core.services.wallet_service import UnauthorizedWalletAccessError, WalletNotFoundError
+
+
+class TransactionExportService:
+    DEFAULT_BATCH_SIZE = 1000
+
+    def __init__(
+            self,
+            wallet_repository: WalletRepositoryInterface,
+            transaction_repository: TransactionRepositoryInterface,
+    ) -> None:
+        self._wallet_repository = wallet_repository
+        self._transaction_repository = transaction_repository
+
+    def iter_history(
+            self,
+            *,
+            user_id: str,
+            wallet_address: Optional[str] = None,
+            batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[Transaction]:
+        """
+        The user's full history, or one owned wallet's, oldest first.
+
+        Ownership is checked before returning, so errors surface before any
+        output is produced; the transactions themselves are read lazily,
+        batch_size rows at a time.
+        """
+        if wallet_address is None:
+            addresses = [wallet.address for wallet in self._wallet_repository.get_by_user_id(user_id)]
+        else:
+            wallet = self._wallet_repository.get_by_address(wallet_address)
+            if wallet is None:
+                raise WalletNotFoundError("Wallet not found")
+            if wallet.user_id != user_id:
+                raise UnauthorizedWalletAccessError("Unauthorized")
+            addresses = [wallet.address]
+
+        if not addresses:
+            return iter(())
+
+        return self._transaction_repository.iter_transactions(
+            TransactionFilter(wallet_addresses=addresses),
+            batch_size=batch_size,
+        )
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from src.core.interfaces.transaction_repository import TransactionRepositoryInterface
+from src.core.interfaces.unit_of_work import UnitOfWorkInterface
+from src.core.interfaces.wallet_repository import WalletRepositoryInterface
+from src.core.models.transaction import Transaction
+from src.core.services.wallet_service import UnauthorizedWalletAccessError, WalletNotFoundError
+
+
+class InsufficientFundsError(Exception):
+    pass
+
+
+class TransferService:
+    """
+    Moves satoshis between wallets in one short write transaction.
+
+    Balances are never read and written back: the sender is debited with a
+    conditional UPDATE whose affected row count tells whether the funds were
+    there, and the recipient is credited in place. The transaction row (and
+    with it the platform fee counters) is written before the single commit.
+    """
+
+    def __init__(
+            self,
+            uow: UnitOfWorkInterface,
+            wallet_repository: WalletRepositoryInterface,
+            transaction_repository: TransactionRepositoryInterface,
+    ) -> None:
+        self._uow = uow
+        self._wallet_repository = wallet_repository
+        self._transaction_repository = transaction_repository
+
+    def transfer(self, *, user_id: str, from_address: str, to_address: str, amount_satoshis: int) -> Transaction:
+        wallets = self._wallet_repository.get_many_by_addresses([from_address, to_address])
+
+        sender = wallets.get(from_address)
+        if sender is None:
+            raise WalletNotFoundError("Wallet not found")
+        if sender.user_id != user_id:
+            raise UnauthorizedWalletAccessError("Unauthorized")
+
+        recipient = wallets.get(to_address)
+        if recipient is None:
+            raise WalletNotFoundError("Recipient wallet not found")
+
+        transaction = Transaction.create(
+            from_wallet_address=from_address,
+            to_wallet_address=to_address,
+            amount_satoshis=amount_satoshis,
+            is_internal_transfer=recipient.user_id == sender.user_id,
+        )
+
+        try:
+            if not self._wallet_repository.debit(from_address, transaction.get_total_deducted()):
+                raise InsufficientFundsError("Insufficient balance")
+            if not self._wallet_repository.credit(to_address, transaction.get_recipient_amount()):
+                raise WalletNotFoundError("Recipient wallet not found")
+
+            self._transaction_repository.save(transaction)
+        except Exception:
+            self._uow.rollback()
+            raise
+
+        self._uow.commit()
+        return transaction
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Iterable, Optional
 
-from src.core.interfaces.wallet_repository import WalletRepositoryInterface
+from src.core.interfaces.wallet_adjustment_repository import WalletAdjustmentRepositoryInterface
+from src.core.interfaces.wallet_repository import StaleWalletError, WalletRepositoryInterface
 from src.core.models.wallet import Wallet
 
 from src.core.constants import MAX_WALLETS_PER_USER
@@ -28,9 +30,71 @@ class CreateWalletResult:
     balance_satoshis: int
 
 
+@dataclass(frozen=True, slots=True)
+class WalletUpdateStats:
+    updates: int
+    conflicts: int
+    retries: int
+    exhausted: int
+
+
+class WalletUpdateMetrics:
+    """
+    Counters for optimistic balance updates, shared by every WalletService.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._updates = 0
+        self._conflicts = 0
+        self._retries = 0
+        self._exhausted = 0
+
+    def record_update(self) -> None:
+        with self._lock:
+            self._updates += 1
+
+    def record_conflict(self, retrying: bool) -> None:
+        with self._lock:
+            self._conflicts += 1
+            if retrying:
+                self._retries += 1
+            else:
+                self._exhausted += 1
+
+    def stats(self) -> WalletUpdateStats:
+        with self._lock:
+            return WalletUpdateStats(
+                updates=self._updates,
+                conflicts=self._conflicts,
+                retries=self._retries,
+                exhausted=self._exhausted,
+            )
+
+
 class WalletService:
-    def __init__(self, wallet_repository: WalletRepositoryInterface) -> None:
+    DEFAULT_MAX_UPDATE_ATTEMPTS = 3
+
+    def __init__(
+            self,
+            wallet_repository: WalletRepositoryInterface,
+            adjustment_repository: WalletAdjustmentRepositoryInterface,
+            max_update_attempts: int = DEFAULT_MAX_UPDATE_ATTEMPTS,
+            metrics: Optional[WalletUpdateMetrics] = None,
+    ) -> None:
+        """
+        Deposits and withdrawals write no transaction row. They are added to
+        the wallet's adjustment total in the same transaction, which the
+        balance audit applies, so adjustment_repository must share the wallet
+        repository's session.
+        """
+        if max_update_attempts < 1:
+            raise ValueError("At least one update attempt is required")
+
         self._wallet_repository = wallet_repository
+        self._adjustment_repository = adjustment_repository
+        self._max_update_attempts = max_update_attempts
+        self.metrics = metrics or WalletUpdateMetrics()
 
     def create_wallet(self, user_id: str) -> CreateWalletResult:
         wallets = self._wallet_repository.get_by_user_id(user_id)
@@ -52,17 +116,49 @@ class WalletService:
     def get_wallet_by_address(self, *, user_id: str, address: str) -> Wallet:
         return self._get_owned_wallet(user_id=user_id, address=address)
 
+    def get_wallets_by_addresses(self, *, user_id: str, addresses: Iterable[str]) -> dict[str, Wallet]:
+        """
+        Bulk form of get_wallet_by_address: one repository call for the whole
+        set, failing if any address is unknown or owned by someone else.
+        """
+        addresses = list(dict.fromkeys(addresses))
+        wallets = self._wallet_repository.get_many_by_addresses(addresses)
+
+        if len(wallets) != len(addresses):
+            raise WalletNotFoundError("Wallet not found")
+        if any(wallet.user_id != user_id for wallet in wallets.values()):
+            raise UnauthorizedWalletAccessError("Unauthorized")
+
+        return wallets
+
     def deposit(self, *, user_id: str, address: str, amount_satoshis: int) -> Wallet:
-        wallet = self._get_owned_wallet(user_id=user_id, address=address)
-        wallet.deposit(amount_satoshis)
-        self._wallet_repository.update(wallet)
-        return wallet
+        return self._change_balance(user_id, address, lambda wallet: wallet.deposit(amount_satoshis))
 
     def withdraw(self, *, user_id: str, address: str, amount_satoshis: int) -> Wallet:
-        wallet = self._get_owned_wallet(user_id=user_id, address=address)
-        wallet.withdraw(amount_satoshis)
-        self._wallet_repository.update(wallet)
-        return wallet
+        return self._change_balance(user_id, address, lambda wallet: wallet.withdraw(amount_satoshis))
+
+    def _change_balance(self, user_id: str, address: str, change: Callable[[Wallet], None]) -> Wallet:
+        """
+        Read, change and compare-and-swap the wallet, re-reading on conflict
+        up to max_update_attempts times. The change is re-applied to the fresh
+        balance, so a withdrawal is re-checked against it.
+        """
+        for attempt in range(1, self._max_update_attempts + 1):
+            wallet = self._get_owned_wallet(user_id=user_id, address=address)
+            balance_before = wallet.balance_satoshis
+            change(wallet)
+            try:
+                self._wallet_repository.update(wallet)
+            except StaleWalletError:
+                retrying = attempt < self._max_update_attempts
+                self.metrics.record_conflict(retrying)
+                if not retrying:
+                    raise
+                continue
+
+            self._adjustment_repository.add(address, wallet.balance_satoshis - balance_before)
+            self.metrics.record_update()
+            return wallet
 
     def _get_owned_wallet(self, *, user_id: str, address: str) -> Wallet:
         wallet: Optional[Wallet] = self._wallet_repository.get_by_address(address)
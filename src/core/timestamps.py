@@ -0,0 +1,16 @@
+from datetime import datetime, timedelta, UTC
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def to_epoch_micros(value: datetime) -> int:
+    """
+    Naive datetimes are treated as UTC; SQLite hands them back without tzinfo.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+
+def from_epoch_micros(micros: int) -> datetime:
+    return EPOCH + timedelta(microseconds=micros)
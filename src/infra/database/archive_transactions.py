@@ -0,0 +1,71 @@
+"""
+Move old transactions from the live database into per-period archive files.
+
+    python -m src.infra.database.archive_transactions
+    python -m src.infra.database.archive_transactions --older-than-days 730 --max-chunks 10
+
+Only transactions already folded into the wallet checkpoints are moved, so
+verified balances never need to read the archives. Each chunk is its own
+short write transaction.
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timedelta, UTC
+from typing import Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from src.config import settings
+from src.core.timestamps import from_epoch_micros, to_epoch_micros
+from src.infra.database.init_db import engine, init_db
+from src.infra.database.transaction_archive import TransactionArchive, configured_archive
+from src.infra.repositories.wallet_checkpoint_repository import SQLAlchemyWalletCheckpointRepository
+
+
+def archive_transactions(
+        session: Session,
+        archive: TransactionArchive,
+        older_than: timedelta,
+        chunk_size: int,
+        max_chunks: Optional[int] = None,
+) -> int:
+    checkpointed = SQLAlchemyWalletCheckpointRepository(session).latest_cursor()
+    if checkpointed is None:
+        return 0
+
+    created_before = min(datetime.now(UTC) - older_than, from_epoch_micros(to_epoch_micros(checkpointed.created_at)))
+    moved = chunks = 0
+
+    while max_chunks is None or chunks < max_chunks:
+        count = archive.move_chunk(session, created_before, chunk_size)
+        if count == 0:
+            break
+
+        session.commit()
+        moved += count
+        chunks += 1
+
+    return moved
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--older-than-days", type=int, default=settings.TRANSACTION_ARCHIVE_AFTER_DAYS)
+    parser.add_argument("--chunk-size", type=int, default=settings.TRANSACTION_ARCHIVE_CHUNK_SIZE)
+    parser.add_argument("--max-chunks", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    init_db()
+    archive = configured_archive()
+    with Session(bind=engine) as session:
+        moved = archive_transactions(
+            session, archive, timedelta(days=args.older_than_days), args.chunk_size, args.max_chunks
+        )
+
+    print(f"archived {moved} transactions")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()
@@ -20,17 +20,73 @@ class WalletModel(Base):
     address = Column(String, nullable=False, unique=True, index=True)
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
     balance_satoshi = Column(Integer, nullable=False)
+    version = Column(Integer, nullable=False, default=0, server_default="0")
 
     user = relationship("UserModel", back_populates="wallets")
 
 
 class TransactionModel(Base):
     __tablename__ = "transactions"
+    __table_args__ = (
+        Index("idx_transactions_from_wallet_created", "from_wallet_address", "created_at", "id"),
+        Index("idx_transactions_to_wallet_created", "to_wallet_address", "created_at", "id"),
+        Index("idx_transactions_created_id", "created_at", "id"),
+    )
 
     id = Column(String, primary_key=True)
-    from_wallet_address = Column(String, ForeignKey("wallets.address"), nullable=False, index=True)
-    to_wallet_address = Column(String, ForeignKey("wallets.address"), nullable=False, index=True)
+    from_wallet_address = Column(String, ForeignKey("wallets.address"), nullable=False)
+    to_wallet_address = Column(String, ForeignKey("wallets.address"), nullable=False)
     amount_satoshis = Column(Integer, nullable=False)
     fee_satoshis = Column(Integer, nullable=False)
     is_internal_transfer = Column(Boolean, nullable=False, default=False)
-    created_at = Column(DateTime, nullable=False)
\ No newline at end of file
+    created_at = Column(DateTime, nullable=False)
+
+class RateHistoryModel(Base):
+    __tablename__ = "btc_usd_rate_history"
+
+    # Integer primary key is SQLite's rowid, so rows are stored in time order.
+    fetched_at_us = Column(Integer, primary_key=True, autoincrement=False)
+    rate_e8 = Column(Integer, nullable=False)
+    source = Column(String, nullable=False)
+
+class PlatformStatsModel(Base):
+    __tablename__ = "platform_stats"
+
+    # Single aggregate row, kept in step with every transaction insert.
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    transaction_count = Column(Integer, nullable=False, default=0)
+    total_fees_satoshis = Column(Integer, nullable=False, default=0)
+
+class WalletCheckpointModel(Base):
+    __tablename__ = "wallet_checkpoints"
+    __table_args__ = (
+        Index("idx_wallet_checkpoints_position", "last_created_at", "last_transaction_id"),
+    )
+
+    # Balance after applying every transaction up to (last_created_at, last_transaction_id).
+    wallet_address = Column(String, ForeignKey("wallets.address"), primary_key=True)
+    balance_satoshis = Column(Integer, nullable=False)
+    last_created_at = Column(DateTime, nullable=False)
+    last_transaction_id = Column(String, nullable=False)
+
+class WalletAdjustmentModel(Base):
+    __tablename__ = "wallet_adjustments"
+
+    # Net deposits minus withdrawals: balance changes with no transaction row.
+    wallet_address = Column(String, ForeignKey("wallets.address"), primary_key=True)
+    adjustment_satoshis = Column(Integer, nullable=False, default=0)
+
+class _RollupColumns:
+    # Bucket start in UTC epoch microseconds, aligned to the table's granularity.
+    bucket_start_us = Column(Integer, primary_key=True, autoincrement=False)
+    transaction_count = Column(Integer, nullable=False, default=0)
+    internal_count = Column(Integer, nullable=False, default=0)
+    volume_satoshis = Column(Integer, nullable=False, default=0)
+    internal_volume_satoshis = Column(Integer, nullable=False, default=0)
+    fees_satoshis = Column(Integer, nullable=False, default=0)
+
+class HourlyTransactionRollupModel(_RollupColumns, Base):
+    __tablename__ = "transaction_rollups_hourly"
+
+class DailyTransactionRollupModel(_RollupColumns, Base):
+    __tablename__ = "transaction_rollups_daily"
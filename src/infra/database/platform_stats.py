@@ -0,0 +1,54 @@
+"""
+Check or rebuild the platform_stats aggregate row and the transaction rollups.
+
+    python -m src.infra.database.platform_stats            # exit 1 on drift
+    python -m src.infra.database.platform_stats --rebuild
+    python -m src.infra.database.platform_stats --rebuild-rollups
+
+Both read the archived transactions as well as the live table.
+"""
+from __future__ import annotations
+
+import argparse
+from typing import Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from src.core.services.statistics_service import StatisticsService
+from src.infra.database.init_db import engine, init_db
+from src.infra.database.sqlalchemy_uow import SQLAlchemyUnitOfWork
+from src.infra.database.transaction_archive import configured_archive
+from src.infra.repositories.transaction_repository import SQLAlchemyTransactionRepository
+from src.infra.repositories.transaction_rollup_repository import SQLAlchemyTransactionRollupRepository
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rebuild", action="store_true", help="recompute the counters from the transactions table")
+    parser.add_argument("--rebuild-rollups", action="store_true", help="recompute the hourly and daily rollups")
+    args = parser.parse_args(argv)
+
+    init_db()
+    archive = configured_archive()
+    with Session(bind=engine) as session:
+        service = StatisticsService(
+            SQLAlchemyTransactionRepository(session, archive=archive),
+            SQLAlchemyUnitOfWork(session),
+            SQLAlchemyTransactionRollupRepository(session, archive=archive),
+        )
+
+        if args.rebuild_rollups:
+            chunks = service.rebuild_transaction_rollups()
+            print(f"rebuilt rollups in {chunks} chunks")
+
+        if args.rebuild:
+            service.rebuild_platform_statistics()
+
+        check = service.check_platform_statistics()
+        print(f"stored: {check.stored}")
+        print(f"actual: {check.actual}")
+        return 0 if check.is_consistent else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
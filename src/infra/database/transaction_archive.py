@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import Column, Index, MetaData, Table, select
+from sqlalchemy.orm import Session
+
+from src.config import settings
+from src.infra.database.models import TransactionModel
+
+
+class TransactionArchiveError(Exception):
+    pass
+
+
+class TransactionArchive:
+    """
+    Old transactions, moved out of the live database into one SQLite file per
+    period (transactions_2024.db, or transactions_2024_06.db by month) and read
+    back by ATTACHing the files to the session's connection.
+
+    Attachments are made lazily and remembered per DBAPI connection. SQLite
+    refuses ATTACH inside an open write transaction, so a session that has
+    already written cannot read an archive its connection has not attached
+    yet and gets a TransactionArchiveError instead of a partial history.
+    SQLite also caps attached databases (10 by default): prefer yearly files.
+    """
+    PERIOD_FORMATS = {"year": "%Y", "month": "%Y_%m"}
+    FILE_PREFIX = "transactions_"
+    _INFO_KEY = "transaction_archives"
+
+    def __init__(self, directory: Path, period: str = "year") -> None:
+        if period not in self.PERIOD_FORMATS:
+            raise ValueError(f"Archive period must be one of {', '.join(self.PERIOD_FORMATS)}")
+
+        self._directory = directory
+        self._format = self.PERIOD_FORMATS[period]
+        self._tables: dict[str, Table] = {}
+        self._listing: tuple[int, list[str]] = (-1, [])
+
+    def period_key(self, at: datetime) -> str:
+        return at.strftime(self._format)
+
+    def path_for(self, key: str) -> Path:
+        return self._directory / f"{self.FILE_PREFIX}{key}.db"
+
+    def keys(self) -> list[str]:
+        """
+        Periods with an archive file, newest first. The directory is only
+        rescanned when its mtime changes.
+        """
+        try:
+            mtime = os.stat(self._directory).st_mtime_ns
+        except FileNotFoundError:
+            return []
+
+        if mtime != self._listing[0]:
+            keys = sorted(
+                (path.stem[len(self.FILE_PREFIX):] for path in self._directory.glob(f"{self.FILE_PREFIX}*.db")),
+                reverse=True,
+            )
+            self._listing = (mtime, keys)
+        return self._listing[1]
+
+    def sources(self, session: Session) -> list[Table]:
+        """
+        The live transactions table followed by every attached archive table.
+        """
+        attached = self._attach(session, self.keys())
+        return [TransactionModel.__table__, *(self._table(key) for key in self.keys() if key in attached)]
+
+    def move_chunk(self, session: Session, created_before: datetime, chunk_size: int) -> int:
+        """
+        Move up to chunk_size of the oldest transactions created before
+        created_before into their period files. Rows are copied with INSERT OR
+        IGNORE before being deleted, so a chunk interrupted between the two
+        steps is finished by the next run. The caller commits.
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be positive")
+
+        live = TransactionModel.__table__
+        rows = session.execute(
+            select(live.c.id, live.c.created_at)
+            .where(live.c.created_at < created_before)
+            .order_by(live.c.created_at, live.c.id)
+            .limit(chunk_size)
+        ).all()
+        if not rows:
+            return 0
+
+        ids_by_key: dict[str, list[str]] = defaultdict(list)
+        for row in rows:
+            ids_by_key[self.period_key(row.created_at)].append(row.id)
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        missing = set(ids_by_key) - self._attach(session, list(ids_by_key))
+        if missing:
+            raise TransactionArchiveError(f"Archive files for {', '.join(sorted(missing))} could not be attached")
+
+        connection = session.connection()
+        for key, ids in ids_by_key.items():
+            archive = self._table(key)
+            archive.create(connection, checkfirst=True)
+            session.execute(
+                archive.insert().prefix_with("OR IGNORE").from_select(
+                    [c.name for c in live.columns],
+                    select(*live.columns).where(live.c.id.in_(ids)),
+                )
+            )
+            session.execute(live.delete().where(live.c.id.in_(ids)))
+
+        return len(rows)
+
+    def _attach(self, session: Session, keys: list[str]) -> set[str]:
+        connection = session.connection()
+        attached: set[str] = connection.info.setdefault(self._INFO_KEY, set())
+
+        missing = [key for key in keys if key not in attached]
+        if not missing:
+            return attached
+
+        dbapi_connection = connection.connection.dbapi_connection
+        if dbapi_connection.in_transaction:
+            raise TransactionArchiveError(
+                f"Archive files for {', '.join(sorted(missing))} cannot be attached inside a write transaction"
+            )
+
+        limit = dbapi_connection.getlimit(sqlite3.SQLITE_LIMIT_ATTACHED)
+        if len(attached) + len(missing) > limit:
+            raise TransactionArchiveError(
+                f"{len(attached) + len(missing)} archive files exceed SQLite's limit of {limit} attached databases"
+            )
+
+        for key in missing:
+            connection.exec_driver_sql(f'ATTACH DATABASE ? AS "{self._schema(key)}"', (str(self.path_for(key)),))
+            attached.add(key)
+        return attached
+
+    def _table(self, key: str) -> Table:
+        table = self._tables.get(key)
+        if table is None:
+            # Same columns and indexes as the live table, without the foreign
+            # keys: the wallets they point at live in the main database.
+            live = TransactionModel.__table__
+            table = Table(
+                live.name,
+                MetaData(),
+                *(Column(c.name, c.type, primary_key=c.primary_key, nullable=c.nullable) for c in live.columns),
+                *(Index(index.name, *(c.name for c in index.columns)) for index in live.indexes),
+                schema=self._schema(key),
+            )
+            self._tables[key] = table
+        return table
+
+    @staticmethod
+    def _schema(key: str) -> str:
+        return f"archive_{key}"
+
+
+def configured_archive() -> TransactionArchive:
+    return TransactionArchive(settings.TRANSACTION_ARCHIVE_DIR, settings.TRANSACTION_ARCHIVE_PERIOD)
+
+
+def archive_sources(session: Session, archive: Optional[TransactionArchive]) -> list[Table]:
+    return archive.sources(session) if archive is not None else [TransactionModel.__table__]
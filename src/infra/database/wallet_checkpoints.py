@@ -0,0 +1,50 @@
+"""
+Advance the wallet balance checkpoints, or audit one wallet against them.
+
+    python -m src.infra.database.wallet_checkpoints                     # run periodically
+    python -m src.infra.database.wallet_checkpoints --audit <address>   # exit 1 on drift
+"""
+from __future__ import annotations
+
+import argparse
+from typing import Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from src.core.services.balance_audit_service import BalanceAuditService
+from src.infra.database.init_db import engine, init_db
+from src.infra.database.sqlalchemy_uow import SQLAlchemyUnitOfWork
+from src.infra.repositories.wallet_adjustment_repository import SQLAlchemyWalletAdjustmentRepository
+from src.infra.repositories.wallet_checkpoint_repository import SQLAlchemyWalletCheckpointRepository
+from src.infra.repositories.wallet_repository import SQLAlchemyWalletRepository
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--audit", metavar="ADDRESS", help="compare one wallet's stored and verified balance")
+    parser.add_argument("--batch-size", type=int, default=BalanceAuditService.DEFAULT_BATCH_SIZE)
+    parser.add_argument("--max-batches", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    init_db()
+    with Session(bind=engine) as session:
+        service = BalanceAuditService(
+            SQLAlchemyUnitOfWork(session),
+            SQLAlchemyWalletRepository(session),
+            SQLAlchemyWalletCheckpointRepository(session),
+            SQLAlchemyWalletAdjustmentRepository(session),
+        )
+
+        if args.audit:
+            audit = service.audit_wallet(args.audit)
+            print(f"stored:   {audit.stored_satoshis}")
+            print(f"verified: {audit.verified_satoshis}")
+            return 0 if audit.is_consistent else 1
+
+        applied = service.advance_checkpoints(batch_size=args.batch_size, max_batches=args.max_batches)
+        print(f"applied {applied} transactions")
+        return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import statistics
+import time
+from collections import deque
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Callable, Optional, Sequence
+
+import httpx
+
+from src.core.interfaces.exchange_rate import ExchangeRateError
+from src.core.models.exchange_rate import BASE_CURRENCY, RateSnapshot, parse_rate, parse_rate_table
+from src.core.services.exchange_rate_service import BaseAsyncExchangeRateService
+
+
+@dataclass(frozen=True, slots=True)
+class RateSource:
+    """
+    An upstream BTC/USD endpoint.
+
+    rate_path walks the JSON response down to the USD rate,
+    e.g. ("data", "rates", "USD") for Coinbase. Sources that also return a
+    full currency table set table_path to it.
+    """
+    name: str
+    url: str
+    rate_path: tuple[str | int, ...]
+    table_path: Optional[tuple[str | int, ...]] = None
+
+    def parse_rate(self, payload) -> Decimal:
+        return parse_rate(_walk(payload, self.rate_path))
+
+    def parse_table(self, payload) -> dict[str, Decimal]:
+        if self.table_path is None:
+            return {}
+        return parse_rate_table(_walk(payload, self.table_path))
+
+
+def _walk(payload, path: tuple[str | int, ...]):
+    value = payload
+    for key in path:
+        value = value[key]
+    return value
+
+
+DEFAULT_SOURCES: tuple[RateSource, ...] = (
+    RateSource(
+        name="coinbase",
+        url="https://api.coinbase.com/v2/exchange-rates?currency=BTC",
+        rate_path=("data", "rates", "USD"),
+        table_path=("data", "rates"),
+    ),
+    RateSource(
+        name="kraken",
+        url="https://api.kraken.com/0/public/Ticker?pair=XBTUSD",
+        rate_path=("result", "XXBTZUSD", "c", 0),
+    ),
+    RateSource(
+        name="bitstamp",
+        url="https://www.bitstamp.net/api/v2/ticker/btcusd/",
+        rate_path=("last",),
+    ),
+)
+
+
+class LatencyWindow:
+    """
+    Latencies observed for one source over the last window_seconds.
+    """
+
+    def __init__(self, window_seconds: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self._window_seconds = window_seconds
+        self._clock = clock
+        self._samples: deque[tuple[float, float]] = deque()
+
+    def record(self, latency_seconds: float) -> None:
+        self._samples.append((self._clock(), latency_seconds))
+        self._prune()
+
+    def __len__(self) -> int:
+        self._prune()
+        return len(self._samples)
+
+    def p95(self) -> Optional[float]:
+        self._prune()
+        if not self._samples:
+            return None
+
+        latencies = sorted(latency for _, latency in self._samples)
+        return latencies[math.ceil(0.95 * len(latencies)) - 1]
+
+    def _prune(self) -> None:
+        cutoff = self._clock() - self._window_seconds
+        while self._samples and self._samples[0][0] < cutoff:
+            self._samples.popleft()
+
+
+class AggregatedExchangeRateClient(BaseAsyncExchangeRateService):
+    """
+    Asks several sources for the rate and answers within a latency budget.
+
+    - `quorum` sources are queried at once (fastest recent p95 first); every
+      hedge_delay_seconds without enough answers, one more source is added.
+    - As soon as `quorum` answers arrive their median is returned, so
+      quorum=1 means "first answer wins".
+    - When the budget runs out, the median of whatever arrived is returned,
+      or ExchangeRateError if nothing did.
+    - Failures and budget overruns count as infinitely slow, so a source whose
+      recent p95 exceeds max_p95_seconds is skipped until its samples age out
+      of the window.
+    - Every other currency in the snapshot's table is likewise the median
+      over the answering sources whose table lists it.
+    """
+    DEFAULT_LATENCY_BUDGET_SECONDS = 1.0
+    DEFAULT_HEDGE_DELAY_SECONDS = 0.15
+    DEFAULT_WINDOW_SECONDS = 60.0
+    MIN_SAMPLES = 5
+
+    def __init__(
+            self,
+            client: httpx.AsyncClient,
+            sources: Sequence[RateSource] = DEFAULT_SOURCES,
+            *,
+            quorum: int = 1,
+            hedge_delay_seconds: float = DEFAULT_HEDGE_DELAY_SECONDS,
+            latency_budget_seconds: float = DEFAULT_LATENCY_BUDGET_SECONDS,
+            max_p95_seconds: Optional[float] = None,
+            window_seconds: float = DEFAULT_WINDOW_SECONDS,
+            clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not sources:
+            raise ValueError("At least one rate source is required")
+        if not 1 <= quorum <= len(sources):
+            raise ValueError("Quorum must be between 1 and the number of sources")
+        if latency_budget_seconds <= 0:
+            raise ValueError("Latency budget must be positive")
+
+        self._client = client
+        self._sources = list(sources)
+        self._quorum = quorum
+        self._hedge_delay_seconds = hedge_delay_seconds
+        self._latency_budget_seconds = latency_budget_seconds
+        self._max_p95_seconds = max_p95_seconds if max_p95_seconds is not None else latency_budget_seconds
+        self._clock = clock
+        self._latencies = {source.name: LatencyWindow(window_seconds, clock) for source in self._sources}
+
+    def source_p95(self) -> dict[str, Optional[float]]:
+        return {name: window.p95() for name, window in self._latencies.items()}
+
+    def healthy_sources(self) -> list[RateSource]:
+        healthy = []
+        for source in self._sources:
+            window = self._latencies[source.name]
+            p95 = window.p95()
+            if len(window) >= self.MIN_SAMPLES and p95 is not None and p95 > self._max_p95_seconds:
+                continue
+            healthy.append(source)
+
+        if len(healthy) < self._quorum:
+            # Fail open: a degraded answer beats no answer.
+            healthy = list(self._sources)
+
+        # Sources without samples sort first so they get measured.
+        return sorted(healthy, key=lambda s: self._latencies[s.name].p95() or 0.0)
+
+    async def get_btc_to_usd_rate(self) -> Decimal:
+        return (await self.get_rate_snapshot()).rate
+
+    async def get_rate_snapshot(self) -> RateSnapshot:
+        candidates = self.healthy_sources()
+        deadline = self._clock() + self._latency_budget_seconds
+
+        pending: dict[asyncio.Task, RateSource] = {}
+        answers: list[tuple[RateSource, Decimal, dict[str, Decimal]]] = []
+        errors: list[str] = []
+
+        def launch(source: RateSource) -> None:
+            pending[asyncio.create_task(self._fetch(source))] = source
+
+        for _ in range(self._quorum):
+            launch(candidates.pop(0))
+        next_hedge_at = self._clock() + self._hedge_delay_seconds
+
+        try:
+            while len(answers) < self._quorum:
+                now = self._clock()
+                if now >= deadline:
+                    break
+
+                if candidates and now >= next_hedge_at:
+                    launch(candidates.pop(0))
+                    next_hedge_at = now + self._hedge_delay_seconds
+
+                if not pending:
+                    if not candidates:
+                        break
+                    next_hedge_at = now
+                    continue
+
+                wake_at = min(deadline, next_hedge_at) if candidates else deadline
+                done, _ = await asyncio.wait(
+                    pending.keys(),
+                    timeout=max(0.0, wake_at - now),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    source = pending.pop(task)
+                    try:
+                        answers.append((source, *task.result()))
+                    except ExchangeRateError as e:
+                        errors.append(f"{source.name}: {e}")
+                        # A failed source frees a slot; hedge right away.
+                        next_hedge_at = self._clock()
+        finally:
+            for task, source in pending.items():
+                task.cancel()
+                if self._clock() >= deadline:
+                    self._latencies[source.name].record(math.inf)
+
+        if not answers:
+            raise ExchangeRateError(
+                f"No BTC rate within {self._latency_budget_seconds}s budget: {'; '.join(errors) or 'timed out'}"
+            )
+
+        rate = Decimal(statistics.median(rate for _, rate, _ in answers))
+        source = "+".join(sorted(s.name for s, _, _ in answers))
+        return RateSnapshot.now(rate=rate, source=source, rates=self._median_table(answers, rate))
+
+    @staticmethod
+    def _median_table(
+            answers: list[tuple[RateSource, Decimal, dict[str, Decimal]]], rate: Decimal
+    ) -> dict[str, Decimal]:
+        quotes: dict[str, list[Decimal]] = {}
+        for _, _, table in answers:
+            for currency, value in table.items():
+                quotes.setdefault(currency, []).append(value)
+
+        table = {currency: Decimal(statistics.median(values)) for currency, values in quotes.items()}
+        if table:
+            table[BASE_CURRENCY] = rate
+        return table
+
+    async def _fetch(self, source: RateSource) -> tuple[Decimal, dict[str, Decimal]]:
+        started = self._clock()
+        try:
+            response = await self._client.get(source.url, timeout=self._latency_budget_seconds)
+            response.raise_for_status()
+            payload = response.json()
+            rate = source.parse_rate(payload)
+            table = source.parse_table(payload)
+        except (httpx.HTTPError, KeyError, IndexError, ValueError, TypeError, ArithmeticError) as e:
+            self._latencies[source.name].record(math.inf)
+            raise ExchangeRateError(f"Failed to fetch BTC rate: {str(e)}")
+
+        self._latencies[source.name].record(self._clock() - started)
+        return rate, table
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import importlib.util
+from decimal import Decimal
+
+import httpx
+
+from src.core.interfaces.exchange_rate import ExchangeRateError
+from src.core.models.exchange_rate import RateSnapshot
+from src.core.services.exchange_rate_service import BaseAsyncExchangeRateService
+
+
+def http2_available() -> bool:
+    """
+    httpx only speaks HTTP/2 when the optional `h2` package is installed.
+    """
+    return importlib.util.find_spec("h2") is not None
+
+
+def create_http_client(
+        *,
+        timeout_seconds: float = 5.0,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        keepalive_expiry_seconds: float = 30.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+) -> httpx.AsyncClient:
+    """
+    Build the long-lived, connection-pooled client shared by all requests.
+
+    The caller owns the client and must close it (see create_app's lifespan).
+    """
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry_seconds,
+    )
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(timeout_seconds),
+        limits=limits,
+        http2=transport is None and http2_available(),
+        transport=transport,
+    )
+
+
+class HttpxExchangeRateClient(BaseAsyncExchangeRateService):
+    API_URL = "https://api.coinbase.com/v2/exchange-rates?currency=BTC"
+
+    def __init__(self, client: httpx.AsyncClient, api_url: str = API_URL) -> None:
+        self._client = client
+        self._api_url = api_url
+
+    async def get_btc_to_usd_rate(self) -> Decimal:
+        return (await self.get_rate_snapshot()).rate
+
+    async def get_rate_snapshot(self) -> RateSnapshot:
+        try:
+            response = await self._client.get(self._api_url)
+            response.raise_for_status()
+            data = response.json()
+
+            return RateSnapshot.from_rate_table(data['data']['rates'], source="coinbase")
+
+        except (httpx.HTTPError, KeyError, ValueError, TypeError, AttributeError) as e:
+            raise ExchangeRateError(f"Failed to fetch BTC rate: {str(e)}")
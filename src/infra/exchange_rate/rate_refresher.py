@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, UTC
+from decimal import Decimal
+from typing import Optional
+
+from src.core.interfaces.exchange_rate import AsyncExchangeRateInterface, ExchangeRateError
+from src.core.interfaces.rate_history_repository import RateHistoryRepositoryInterface
+from src.core.models.exchange_rate import RateSnapshot
+from src.core.services.exchange_rate_service import BaseExchangeRateService
+
+logger = logging.getLogger(__name__)
+
+
+class RateRefresher(BaseExchangeRateService):
+    """
+    Polls an async rate source on a fixed interval and publishes the result.
+
+    The latest RateSnapshot is swapped in as a single attribute assignment, so
+    readers never lock and never wait on the upstream API: they see either the
+    previous snapshot or the new one.
+    """
+    DEFAULT_INTERVAL_SECONDS = 15.0
+    DEFAULT_MAX_STALENESS_SECONDS = 300.0
+
+    def __init__(
+            self,
+            source: AsyncExchangeRateInterface,
+            interval_seconds: float = DEFAULT_INTERVAL_SECONDS,
+            max_staleness_seconds: float = DEFAULT_MAX_STALENESS_SECONDS,
+            history: Optional[RateHistoryRepositoryInterface] = None,
+    ) -> None:
+        if interval_seconds <= 0:
+            raise ValueError("Refresh interval must be positive")
+
+        self._source = source
+        self._interval_seconds = interval_seconds
+        self._max_staleness_seconds = max_staleness_seconds
+        self._history = history
+        self._task: Optional[asyncio.Task] = None
+
+        self.snapshot: Optional[RateSnapshot] = None
+
+    @property
+    def is_ready(self) -> bool:
+        """
+        A snapshot has been fetched and is not past max_staleness_seconds.
+        """
+        snapshot = self.snapshot
+        return snapshot is not None and self._age_seconds(snapshot) <= self._max_staleness_seconds
+
+    def get_btc_to_usd_rate(self) -> Decimal:
+        return self.get_rate_snapshot().rate
+
+    def get_rate_snapshot(self) -> RateSnapshot:
+        snapshot = self.snapshot
+        if snapshot is None:
+            raise ExchangeRateError("BTC rate is not available yet")
+
+        age = self._age_seconds(snapshot)
+        if age > self._max_staleness_seconds:
+            raise ExchangeRateError(f"BTC rate is {age:.0f}s old")
+
+        return snapshot
+
+    async def refresh_once(self) -> RateSnapshot:
+        snapshot = await self._source.get_rate_snapshot()
+        self.snapshot = snapshot
+        if self._history is not None:
+            # The history may be a database write; keep it off the event loop.
+            await asyncio.to_thread(self._history.record, snapshot)
+        return snapshot
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="exchange-rate-refresher")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh_once()
+            except ExchangeRateError as e:
+                # Readers keep the previous snapshot until it passes max staleness.
+                logger.warning("Exchange rate refresh failed: %s", e)
+            except Exception:
+                # Anything else (a bad payload, the history store) must not end
+                # the task: nothing would refresh the snapshot again.
+                logger.exception("Exchange rate refresh failed unexpectedly")
+
+            await asyncio.sleep(self._interval_seconds)
+
+    @staticmethod
+    def _age_seconds(snapshot: RateSnapshot) -> float:
+        return (datetime.now(UTC) - snapshot.fetched_at).total_seconds()
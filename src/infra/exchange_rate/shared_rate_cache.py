@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import fcntl
+import mmap
+import os
+import struct
+from datetime import datetime, UTC
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable, Optional
+
+from src.core.interfaces.exchange_rate import AsyncExchangeRateInterface, ExchangeRateInterface, ExchangeRateError
+from src.core.models.exchange_rate import RateSnapshot
+from src.core.services.exchange_rate_service import BaseAsyncExchangeRateService, BaseExchangeRateService
+from src.core.timestamps import from_epoch_micros, to_epoch_micros
+from src.infra.database.connection import ensure_parent_dir
+from src.infra.repositories.rate_history_repository import rate_to_scaled, scaled_to_rate
+
+
+class SharedRateFile:
+    """
+    A rate snapshot and its currency table in a memory-mapped file, shared by
+    every worker.
+
+    Layout (little-endian, 16 KiB):
+      0   u64  sequence, odd while a write is in progress
+      8   i64  fetched_at, epoch microseconds
+      16  i64  rate * 10^8
+      24  u8   source length
+      25  39s  source, utf-8
+      64  u16  currency table entries
+      72  entries of (8s currency code, i64 rate * 10^8)
+
+    Seqlock protocol: the single writer bumps the sequence to odd, writes the
+    payload, then bumps it to even. Readers copy out of the mapping and retry
+    when the sequence was odd or changed underneath them; a reader whose last
+    sequence is still current reuses the snapshot it parsed then. A sequence
+    that stays odd for MAX_READ_ATTEMPTS reads as no snapshot.
+
+    Currencies with codes longer than 8 bytes, non-finite rates, rates beyond
+    the i64 range or past MAX_TABLE_ENTRIES are not stored, and rates keep 8
+    decimals. write() returns the snapshot as stored so the writer serves what
+    readers see.
+    """
+    SIZE = 16 * 1024
+    _SEQUENCE = struct.Struct("<Q")
+    _PAYLOAD = struct.Struct("<qqB39s")
+    _PAYLOAD_OFFSET = 8
+    _TABLE_COUNT = struct.Struct("<H")
+    _TABLE_COUNT_OFFSET = 64
+    _ENTRY = struct.Struct("<8sq")
+    _TABLE_OFFSET = 72
+    MAX_TABLE_ENTRIES = (SIZE - _TABLE_OFFSET) // _ENTRY.size
+    MAX_READ_ATTEMPTS = 1000
+
+    def __init__(self, path: Path) -> None:
+        ensure_parent_dir(path)
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        if os.fstat(self._fd).st_size < self.SIZE:
+            os.ftruncate(self._fd, self.SIZE)
+        self._map = mmap.mmap(self._fd, self.SIZE)
+        self._last: tuple[int, Optional[RateSnapshot]] = (0, None)
+
+    def read(self) -> Optional[RateSnapshot]:
+        before = 0
+        for _ in range(self.MAX_READ_ATTEMPTS):
+            before = self._SEQUENCE.unpack_from(self._map, 0)[0]
+            if before & 1:
+                os.sched_yield()
+                continue
+            if before == self._last[0]:
+                return self._last[1]
+
+            fetched_at_us, rate_e8, source_len, source = self._PAYLOAD.unpack_from(self._map, self._PAYLOAD_OFFSET)
+            count = min(self._TABLE_COUNT.unpack_from(self._map, self._TABLE_COUNT_OFFSET)[0], self.MAX_TABLE_ENTRIES)
+            entries = self._map[self._TABLE_OFFSET:self._TABLE_OFFSET + count * self._ENTRY.size]
+
+            if self._SEQUENCE.unpack_from(self._map, 0)[0] != before:
+                continue
+
+            snapshot = RateSnapshot(
+                rate=scaled_to_rate(rate_e8),
+                fetched_at=from_epoch_micros(fetched_at_us),
+                source=source[:source_len].decode("utf-8", errors="replace"),
+                rates={
+                    code.rstrip(b"\0").decode("ascii"): scaled_to_rate(scaled)
+                    for code, scaled in self._ENTRY.iter_unpack(entries)
+                },
+            )
+            self._last = (before, snapshot)
+            return snapshot
+
+        if before & 1:
+            # Still odd after the whole budget: the writer died mid-write. Report
+            # no snapshot so the next lease holder rewrites the file.
+            return None
+        raise ExchangeRateError("Shared rate file is being rewritten continuously")
+
+    def write(self, snapshot: RateSnapshot) -> RateSnapshot:
+        """
+        Only the elected writer may call this.
+        """
+        source = snapshot.source.encode("utf-8")[:39]
+        rate_e8 = rate_to_scaled(snapshot.rate)
+        table = self._storable_table(snapshot)
+
+        sequence = self._SEQUENCE.unpack_from(self._map, 0)[0]
+        if sequence & 1:
+            # A previous writer died mid-write; start from a consistent even value.
+            sequence += 1
+
+        self._SEQUENCE.pack_into(self._map, 0, sequence + 1)
+        self._PAYLOAD.pack_into(
+            self._map,
+            self._PAYLOAD_OFFSET,
+            to_epoch_micros(snapshot.fetched_at),
+            rate_e8,
+            len(source),
+            source,
+        )
+        self._TABLE_COUNT.pack_into(self._map, self._TABLE_COUNT_OFFSET, len(table))
+        for index, (code, scaled) in enumerate(table):
+            self._ENTRY.pack_into(self._map, self._TABLE_OFFSET + index * self._ENTRY.size, code, scaled)
+        self._SEQUENCE.pack_into(self._map, 0, sequence + 2)
+
+        stored = RateSnapshot(
+            rate=scaled_to_rate(rate_e8),
+            fetched_at=from_epoch_micros(to_epoch_micros(snapshot.fetched_at)),
+            source=source.decode("utf-8", errors="replace"),
+            rates={code.decode("ascii"): scaled_to_rate(scaled) for code, scaled in table},
+        )
+        self._last = (sequence + 2, stored)
+        return stored
+
+    def _storable_table(self, snapshot: RateSnapshot) -> list[tuple[bytes, int]]:
+        table = []
+        for currency in sorted(snapshot.rates):
+            code = currency.encode("ascii", errors="ignore")
+            if not snapshot.rates[currency].is_finite():
+                continue
+            scaled = rate_to_scaled(snapshot.rates[currency])
+            if code and len(code) <= 8 and code.decode("ascii") == currency and -2 ** 63 <= scaled < 2 ** 63:
+                table.append((code, scaled))
+        return table[:self.MAX_TABLE_ENTRIES]
+
+    def close(self) -> None:
+        self._map.close()
+        os.close(self._fd)
+
+
+class WriterLease:
+    """
+    Elects the one process that refreshes the shared file.
+
+    An exclusive flock on a sidecar file; the kernel drops it when the holder
+    exits, so the next worker to try takes over.
+    """
+
+    def __init__(self, path: Path) -> None:
+        ensure_parent_dir(path)
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        self.held = False
+
+    def try_acquire(self) -> bool:
+        if self.held:
+            return True
+
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+
+        self.held = True
+        return True
+
+    def close(self) -> None:
+        if self.held:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            self.held = False
+        os.close(self._fd)
+
+
+class _SharedRatePublisher:
+    """
+    The read / elect / publish decisions shared by the sync and async services.
+    """
+    DEFAULT_TTL_SECONDS = 30.0
+    DEFAULT_MAX_STALENESS_SECONDS = 300.0
+
+    def __init__(
+            self,
+            path: Path,
+            ttl_seconds: float,
+            max_staleness_seconds: float,
+            clock: Callable[[], datetime],
+    ) -> None:
+        if max_staleness_seconds < ttl_seconds:
+            raise ValueError("Max staleness cannot be shorter than TTL")
+
+        self._ttl_seconds = ttl_seconds
+        self._max_staleness_seconds = max_staleness_seconds
+        self._clock = clock
+        self._file = SharedRateFile(path)
+        self._lease = WriterLease(path.with_name(path.name + ".lock"))
+
+    @property
+    def is_writer(self) -> bool:
+        return self._lease.held
+
+    def close(self) -> None:
+        self._lease.close()
+        self._file.close()
+
+    def _read_shared(self) -> tuple[Optional[RateSnapshot], Optional[float]]:
+        snapshot = self._file.read()
+        if snapshot is None:
+            return None, None
+        return snapshot, (self._clock() - snapshot.fetched_at).total_seconds()
+
+    def _is_fresh(self, age: Optional[float]) -> bool:
+        return age is not None and age <= self._ttl_seconds
+
+    def _is_usable(self, age: Optional[float]) -> bool:
+        return age is not None and age <= self._max_staleness_seconds
+
+    def _serve_shared(self, snapshot: Optional[RateSnapshot], age: Optional[float]) -> RateSnapshot:
+        if age is None:
+            raise ExchangeRateError("Shared BTC rate is not available yet")
+        if age > self._max_staleness_seconds:
+            raise ExchangeRateError(f"Shared BTC rate is {age:.0f}s old")
+
+        return snapshot
+
+
+class SharedMemoryExchangeRateService(_SharedRatePublisher, BaseExchangeRateService):
+    """
+    Serves the rate from a file shared by all workers.
+
+    - Fresh snapshots (younger than ttl_seconds) are returned directly.
+    - Otherwise the elected writer fetches from the provider and publishes.
+      The other workers keep serving the stale snapshot until
+      max_staleness_seconds, then raise ExchangeRateError.
+    - The currency table is shared along with the USD rate, so every worker
+      converts to the same currencies at the same rates.
+    """
+
+    def __init__(
+            self,
+            provider: ExchangeRateInterface,
+            path: Path,
+            ttl_seconds: float = _SharedRatePublisher.DEFAULT_TTL_SECONDS,
+            max_staleness_seconds: float = _SharedRatePublisher.DEFAULT_MAX_STALENESS_SECONDS,
+            clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        super().__init__(path, ttl_seconds, max_staleness_seconds, clock)
+        self._provider = provider
+
+    def get_btc_to_usd_rate(self) -> Decimal:
+        return self.get_rate_snapshot().rate
+
+    def get_rate_snapshot(self) -> RateSnapshot:
+        snapshot, age = self._read_shared()
+        if self._is_fresh(age):
+            return snapshot
+        if not self._lease.try_acquire():
+            return self._serve_shared(snapshot, age)
+
+        try:
+            fetched = self._provider.get_rate_snapshot()
+        except ExchangeRateError:
+            if not self._is_usable(age):
+                raise
+            return snapshot
+
+        return self._file.write(fetched)
+
+
+class AsyncSharedMemoryExchangeRateClient(_SharedRatePublisher, BaseAsyncExchangeRateService):
+    """
+    The async counterpart of SharedMemoryExchangeRateService, for the app's
+    RateRefresher: only the lease holder calls the upstream client, every
+    other worker's refresher picks up what it published.
+    """
+
+    def __init__(
+            self,
+            client: AsyncExchangeRateInterface,
+            path: Path,
+            ttl_seconds: float = _SharedRatePublisher.DEFAULT_TTL_SECONDS,
+            max_staleness_seconds: float = _SharedRatePublisher.DEFAULT_MAX_STALENESS_SECONDS,
+            clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        super().__init__(path, ttl_seconds, max_staleness_seconds, clock)
+        self._client = client
+
+    async def get_btc_to_usd_rate(self) -> Decimal:
+        return (await self.get_rate_snapshot()).rate
+
+    async def get_rate_snapshot(self) -> RateSnapshot:
+        snapshot, age = self._read_shared()
+        if self._is_fresh(age):
+            return snapshot
+        if not self._lease.try_acquire():
+            return self._serve_shared(snapshot, age)
+
+        try:
+            fetched = await self._client.get_rate_snapshot()
+        except ExchangeRateError:
+            if not self._is_usable(age):
+                raise
+            return snapshot
+
+        return self._file.write(fetched)
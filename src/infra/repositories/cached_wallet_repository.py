@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Callable, Iterable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.core.interfaces.wallet_repository import WalletRepositoryInterface
+from src.core.models.wallet import Wallet
+
+
+@dataclass(frozen=True, slots=True)
+class WalletCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    rejected_stale_writes: int
+    size: int
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    wallet: Optional[Wallet]  # None marks an invalidated address
+    version: int
+    stored_at: float
+
+
+class WalletCache:
+    """
+    Process-wide LRU of wallets by address, shared by every request's
+    CachedWalletRepository.
+
+    Each invalidation bumps a global version and stamps it on the address
+    (an entry without a wallet keeps the stamp). A reader takes begin()
+    before going to the database and its put() is dropped if the address was
+    invalidated since, so a slow read cannot put back a balance that a
+    concurrent write has already replaced. Stamps evicted from the LRU raise
+    a floor that every later put() is also checked against.
+    """
+    DEFAULT_MAX_ENTRIES = 10_000
+    DEFAULT_TTL_SECONDS = 5.0
+
+    def __init__(
+            self,
+            max_entries: int = DEFAULT_MAX_ENTRIES,
+            ttl_seconds: float = DEFAULT_TTL_SECONDS,
+            clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("Cache size must be positive")
+        if ttl_seconds <= 0:
+            raise ValueError("TTL must be positive")
+
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = 0
+        self._evicted_version = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._rejected_stale_writes = 0
+
+    def get(self, address: str) -> Optional[Wallet]:
+        with self._lock:
+            entry = self._entries.get(address)
+            if entry is None or entry.wallet is None or self._clock() - entry.stored_at > self._ttl_seconds:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(address)
+            self._hits += 1
+            return replace(entry.wallet)
+
+    def begin(self) -> int:
+        with self._lock:
+            return self._version
+
+    def put(self, wallet: Wallet, read_version: int) -> bool:
+        with self._lock:
+            entry = self._entries.get(wallet.address)
+            invalidated_at = entry.version if entry is not None else self._evicted_version
+            if invalidated_at > read_version:
+                self._rejected_stale_writes += 1
+                return False
+
+            self._entries[wallet.address] = _CacheEntry(
+                wallet=replace(wallet),
+                version=entry.version if entry is not None else 0,
+                stored_at=self._clock(),
+            )
+            self._entries.move_to_end(wallet.address)
+            self._evict()
+            return True
+
+    def invalidate(self, address: str) -> None:
+        with self._lock:
+            self._version += 1
+            self._invalidations += 1
+            self._entries[address] = _CacheEntry(wallet=None, version=self._version, stored_at=self._clock())
+            self._entries.move_to_end(address)
+            self._evict()
+
+    def stats(self) -> WalletCacheStats:
+        with self._lock:
+            return WalletCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                rejected_stale_writes=self._rejected_stale_writes,
+                size=sum(1 for entry in self._entries.values() if entry.wallet is not None),
+            )
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._max_entries:
+            _, entry = self._entries.popitem(last=False)
+            self._evicted_version = max(self._evicted_version, entry.version)
+            if entry.wallet is not None:
+                self._evictions += 1
+
+
+class CachedWalletRepository(WalletRepositoryInterface):
+    """
+    Serves get_by_address from a shared WalletCache; everything else goes to
+    the wrapped repository.
+
+    Writes invalidate the address right away and again once the session
+    commits or rolls back, since another request may have cached the old row
+    in between. Until then this repository reads its own pending addresses
+    from the database so it sees its own writes.
+    """
+
+    def __init__(self, repository: WalletRepositoryInterface, cache: WalletCache) -> None:
+        self._repository = repository
+        self._cache = cache
+        self._pending: set[str] = set()
+
+    def bind_to_session(self, session: Session) -> CachedWalletRepository:
+        event.listen(session, "after_commit", lambda _: self.end_transaction())
+        event.listen(session, "after_rollback", lambda _: self.end_transaction())
+        return self
+
+    def end_transaction(self) -> None:
+        for address in self._pending:
+            self._cache.invalidate(address)
+        self._pending.clear()
+
+    def save(self, wallet: Wallet):
+        self._repository.save(wallet)
+        self._written(wallet.address)
+
+    def get_by_id(self, id: str) -> Optional[Wallet]:
+        return self._repository.get_by_id(id)
+
+    def get_by_address(self, address: str) -> Optional[Wallet]:
+        if address in self._pending:
+            return self._repository.get_by_address(address)
+
+        wallet = self._cache.get(address)
+        if wallet is not None:
+            return wallet
+
+        read_version = self._cache.begin()
+        wallet = self._repository.get_by_address(address)
+        if wallet is not None:
+            self._cache.put(wallet, read_version)
+        return wallet
+
+    def get_many_by_addresses(self, addresses: Iterable[str]) -> dict[str, Wallet]:
+        wallets: dict[str, Wallet] = {}
+        missing = []
+        for address in dict.fromkeys(addresses):
+            wallet = None if address in self._pending else self._cache.get(address)
+            if wallet is None:
+                missing.append(address)
+            else:
+                wallets[address] = wallet
+
+        if missing:
+            read_version = self._cache.begin()
+            found = self._repository.get_many_by_addresses(missing)
+            for address, wallet in found.items():
+                if address not in self._pending:
+                    self._cache.put(wallet, read_version)
+            wallets.update(found)
+
+        return wallets
+
+    def get_by_user_id(self, user_id: str) -> list[Wallet]:
+        return self._repository.get_by_user_id(user_id)
+
+    def update(self, wallet: Wallet):
+        try:
+            self._repository.update(wallet)
+        finally:
+            # Also on StaleWalletError: the cached copy is the one that lost.
+            self._written(wallet.address)
+
+    def debit(self, address: str, amount_satoshis: int) -> bool:
+        debited = self._repository.debit(address, amount_satoshis)
+        self._written(address)
+        return debited
+
+    def credit(self, address: str, amount_satoshis: int) -> bool:
+        credited = self._repository.credit(address, amount_satoshis)
+        self._written(address)
+        return credited
+
+    def _written(self, address: str) -> None:
+        self._pending.add(address)
+        self._cache.invalidate(address)
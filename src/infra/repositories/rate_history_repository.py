@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from datetime import datetime
+from decimal import Decimal, ROUND_HALF_EVEN
+from typing import Callable, Optional, Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from src.core.interfaces.rate_history_repository import RateHistoryRepositoryInterface
+from src.core.models.exchange_rate import RateSnapshot
+from src.core.timestamps import to_epoch_micros
+from src.infra.database.models import RateHistoryModel
+
+RATE_SCALE_EXPONENT = 8
+
+
+def rate_to_scaled(rate: Decimal) -> int:
+    return int(rate.scaleb(RATE_SCALE_EXPONENT).to_integral_value(rounding=ROUND_HALF_EVEN))
+
+
+def scaled_to_rate(scaled: int) -> Decimal:
+    return Decimal(scaled).scaleb(-RATE_SCALE_EXPONENT)
+
+
+def _lookup(timestamps: Sequence[int], rates: Sequence[int], at_us: int) -> Optional[Decimal]:
+    index = bisect_right(timestamps, at_us) - 1
+    return scaled_to_rate(rates[index]) if index >= 0 else None
+
+
+class InMemoryRateHistoryRepository(RateHistoryRepositoryInterface):
+    """
+    Two parallel int64 arrays (epoch micros, rate * 10^8) kept sorted by time:
+    16 bytes per sample and an O(log n) bisect per lookup.
+    """
+
+    def __init__(self) -> None:
+        self._timestamps = array("q")
+        self._rates = array("q")
+
+    def record(self, snapshot: RateSnapshot) -> None:
+        at_us = to_epoch_micros(snapshot.fetched_at)
+        rate = rate_to_scaled(snapshot.rate)
+
+        if not self._timestamps or at_us >= self._timestamps[-1]:
+            self._timestamps.append(at_us)
+            self._rates.append(rate)
+            return
+
+        # Late arrivals are rare; keep both arrays aligned and sorted.
+        index = bisect_right(self._timestamps, at_us)
+        self._timestamps.insert(index, at_us)
+        self._rates.insert(index, rate)
+
+    def rate_at(self, at: datetime) -> Optional[Decimal]:
+        return _lookup(self._timestamps, self._rates, to_epoch_micros(at))
+
+    def rates_at(self, times: Sequence[datetime]) -> list[Optional[Decimal]]:
+        return [_lookup(self._timestamps, self._rates, to_epoch_micros(t)) for t in times]
+
+    def count(self) -> int:
+        return len(self._timestamps)
+
+
+class SQLAlchemyRateHistoryRepository(RateHistoryRepositoryInterface):
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def record(self, snapshot: RateSnapshot) -> None:
+        statement = insert(RateHistoryModel).values(
+            fetched_at_us=to_epoch_micros(snapshot.fetched_at),
+            rate_e8=rate_to_scaled(snapshot.rate),
+            source=snapshot.source,
+        ).on_conflict_do_nothing(index_elements=[RateHistoryModel.fetched_at_us])
+        self._session.execute(statement) #Service layer will handle session commits
+
+    def rate_at(self, at: datetime) -> Optional[Decimal]:
+        scaled = self._session.execute(
+            select(RateHistoryModel.rate_e8)
+            .where(RateHistoryModel.fetched_at_us <= to_epoch_micros(at))
+            .order_by(RateHistoryModel.fetched_at_us.desc())
+            .limit(1)
+        ).scalar()
+        return scaled_to_rate(scaled) if scaled is not None else None
+
+    def rates_at(self, times: Sequence[datetime]) -> list[Optional[Decimal]]:
+        if not times:
+            return []
+
+        micros = [to_epoch_micros(t) for t in times]
+        earliest, latest = min(micros), max(micros)
+
+        # One range scan covers every lookup: the last sample before the earliest
+        # time plus everything up to the latest one.
+        floor = self._session.execute(
+            select(RateHistoryModel.fetched_at_us)
+            .where(RateHistoryModel.fetched_at_us <= earliest)
+            .order_by(RateHistoryModel.fetched_at_us.desc())
+            .limit(1)
+        ).scalar()
+
+        rows = self._session.execute(
+            select(RateHistoryModel.fetched_at_us, RateHistoryModel.rate_e8)
+            .where(
+                RateHistoryModel.fetched_at_us >= (floor if floor is not None else earliest),
+                RateHistoryModel.fetched_at_us <= latest,
+            )
+            .order_by(RateHistoryModel.fetched_at_us)
+        ).all()
+
+        timestamps = array("q", (row[0] for row in rows))
+        rates = array("q", (row[1] for row in rows))
+        return [_lookup(timestamps, rates, at_us) for at_us in micros]
+
+    def count(self) -> int:
+        return self._session.execute(select(func.count()).select_from(RateHistoryModel)).scalar_one()
+
+
+class SessionPerCallRateHistoryRepository(RateHistoryRepositoryInterface):
+    """
+    For long-lived owners such as the RateRefresher: every call runs on its
+    own short session, and a recorded sample is committed straight away.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session]) -> None:
+        self._session_factory = session_factory
+
+    def record(self, snapshot: RateSnapshot) -> None:
+        with self._session_factory() as session:
+            SQLAlchemyRateHistoryRepository(session).record(snapshot)
+            session.commit()
+
+    def rate_at(self, at: datetime) -> Optional[Decimal]:
+        with self._session_factory() as session:
+            return SQLAlchemyRateHistoryRepository(session).rate_at(at)
+
+    def rates_at(self, times: Sequence[datetime]) -> list[Optional[Decimal]]:
+        with self._session_factory() as session:
+            return SQLAlchemyRateHistoryRepository(session).rates_at(times)
+
+    def count(self) -> int:
+        with self._session_factory() as session:
+            return SQLAlchemyRateHistoryRepository(session).count()
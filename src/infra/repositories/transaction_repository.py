@@ -1,70 +1,322 @@
-from typing import Optional
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional, Sequence
 from sqlalchemy.orm import Session
-from sqlalchemy import func, or_, desc
+from sqlalchemy import ColumnElement, Row, Select, Table, and_, func, desc, select, true, tuple_, union_all, update
+from sqlalchemy.dialects.sqlite import insert
 from src.core.interfaces.transaction_repository import TransactionRepositoryInterface
-from src.core.models.transaction import Transaction
-from src.infra.database.models import TransactionModel
+from src.core.models.transaction import Transaction, TransactionCursor, TransactionFilter, TransactionPage
+from src.infra.database.models import PlatformStatsModel, TransactionModel
+from src.infra.database.transaction_archive import TransactionArchive, archive_sources
+from src.infra.repositories.transaction_rollup_repository import SQLAlchemyTransactionRollupRepository
 
 
 class SQLAlchemyTransactionRepository(TransactionRepositoryInterface):
-    def __init__(self, session: Session) -> None:
+    MAX_PAGE_SIZE = 200
+    MAX_MERGED_WALLETS = 100
+    PLATFORM_STATS_ID = 1
+    BULK_INSERT_CHUNK_SIZE = 5000
+    COLUMNS = (
+        TransactionModel.id,
+        TransactionModel.from_wallet_address,
+        TransactionModel.to_wallet_address,
+        TransactionModel.amount_satoshis,
+        TransactionModel.fee_satoshis,
+        TransactionModel.is_internal_transfer,
+        TransactionModel.created_at,
+    )
+
+    def __init__(
+            self,
+            session: Session,
+            core_reads: bool = False,
+            archive: Optional[TransactionArchive] = None,
+    ) -> None:
+        """
+        With core_reads, queries map select() rows straight to domain objects
+        instead of hydrating ORM instances into the identity map first.
+        With an archive, reads also cover the attached archive files; writes
+        always go to the live table.
+        """
         self._session = session
+        self._core_reads = core_reads
+        self._archive = archive
+        self._rollups = SQLAlchemyTransactionRollupRepository(session, archive)
 
     def save(self, transaction: Transaction) -> None:
         model = self._to_db_model(transaction)
         self._session.add(model) #Service layer will handle session commits
+        self._add_to_platform_stats(count=1, fees=transaction.fee_satoshis)
+        self._rollups.add([transaction])
+
+    def save_many(self, transactions: Iterable[Transaction]) -> None:
+        """
+        Bulk insert through Core: one executemany per chunk of rows, no ORM
+        objects or identity map bookkeeping, and the platform_stats and rollup
+        updates are applied once per chunk.
+        """
+        statement = TransactionModel.__table__.insert()
+        iterator = iter(transactions)
+        count = fees = 0
+
+        while chunk := list(islice(iterator, self.BULK_INSERT_CHUNK_SIZE)):
+            self._session.execute(statement, [self._to_row(t) for t in chunk])
+            self._rollups.add(chunk)
+            count += len(chunk)
+            fees += sum(t.fee_satoshis for t in chunk)
+
+        if count:
+            self._add_to_platform_stats(count=count, fees=fees)
 
     def get_by_id(self, transaction_id: str) -> Optional[Transaction]:
-        model = (
-            self._session.query(TransactionModel)
-            .filter_by(id=transaction_id)
-            .first()
-        )
-        return self._to_domain(model) if model else None
+        branches = [select(*self._columns(t)).where(t.c.id == transaction_id) for t in self._sources()]
+        statement = branches[0] if len(branches) == 1 else union_all(*branches)
+        found = self._fetch(statement.limit(1))
+        return found[0] if found else None
 
     def get_by_wallet_address(self, wallet_address: str) -> list[Transaction]:
-        models = (
-            self._session.query(TransactionModel)
-            .filter(
-                or_(
-                    TransactionModel.from_wallet_address == wallet_address,
-                    TransactionModel.to_wallet_address == wallet_address
-                )
-            )
-            .order_by(desc(TransactionModel.created_at))
-            .all()
-        )
-        return [self._to_domain(m) for m in models]
+        return self._load_history([wallet_address])
 
     def get_by_user_wallets(self, wallet_addresses: list[str]) -> list[Transaction]:
         if not wallet_addresses:
             return []
 
-        models = (
-            self._session.query(TransactionModel)
-            .filter(
-                or_(
-                    TransactionModel.from_wallet_address.in_(wallet_addresses),
-                    TransactionModel.to_wallet_address.in_(wallet_addresses)
-                )
+        return self._load_history(wallet_addresses)
+
+    def get_page_by_wallet_address(
+            self, wallet_address: str, limit: int = 50, cursor: Optional[str] = None
+    ) -> TransactionPage:
+        return self._page([wallet_address], limit, cursor)
+
+    def get_page_by_user_wallets(
+            self, wallet_addresses: list[str], limit: int = 50, cursor: Optional[str] = None
+    ) -> TransactionPage:
+        if not wallet_addresses:
+            self._validate_limit(limit)
+            return TransactionPage(transactions=[])
+
+        return self._page(wallet_addresses, limit, cursor)
+
+    def iter_transactions(
+            self, transaction_filter: Optional[TransactionFilter] = None, batch_size: int = 1000
+    ) -> Iterator[Transaction]:
+        """
+        Stream matching transactions oldest first, batch_size rows at a time.
+
+        Each batch is its own keyset query seeking past the last (created_at,
+        id) yielded, built from the same index-ordered branches as the wallet
+        history, and is read to the end before anything is yielded. No
+        statement stays open between batches, so a slow consumer never holds
+        SQLite's read lock against writers, and the first batch costs the
+        same as any other however long the history is. Rows map straight to
+        domain objects, so no identity map grows with the table.
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be positive")
+
+        f = transaction_filter or TransactionFilter()
+        if f.wallet_addresses is not None and not f.wallet_addresses:
+            return
+
+        conditions = []
+        if f.created_from is not None:
+            conditions.append(lambda table: table.c.created_at >= f.created_from)
+        if f.created_before is not None:
+            conditions.append(lambda table: table.c.created_at < f.created_before)
+        if f.is_internal_transfer is not None:
+            conditions.append(lambda table: table.c.is_internal_transfer == f.is_internal_transfer)
+
+        position = None
+        while True:
+            branches = self._history_branches(f.wallet_addresses, position, newest_first=False, conditions=conditions)
+            statement = branches[0] if len(branches) == 1 else union_all(*branches)
+            statement = statement.order_by(statement.selected_columns.created_at, statement.selected_columns.id)
+
+            batch = [self._to_domain(row) for row in self._session.execute(statement.limit(batch_size))]
+            yield from batch
+            if len(batch) < batch_size:
+                return
+            position = TransactionCursor.after(batch[-1])
+
+    def get_total_fees_collected(self) -> int:
+        return self._platform_stats()[1]
+
+    def count_all(self) -> int:
+        return self._platform_stats()[0]
+
+    def scan_platform_totals(self) -> tuple[int, int]:
+        count = fees = 0
+        for table in self._sources():
+            table_count, table_fees = self._session.execute(
+                select(func.count(table.c.id), func.coalesce(func.sum(table.c.fee_satoshis), 0))
+            ).one()
+            count += table_count
+            fees += table_fees
+        return count, fees
+
+    def rebuild_platform_stats(self) -> None:
+        count, fees = self.scan_platform_totals()
+        statement = insert(PlatformStatsModel).values(
+            id=self.PLATFORM_STATS_ID,
+            transaction_count=count,
+            total_fees_satoshis=fees,
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[PlatformStatsModel.id],
+            set_={
+                "transaction_count": statement.excluded.transaction_count,
+                "total_fees_satoshis": statement.excluded.total_fees_satoshis,
+            },
+        )
+        self._session.execute(statement)
+
+    def _platform_stats(self) -> tuple[int, int]:
+        row = self._session.execute(
+            select(PlatformStatsModel.transaction_count, PlatformStatsModel.total_fees_satoshis)
+            .where(PlatformStatsModel.id == self.PLATFORM_STATS_ID)
+        ).first()
+        # Only migration 007 seeds the row; a database built by create_all has
+        # none until the first write, so count the ledger instead of saying 0.
+        return (row.transaction_count, row.total_fees_satoshis) if row else self.scan_platform_totals()
+
+    def _add_to_platform_stats(self, count: int, fees: int) -> None:
+        """
+        Runs in the caller's transaction, so the aggregate commits or rolls
+        back together with the rows it counts. A missing row is seeded from a
+        full scan, which already includes the rows just written.
+        """
+        result = self._session.execute(
+            update(PlatformStatsModel)
+            .where(PlatformStatsModel.id == self.PLATFORM_STATS_ID)
+            .values(
+                transaction_count=PlatformStatsModel.transaction_count + count,
+                total_fees_satoshis=PlatformStatsModel.total_fees_satoshis + fees,
             )
-            .order_by(desc(TransactionModel.created_at))
-            .all()
         )
-        return [self._to_domain(m) for m in models]
+        if result.rowcount == 0:
+            self._session.flush()
+            self.rebuild_platform_stats()
 
-    def get_total_fees_collected(self) -> int:
-        result = (
-            self._session.query(func.sum(TransactionModel.fee_satoshis))
-            .scalar()
+    def _page(self, wallet_addresses: list[str], limit: int, cursor: Optional[str]) -> TransactionPage:
+        """
+        Keyset pagination, newest first: seek past the cursor's (created_at, id)
+        instead of using OFFSET, so every page costs the same however deep it is.
+        """
+        self._validate_limit(limit)
+        position = TransactionCursor.decode(cursor) if cursor is not None else None
+
+        found = self._load_history(wallet_addresses, position, limit + 1)
+
+        transactions = found[:limit]
+        next_cursor = TransactionCursor.after(transactions[-1]).encode() if len(found) > limit else None
+        return TransactionPage(transactions=transactions, next_cursor=next_cursor)
+
+    def _load_history(
+            self,
+            wallet_addresses: list[str],
+            position: Optional[TransactionCursor] = None,
+            limit: Optional[int] = None,
+    ) -> list[Transaction]:
+        history = union_all(*self._history_branches(wallet_addresses, position, newest_first=True))
+        history = history.order_by(
+            desc(history.selected_columns.created_at),
+            desc(history.selected_columns.id)
         )
-        return result or 0
+        if limit is not None:
+            history = history.limit(limit)
 
-    def count_all(self) -> int:
-        return self._session.query(TransactionModel).count()
+        return self._fetch(history)
+
+    def _history_branches(
+            self,
+            wallet_addresses: Optional[list[str]],
+            position: Optional[TransactionCursor],
+            newest_first: bool,
+            conditions: Sequence[Callable[[Table], ColumnElement]] = (),
+    ) -> list[Select]:
+        """
+        History as branches for a UNION ALL that each walk one (wallet,
+        created_at, id) index in order, so SQLite merges them instead of
+        sorting. An OR filter would read both indexes and then sort every
+        matching row in a temp B-tree.
+
+        Each wallet gets a sender and a recipient branch; the recipient
+        branches skip rows whose sender is also in the set, so transfers
+        between the caller's own wallets appear once. Without wallets, each
+        table gets one branch over its (created_at, id) index. Archive tables
+        get the same branches as the live one; conditions add per-table
+        filters to every branch.
+        """
+        sources = self._sources()
+        branches = []
+
+        def branch(table: Table, condition) -> Select:
+            return self._history_branch(
+                table,
+                and_(condition, *(c(table) for c in conditions)),
+                position,
+                newest_first,
+            )
+
+        if wallet_addresses is None:
+            return [branch(table, true()) for table in sources]
+
+        addresses = list(dict.fromkeys(wallet_addresses))
+        for table in sources:
+            if len(addresses) * len(sources) <= self.MAX_MERGED_WALLETS:
+                for address in addresses:
+                    branches.append(branch(table, table.c.from_wallet_address == address))
+                    branches.append(branch(
+                        table,
+                        and_(
+                            table.c.to_wallet_address == address,
+                            table.c.from_wallet_address.not_in(addresses)
+                        )
+                    ))
+            else:
+                # SQLite caps compound SELECTs at 500 terms; past that, correctness
+                # over a sort-free plan.
+                branches.append(branch(table, table.c.from_wallet_address.in_(addresses)))
+                branches.append(branch(
+                    table,
+                    and_(
+                        table.c.to_wallet_address.in_(addresses),
+                        table.c.from_wallet_address.not_in(addresses)
+                    )
+                ))
+
+        return branches
+
+    def _fetch(self, statement) -> list[Transaction]:
+        if self._core_reads:
+            return [self._to_domain(row) for row in self._session.execute(statement)]
+
+        models = self._session.scalars(select(TransactionModel).from_statement(statement))
+        return [self._to_domain(m) for m in models]
+
+    def _sources(self) -> list[Table]:
+        return archive_sources(self._session, self._archive)
+
+    @classmethod
+    def _columns(cls, table: Table) -> list:
+        return [table.c[column.key] for column in cls.COLUMNS]
+
+    @classmethod
+    def _history_branch(
+            cls, table: Table, condition, position: Optional[TransactionCursor], newest_first: bool = True
+    ) -> Select:
+        branch = select(*cls._columns(table)).where(condition)
+        if position is not None:
+            key = tuple_(table.c.created_at, table.c.id)
+            after = tuple_(position.created_at, position.id)
+            branch = branch.where(key < after if newest_first else key > after)
+        return branch
+
+    def _validate_limit(self, limit: int) -> None:
+        if not 1 <= limit <= self.MAX_PAGE_SIZE:
+            raise ValueError(f"Page size must be between 1 and {self.MAX_PAGE_SIZE}")
 
     @staticmethod
-    def _to_domain(model: TransactionModel) -> Transaction:
+    def _to_domain(model: TransactionModel | Row) -> Transaction:
         return Transaction(
             id=model.id,
             from_wallet_address=model.from_wallet_address,
@@ -75,6 +327,18 @@ class SQLAlchemyTransactionRepository(TransactionRepositoryInterface):
             created_at=model.created_at
         )
 
+    @staticmethod
+    def _to_row(transaction: Transaction) -> dict:
+        return {
+            "id": transaction.id,
+            "from_wallet_address": transaction.from_wallet_address,
+            "to_wallet_address": transaction.to_wallet_address,
+            "amount_satoshis": transaction.amount_satoshis,
+            "fee_satoshis": transaction.fee_satoshis,
+            "is_internal_transfer": transaction.is_internal_transfer,
+            "created_at": transaction.created_at,
+        }
+
     @staticmethod
     def _to_db_model(transaction: Transaction) -> TransactionModel:
         return TransactionModel(
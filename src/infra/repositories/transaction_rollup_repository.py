@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import Integer, case, cast, delete, func, select, union_all
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from src.core.interfaces.transaction_rollup_repository import TransactionRollupRepositoryInterface
+from src.core.models.transaction import Transaction
+from src.core.models.transaction_rollup import RollupGranularity, TransactionRollup
+from src.core.timestamps import from_epoch_micros, to_epoch_micros
+from src.infra.database.models import DailyTransactionRollupModel, HourlyTransactionRollupModel
+from src.infra.database.transaction_archive import TransactionArchive, archive_sources
+
+ROLLUP_MODELS = {
+    RollupGranularity.HOUR: HourlyTransactionRollupModel,
+    RollupGranularity.DAY: DailyTransactionRollupModel,
+}
+
+_COUNTERS = ("transaction_count", "internal_count", "volume_satoshis", "internal_volume_satoshis", "fees_satoshis")
+
+
+class SQLAlchemyTransactionRollupRepository(TransactionRollupRepositoryInterface):
+    def __init__(self, session: Session, archive: Optional[TransactionArchive] = None) -> None:
+        self._session = session
+        self._archive = archive
+
+    def add(self, transactions: Iterable[Transaction]) -> None:
+        """
+        Fold transactions into their hourly and daily buckets: one upsert per
+        touched bucket, in the caller's transaction.
+        """
+        buckets: dict[RollupGranularity, dict[int, dict]] = {g: {} for g in ROLLUP_MODELS}
+
+        for transaction in transactions:
+            at_us = to_epoch_micros(transaction.created_at)
+            internal = transaction.is_internal_transfer
+            for granularity, rows in buckets.items():
+                bucket_us = granularity.floor_micros(at_us)
+                row = rows.get(bucket_us)
+                if row is None:
+                    row = rows[bucket_us] = dict.fromkeys(_COUNTERS, 0) | {"bucket_start_us": bucket_us}
+                row["transaction_count"] += 1
+                row["internal_count"] += int(internal)
+                row["volume_satoshis"] += transaction.amount_satoshis
+                row["internal_volume_satoshis"] += transaction.amount_satoshis if internal else 0
+                row["fees_satoshis"] += transaction.fee_satoshis
+
+        for granularity, rows in buckets.items():
+            if not rows:
+                continue
+
+            model = ROLLUP_MODELS[granularity]
+            statement = insert(model)
+            statement = statement.on_conflict_do_update(
+                index_elements=[model.bucket_start_us],
+                set_={name: getattr(model, name) + getattr(statement.excluded, name) for name in _COUNTERS},
+            )
+            self._session.execute(statement, list(rows.values()))
+
+    def get_rollups(self, granularity: RollupGranularity, start: datetime, end: datetime) -> list[TransactionRollup]:
+        model = ROLLUP_MODELS[granularity]
+        rows = self._session.execute(
+            select(model.bucket_start_us, *(getattr(model, name) for name in _COUNTERS))
+            .where(
+                model.bucket_start_us >= granularity.floor_micros(to_epoch_micros(start)),
+                model.bucket_start_us < to_epoch_micros(end),
+            )
+            .order_by(model.bucket_start_us)
+        )
+        return [
+            TransactionRollup(
+                bucket_start=from_epoch_micros(row.bucket_start_us),
+                **{name: getattr(row, name) for name in _COUNTERS}
+            )
+            for row in rows
+        ]
+
+    def rebuild_range(self, start: datetime, end: datetime) -> None:
+        start_us, end_us = to_epoch_micros(start), to_epoch_micros(end)
+        if RollupGranularity.DAY.floor_micros(start_us) != start_us or RollupGranularity.DAY.floor_micros(end_us) != end_us:
+            raise ValueError("Rollup rebuild range must start and end on day boundaries")
+
+        branches = [
+            select(t.c.created_at, t.c.is_internal_transfer, t.c.amount_satoshis, t.c.fee_satoshis)
+            .where(t.c.created_at >= start, t.c.created_at < end)
+            for t in archive_sources(self._session, self._archive)
+        ]
+        transactions = (branches[0] if len(branches) == 1 else union_all(*branches)).subquery()
+
+        epoch_seconds = cast(func.strftime("%s", transactions.c.created_at), Integer)
+        internal = transactions.c.is_internal_transfer
+
+        for granularity, model in ROLLUP_MODELS.items():
+            step_seconds = granularity.step_micros // 1_000_000
+            bucket = (epoch_seconds // step_seconds * step_seconds * 1_000_000).label("bucket_start_us")
+
+            self._session.execute(
+                delete(model).where(model.bucket_start_us >= start_us, model.bucket_start_us < end_us)
+            )
+            self._session.execute(
+                insert(model).from_select(
+                    ["bucket_start_us", *_COUNTERS],
+                    select(
+                        bucket,
+                        func.count(),
+                        func.sum(case((internal, 1), else_=0)),
+                        func.sum(transactions.c.amount_satoshis),
+                        func.sum(case((internal, transactions.c.amount_satoshis), else_=0)),
+                        func.sum(transactions.c.fee_satoshis),
+                    )
+                    .group_by(bucket)
+                )
+            )
+
+    def transaction_time_range(self) -> Optional[tuple[datetime, datetime]]:
+        ranges = [
+            self._session.execute(select(func.min(t.c.created_at), func.max(t.c.created_at))).one()
+            for t in archive_sources(self._session, self._archive)
+        ]
+        ranges = [(earliest, latest) for earliest, latest in ranges if earliest is not None]
+        if not ranges:
+            return None
+
+        return min(r[0] for r in ranges), max(r[1] for r in ranges)
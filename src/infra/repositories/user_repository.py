@@ -1,15 +1,17 @@
 from typing import Optional, cast
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from src.core.interfaces.user_repository import UserRepositoryInterface
 from src.core.models.user import User
-from src.infra.database.models import UserModel
+from src.infra.database.models import UserModel, WalletModel
 
 
 class SQLAlchemyUserRepository(UserRepositoryInterface):
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, core_reads: bool = False):
         self.session = session
+        self._core_reads = core_reads
 
     def save(self, user: User) -> None:
         db_user = self.session.query(UserModel).filter(UserModel.id == user.id).first()
@@ -21,13 +23,33 @@ class SQLAlchemyUserRepository(UserRepositoryInterface):
             self.session.add(new_user)
 
     def get_by_id(self, user_id: str) -> Optional[User]:
+        if self._core_reads:
+            return self._fetch_one(UserModel.id == user_id)
+
         db_user = self.session.query(UserModel).filter(UserModel.id == user_id).first()
         return self._to_domain(db_user) if db_user else None
 
     def get_user_by_api_key(self, api_key: str) -> Optional[User]:
+        if self._core_reads:
+            return self._fetch_one(UserModel.api_key == api_key)
+
         db_user = self.session.query(UserModel).filter(UserModel.api_key == api_key).first()
         return self._to_domain(db_user) if db_user else None
 
+    def _fetch_one(self, condition) -> Optional[User]:
+        rows = self.session.execute(
+            select(UserModel.id, UserModel.api_key, WalletModel.address)
+            .outerjoin(WalletModel, WalletModel.user_id == UserModel.id)
+            .where(condition)
+        ).all()
+        if not rows:
+            return None
+
+        return User(
+            id=rows[0].id,
+            api_key=rows[0].api_key,
+            wallet_ids=[row.address for row in rows if row.address is not None]
+        )
 
     @staticmethod
     def _to_domain(db_user: UserModel) -> User:
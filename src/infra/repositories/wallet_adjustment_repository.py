@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from src.core.interfaces.wallet_adjustment_repository import WalletAdjustmentRepositoryInterface
+from src.infra.database.models import WalletAdjustmentModel
+
+
+class SQLAlchemyWalletAdjustmentRepository(WalletAdjustmentRepositoryInterface):
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def add(self, wallet_address: str, amount_satoshis: int) -> None:
+        statement = insert(WalletAdjustmentModel).values(
+            wallet_address=wallet_address,
+            adjustment_satoshis=amount_satoshis,
+        ).on_conflict_do_update(
+            index_elements=[WalletAdjustmentModel.wallet_address],
+            set_={"adjustment_satoshis": WalletAdjustmentModel.adjustment_satoshis + amount_satoshis},
+        )
+        self._session.execute(statement) #Service layer will handle session commits
+
+    def total(self, wallet_address: str) -> int:
+        total = self._session.execute(
+            select(WalletAdjustmentModel.adjustment_satoshis)
+            .where(WalletAdjustmentModel.wallet_address == wallet_address)
+        ).scalar()
+        return total or 0
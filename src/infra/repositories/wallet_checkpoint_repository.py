@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from src.core.interfaces.wallet_checkpoint_repository import WalletCheckpointRepositoryInterface
+from src.core.models.transaction import TransactionCursor
+from src.core.models.wallet_checkpoint import WalletCheckpoint
+from src.infra.database.models import TransactionModel, WalletCheckpointModel
+
+
+class SQLAlchemyWalletCheckpointRepository(WalletCheckpointRepositoryInterface):
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def get(self, wallet_address: str) -> Optional[WalletCheckpoint]:
+        row = self._session.execute(
+            select(
+                WalletCheckpointModel.balance_satoshis,
+                WalletCheckpointModel.last_created_at,
+                WalletCheckpointModel.last_transaction_id,
+            ).where(WalletCheckpointModel.wallet_address == wallet_address)
+        ).first()
+        if row is None:
+            return None
+
+        return WalletCheckpoint(
+            wallet_address=wallet_address,
+            balance_satoshis=row.balance_satoshis,
+            cursor=TransactionCursor(created_at=row.last_created_at, id=row.last_transaction_id),
+        )
+
+    def latest_cursor(self) -> Optional[TransactionCursor]:
+        row = self._session.execute(
+            select(WalletCheckpointModel.last_created_at, WalletCheckpointModel.last_transaction_id)
+            .order_by(WalletCheckpointModel.last_created_at.desc(), WalletCheckpointModel.last_transaction_id.desc())
+            .limit(1)
+        ).first()
+        return TransactionCursor(created_at=row.last_created_at, id=row.last_transaction_id) if row else None
+
+    def balance_delta(self, wallet_address: str, after: Optional[TransactionCursor]) -> int:
+        """
+        Two range scans on the (wallet, created_at, id) indexes, bounded by the
+        transactions since the checkpoint rather than the wallet's history.
+        """
+        received = select(
+            func.coalesce(func.sum(TransactionModel.amount_satoshis - TransactionModel.fee_satoshis), 0)
+        ).where(TransactionModel.to_wallet_address == wallet_address)
+        sent = select(
+            func.coalesce(func.sum(TransactionModel.amount_satoshis), 0)
+        ).where(TransactionModel.from_wallet_address == wallet_address)
+
+        if after is not None:
+            position = tuple_(TransactionModel.created_at, TransactionModel.id) > tuple_(after.created_at, after.id)
+            received = received.where(position)
+            sent = sent.where(position)
+
+        return self._session.execute(received).scalar_one() - self._session.execute(sent).scalar_one()
+
+    def advance(self, created_before: datetime, limit: int, opening_balance_satoshis: int) -> int:
+        if limit < 1:
+            raise ValueError("Batch size must be positive")
+
+        # Every applied transaction moves both of its wallets' checkpoints to it,
+        # so the newest checkpoint marks how far the whole ledger has been applied.
+        after = self.latest_cursor()
+        statement = (
+            select(
+                TransactionModel.id,
+                TransactionModel.from_wallet_address,
+                TransactionModel.to_wallet_address,
+                TransactionModel.amount_satoshis,
+                TransactionModel.fee_satoshis,
+                TransactionModel.created_at,
+            )
+            .where(TransactionModel.created_at < created_before)
+            .order_by(TransactionModel.created_at, TransactionModel.id)
+            .limit(limit)
+        )
+        if after is not None:
+            statement = statement.where(
+                tuple_(TransactionModel.created_at, TransactionModel.id) > tuple_(after.created_at, after.id)
+            )
+
+        rows = self._session.execute(statement).all()
+        if not rows:
+            return 0
+
+        changes: dict[str, int] = {}
+        positions: dict[str, tuple[datetime, str]] = {}
+        for row in rows:
+            changes[row.from_wallet_address] = changes.get(row.from_wallet_address, 0) - row.amount_satoshis
+            changes[row.to_wallet_address] = (
+                changes.get(row.to_wallet_address, 0) + row.amount_satoshis - row.fee_satoshis
+            )
+            positions[row.from_wallet_address] = positions[row.to_wallet_address] = (row.created_at, row.id)
+
+        balances = dict(self._session.execute(
+            select(WalletCheckpointModel.wallet_address, WalletCheckpointModel.balance_satoshis)
+            .where(WalletCheckpointModel.wallet_address.in_(changes))
+        ).all())
+
+        statement = insert(WalletCheckpointModel)
+        statement = statement.on_conflict_do_update(
+            index_elements=[WalletCheckpointModel.wallet_address],
+            set_={
+                "balance_satoshis": statement.excluded.balance_satoshis,
+                "last_created_at": statement.excluded.last_created_at,
+                "last_transaction_id": statement.excluded.last_transaction_id,
+            },
+        )
+        self._session.execute(statement, [
+            {
+                "wallet_address": address,
+                "balance_satoshis": balances.get(address, opening_balance_satoshis) + change,
+                "last_created_at": positions[address][0],
+                "last_transaction_id": positions[address][1],
+            }
+            for address, change in changes.items()
+        ])
+        return len(rows)
@@ -1,8 +1,10 @@
-from typing import Optional
+from itertools import islice
+from typing import Iterable, Optional
 
+from sqlalchemy import Row, select, update
 from sqlalchemy.orm import Session
 
-from src.core.interfaces.wallet_repository import WalletRepositoryInterface
+from src.core.interfaces.wallet_repository import StaleWalletError, WalletRepositoryInterface
 from src.core.models.wallet import Wallet
 from src.infra.database.models import WalletModel
 
@@ -11,34 +13,100 @@ class WalletNotFound(Exception):
     pass
 
 class SQLAlchemyWalletRepository(WalletRepositoryInterface):
-    def __init__(self, session: Session):
+    COLUMNS = (
+        WalletModel.id,
+        WalletModel.address,
+        WalletModel.user_id,
+        WalletModel.balance_satoshi,
+        WalletModel.version,
+    )
+    # Older SQLite builds allow 999 bound parameters per statement.
+    IN_CHUNK_SIZE = 500
+
+    def __init__(self, session: Session, core_reads: bool = False):
         self.session = session
+        self._core_reads = core_reads
 
     def save(self, wallet: Wallet) -> None:
         db_wallet = self._to_db_model(wallet)
         self.session.add(db_wallet)
 
     def get_by_id(self, wallet_id: str) -> Optional[Wallet]:
+        if self._core_reads:
+            return self._fetch_one(WalletModel.id == wallet_id)
+
         db_wallet = self.session.query(WalletModel).filter(WalletModel.id == wallet_id).first()
         return self._to_domain(db_wallet) if db_wallet else None
 
     def get_by_address(self, address: str) -> Optional[Wallet]:
+        if self._core_reads:
+            return self._fetch_one(WalletModel.address == address)
+
         db_wallet = self.session.query(WalletModel).filter(WalletModel.address == address).first()
         return self._to_domain(db_wallet) if db_wallet else None
 
+    def get_many_by_addresses(self, addresses: Iterable[str]) -> dict[str, Wallet]:
+        """
+        One IN query per IN_CHUNK_SIZE distinct addresses.
+        """
+        iterator = iter(dict.fromkeys(addresses))
+        wallets: dict[str, Wallet] = {}
+
+        while chunk := list(islice(iterator, self.IN_CHUNK_SIZE)):
+            condition = WalletModel.address.in_(chunk)
+            if self._core_reads:
+                found = [self._to_domain(row) for row in self.session.execute(select(*self.COLUMNS).where(condition))]
+            else:
+                found = [self._to_domain(m) for m in self.session.query(WalletModel).filter(condition).all()]
+            wallets.update((wallet.address, wallet) for wallet in found)
+
+        return wallets
+
     def get_by_user_id(self, user_id: str) -> list[Wallet]:
+        if self._core_reads:
+            rows = self.session.execute(select(*self.COLUMNS).where(WalletModel.user_id == user_id))
+            return [self._to_domain(row) for row in rows]
+
         db_wallets = self.session.query(WalletModel).filter(WalletModel.user_id == user_id).all()
         wallets = [self._to_domain(db_wallet) for db_wallet in db_wallets]
         return wallets
 
     def update(self, wallet: Wallet):
-        db_wallet = self.session.query(WalletModel).filter(WalletModel.id == wallet.id).first()
-        if not db_wallet:
+        # Only the balance ever changes: one targeted compare-and-swap UPDATE,
+        # no SELECT to load the row first. A copy already in the identity map
+        # is updated in place.
+        result = self.session.execute(
+            update(WalletModel)
+            .where(WalletModel.id == wallet.id, WalletModel.version == wallet.version)
+            .values(balance_satoshi=wallet.balance_satoshis, version=WalletModel.version + 1)
+        )
+        if result.rowcount == 1:
+            wallet.version += 1
+            return
+
+        # Reload so a copy in the identity map stops reporting the version we
+        # lost against, and tell a missing row from a conflict.
+        if self.session.get(WalletModel, wallet.id, populate_existing=True) is None:
             raise WalletNotFound(f"Wallet {wallet.id} not found")
+        raise StaleWalletError(f"Wallet {wallet.id} changed since version {wallet.version}")
 
-        db_wallet.balance_satoshi = wallet.balance_satoshis
-        db_wallet.address = wallet.address
-        db_wallet.user_id = wallet.user_id
+    def debit(self, address: str, amount_satoshis: int) -> bool:
+        # The balance check and the write are one statement, so concurrent
+        # debits cannot both pass the check against the same old balance.
+        result = self.session.execute(
+            update(WalletModel)
+            .where(WalletModel.address == address, WalletModel.balance_satoshi >= amount_satoshis)
+            .values(balance_satoshi=WalletModel.balance_satoshi - amount_satoshis, version=WalletModel.version + 1)
+        )
+        return result.rowcount == 1
+
+    def credit(self, address: str, amount_satoshis: int) -> bool:
+        result = self.session.execute(
+            update(WalletModel)
+            .where(WalletModel.address == address)
+            .values(balance_satoshi=WalletModel.balance_satoshi + amount_satoshis, version=WalletModel.version + 1)
+        )
+        return result.rowcount == 1
 
     @staticmethod
     def _to_db_model(wallet: Wallet):
@@ -47,13 +115,19 @@ class SQLAlchemyWalletRepository(WalletRepositoryInterface):
             balance_satoshi=wallet.balance_satoshis,
             address=wallet.address,
             user_id=wallet.user_id,
+            version=wallet.version,
         )
 
+    def _fetch_one(self, condition) -> Optional[Wallet]:
+        row = self.session.execute(select(*self.COLUMNS).where(condition).limit(1)).first()
+        return self._to_domain(row) if row else None
+
     @staticmethod
-    def _to_domain(db_wallet: WalletModel):
+    def _to_domain(db_wallet: WalletModel | Row):
         return Wallet(
             id=db_wallet.id,
             balance_satoshis=db_wallet.balance_satoshi,
             address=db_wallet.address,
             user_id=db_wallet.user_id,
+            version=db_wallet.version,
         )
\ No newline at end of file
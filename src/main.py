@@ -1,22 +1,149 @@
 from __future__ import annotations
 
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import asdict
+from typing import AsyncIterator, Callable, Optional
+
+import httpx
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session, sessionmaker
 
-from src.api.routes import user_router
+from src.api.routes import transaction_router, user_router
 from src.config import settings, Settings
-from src.infra.database.init_db import init_db
+from src.core.interfaces.exchange_rate import AsyncExchangeRateInterface
+from src.core.services.circuit_breaker import CircuitBreaker
+from src.core.services.circuit_breaker_exchange_rate_service import AsyncCircuitBreakerExchangeRateClient
+from src.core.services.wallet_service import WalletUpdateMetrics
+from src.infra.database.init_db import engine, init_db
+from src.infra.exchange_rate.aggregated_exchange_rate_client import AggregatedExchangeRateClient
+from src.infra.exchange_rate.httpx_exchange_rate_client import HttpxExchangeRateClient, create_http_client
+from src.infra.exchange_rate.rate_refresher import RateRefresher
+from src.infra.exchange_rate.shared_rate_cache import AsyncSharedMemoryExchangeRateClient
+from src.infra.repositories.cached_wallet_repository import WalletCache
+from src.infra.repositories.rate_history_repository import SessionPerCallRateHistoryRepository
+
+
+def create_upstream_client(settings: Settings, http_client: httpx.AsyncClient) -> AsyncExchangeRateInterface:
+    if settings.EXCHANGE_RATE_AGGREGATE_SOURCES:
+        return AggregatedExchangeRateClient(
+            http_client,
+            quorum=settings.EXCHANGE_RATE_QUORUM,
+            hedge_delay_seconds=settings.EXCHANGE_RATE_HEDGE_DELAY_SECONDS,
+            latency_budget_seconds=settings.EXCHANGE_RATE_LATENCY_BUDGET_SECONDS,
+        )
+    return HttpxExchangeRateClient(http_client, api_url=settings.EXCHANGE_RATE_API_URL)
+
+
+def create_app(
+        settings: Settings,
+        rate_source: Optional[AsyncExchangeRateInterface] = None,
+        session_factory: Optional[Callable[[], Session]] = None,
+) -> FastAPI:
+    """
+    rate_source replaces the upstream HTTP client (tests pass a stub); it is
+    still wrapped in the circuit breaker and polled by the refresher.
+    session_factory opens the sessions the rate history is written with and
+    defaults to the application database.
+    """
+    session_factory = session_factory or sessionmaker(bind=engine)
 
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        async with AsyncExitStack() as stack:
+            upstream_client = rate_source
+            if upstream_client is None:
+                # One pooled client per app: keep-alive connections are reused across
+                # requests and closed together with the app.
+                http_client = await stack.enter_async_context(create_http_client(
+                    timeout_seconds=settings.EXCHANGE_RATE_TIMEOUT_SECONDS,
+                    max_connections=settings.EXCHANGE_RATE_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.EXCHANGE_RATE_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry_seconds=settings.EXCHANGE_RATE_KEEPALIVE_EXPIRY_SECONDS,
+                ))
+                upstream_client = create_upstream_client(settings, http_client)
+            # While the upstream is degraded, callers fail in milliseconds instead of
+            # waiting out the HTTP timeout.
+            app.state.exchange_rate_breaker = CircuitBreaker(
+                failure_rate_threshold=settings.EXCHANGE_RATE_BREAKER_FAILURE_RATE,
+                slow_call_seconds=settings.EXCHANGE_RATE_BREAKER_SLOW_CALL_SECONDS,
+                open_seconds=settings.EXCHANGE_RATE_BREAKER_OPEN_SECONDS,
+            )
+            app.state.exchange_rate_client = AsyncCircuitBreakerExchangeRateClient(
+                upstream_client,
+                app.state.exchange_rate_breaker,
+            )
+            refresh_source = app.state.exchange_rate_client
+            if settings.EXCHANGE_RATE_SHARED_FILE is not None:
+                # Only the worker holding the file's lease calls the upstream; the
+                # others refresh from the snapshot it published.
+                refresh_source = AsyncSharedMemoryExchangeRateClient(
+                    app.state.exchange_rate_client,
+                    settings.EXCHANGE_RATE_SHARED_FILE,
+                    ttl_seconds=settings.EXCHANGE_RATE_REFRESH_INTERVAL_SECONDS / 2,
+                    max_staleness_seconds=settings.EXCHANGE_RATE_MAX_STALENESS_SECONDS,
+                )
+                stack.callback(refresh_source.close)
+            # Every fetched rate is stored so transactions can be valued as of their
+            # creation, across restarts.
+            app.state.rate_history = SessionPerCallRateHistoryRepository(session_factory)
+            # Requests read the published snapshot and never wait on the upstream API.
+            app.state.exchange_rate_refresher = RateRefresher(
+                refresh_source,
+                interval_seconds=settings.EXCHANGE_RATE_REFRESH_INTERVAL_SECONDS,
+                max_staleness_seconds=settings.EXCHANGE_RATE_MAX_STALENESS_SECONDS,
+                history=app.state.rate_history,
+            )
+            app.state.exchange_rate_refresher.start()
+            try:
+                yield
+            finally:
+                await app.state.exchange_rate_refresher.stop()
 
-def create_app(settings: Settings) -> FastAPI:
-    app = FastAPI(title="Bitcoin Wallet API")
+    app = FastAPI(title="Bitcoin Wallet API", lifespan=lifespan)
 
     app.include_router(user_router)
+    app.include_router(transaction_router)
 
     @app.get("/")
     def root():
         return {"message": "This is root, see /docs for swagger"}
 
+    @app.get("/ready")
+    def ready():
+        refresher = getattr(app.state, "exchange_rate_refresher", None)
+        if refresher is None or refresher.snapshot is None:
+            return JSONResponse(status_code=503, content={"status": "waiting for exchange rate"})
+        if not refresher.is_ready:
+            return JSONResponse(status_code=503, content={"status": "exchange rate is stale"})
+        return {"status": "ready"}
+
+    @app.get("/health/exchange-rate")
+    def exchange_rate_health():
+        breaker = getattr(app.state, "exchange_rate_breaker", None)
+        refresher = getattr(app.state, "exchange_rate_refresher", None)
+        snapshot = refresher.snapshot if refresher is not None else None
+        return {
+            "circuit": asdict(breaker.stats()) if breaker is not None else None,
+            "rate": str(snapshot.rate) if snapshot is not None else None,
+            "fetched_at": snapshot.fetched_at.isoformat() if snapshot is not None else None,
+            "source": snapshot.source if snapshot is not None else None,
+        }
+
+    @app.get("/health/wallet-cache")
+    def wallet_cache_health():
+        return asdict(app.state.wallet_cache.stats())
+
+    @app.get("/health/wallet-updates")
+    def wallet_updates_health():
+        return asdict(app.state.wallet_update_metrics.stats())
+
     app.state.settings = settings
+    app.state.wallet_cache = WalletCache(
+        max_entries=settings.WALLET_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.WALLET_CACHE_TTL_SECONDS,
+    )
+    app.state.wallet_update_metrics = WalletUpdateMetrics()
 
     return app
 
@@ -32,4 +159,4 @@ if __name__ == "__main__":
         host="127.0.0.1",
         port=8000,
         reload=True
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,7 @@
+PRAGMA foreign_keys = ON;
+
+CREATE TABLE IF NOT EXISTS btc_usd_rate_history (
+    fetched_at_us  INTEGER PRIMARY KEY,
+    rate_e8        INTEGER NOT NULL CHECK (rate_e8 > 0),
+    source         TEXT NOT NULL
+);
@@ -0,0 +1,12 @@
+PRAGMA foreign_keys = ON;
+
+-- Wallet history is read newest first per wallet and side; these let each
+-- side be walked in index order and merged, and supersede the single-column
+-- wallet indexes from 004.
+CREATE INDEX IF NOT EXISTS idx_transactions_from_wallet_created
+    ON transactions(from_wallet_address, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_transactions_to_wallet_created
+    ON transactions(to_wallet_address, created_at, id);
+
+DROP INDEX IF EXISTS idx_transactions_from_wallet;
+DROP INDEX IF EXISTS idx_transactions_to_wallet;
@@ -0,0 +1,10 @@
+PRAGMA foreign_keys = ON;
+
+CREATE TABLE IF NOT EXISTS platform_stats (
+    id                   INTEGER PRIMARY KEY CHECK (id = 1),
+    transaction_count    INTEGER NOT NULL DEFAULT 0 CHECK (transaction_count >= 0),
+    total_fees_satoshis  INTEGER NOT NULL DEFAULT 0 CHECK (total_fees_satoshis >= 0)
+);
+
+INSERT OR IGNORE INTO platform_stats (id, transaction_count, total_fees_satoshis)
+SELECT 1, COUNT(*), COALESCE(SUM(fee_satoshis), 0) FROM transactions;
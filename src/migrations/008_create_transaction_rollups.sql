@@ -0,0 +1,39 @@
+PRAGMA foreign_keys = ON;
+
+CREATE TABLE IF NOT EXISTS transaction_rollups_hourly (
+    bucket_start_us           INTEGER PRIMARY KEY,
+    transaction_count         INTEGER NOT NULL DEFAULT 0,
+    internal_count            INTEGER NOT NULL DEFAULT 0,
+    volume_satoshis           INTEGER NOT NULL DEFAULT 0,
+    internal_volume_satoshis  INTEGER NOT NULL DEFAULT 0,
+    fees_satoshis             INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS transaction_rollups_daily (
+    bucket_start_us           INTEGER PRIMARY KEY,
+    transaction_count         INTEGER NOT NULL DEFAULT 0,
+    internal_count            INTEGER NOT NULL DEFAULT 0,
+    volume_satoshis           INTEGER NOT NULL DEFAULT 0,
+    internal_volume_satoshis  INTEGER NOT NULL DEFAULT 0,
+    fees_satoshis             INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO transaction_rollups_hourly
+SELECT (CAST(strftime('%s', created_at) AS INTEGER) / 3600) * 3600 * 1000000,
+       COUNT(*),
+       SUM(is_internal_transfer != 0),
+       SUM(amount_satoshis),
+       SUM(CASE WHEN is_internal_transfer != 0 THEN amount_satoshis ELSE 0 END),
+       SUM(fee_satoshis)
+FROM transactions
+GROUP BY 1;
+
+INSERT OR IGNORE INTO transaction_rollups_daily
+SELECT (CAST(strftime('%s', created_at) AS INTEGER) / 86400) * 86400 * 1000000,
+       COUNT(*),
+       SUM(is_internal_transfer != 0),
+       SUM(amount_satoshis),
+       SUM(CASE WHEN is_internal_transfer != 0 THEN amount_satoshis ELSE 0 END),
+       SUM(fee_satoshis)
+FROM transactions
+GROUP BY 1;
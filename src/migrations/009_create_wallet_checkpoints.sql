@@ -0,0 +1,18 @@
+PRAGMA foreign_keys = ON;
+
+CREATE TABLE IF NOT EXISTS wallet_checkpoints (
+    wallet_address       TEXT PRIMARY KEY,
+    balance_satoshis     INTEGER NOT NULL,
+    last_created_at      TEXT NOT NULL,
+    last_transaction_id  TEXT NOT NULL,
+    FOREIGN KEY (wallet_address) REFERENCES wallets(address) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_wallet_checkpoints_position
+    ON wallet_checkpoints(last_created_at, last_transaction_id);
+
+-- The checkpoint job walks the whole ledger in (created_at, id) order;
+-- supersedes the created_at index from 004.
+CREATE INDEX IF NOT EXISTS idx_transactions_created_id ON transactions(created_at, id);
+
+DROP INDEX IF EXISTS idx_transactions_created_at;
@@ -0,0 +1,4 @@
+PRAGMA foreign_keys = ON;
+
+-- Optimistic concurrency: balance updates apply only to the version they read.
+ALTER TABLE wallets ADD COLUMN version INTEGER NOT NULL DEFAULT 0;
@@ -0,0 +1,9 @@
+PRAGMA foreign_keys = ON;
+
+-- Net deposits minus withdrawals per wallet: balance changes that have no
+-- transaction row, applied by the balance audit on top of the ledger.
+CREATE TABLE IF NOT EXISTS wallet_adjustments (
+    wallet_address       TEXT PRIMARY KEY,
+    adjustment_satoshis  INTEGER NOT NULL DEFAULT 0,
+    FOREIGN KEY (wallet_address) REFERENCES wallets(address) ON DELETE CASCADE
+);
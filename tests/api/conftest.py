@@ -0,0 +1,27 @@
+from decimal import Decimal
+
+import pytest
+
+from src.config import settings
+from src.core.models.exchange_rate import RateSnapshot
+from src.core.services.exchange_rate_service import BaseAsyncExchangeRateService
+from src.main import create_app
+
+
+class FixedRateSource(BaseAsyncExchangeRateService):
+    """Stands in for the upstream rate API so API tests never hit the network."""
+
+    async def get_btc_to_usd_rate(self) -> Decimal:
+        return Decimal("45000")
+
+    async def get_rate_snapshot(self) -> RateSnapshot:
+        return RateSnapshot.now(rate=Decimal("45000"), source="stub", rates={"USD": Decimal("45000")})
+
+
+@pytest.fixture
+def app(app_session_factory, tmp_path):
+    return create_app(
+        settings.model_copy(update={"EXCHANGE_RATE_SHARED_FILE": tmp_path / "rate.bin"}),
+        rate_source=FixedRateSource(),
+        session_factory=app_session_factory,
+    )
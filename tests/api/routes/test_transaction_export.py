@@ -0,0 +1,184 @@
+import csv
+import io
+import json
+from datetime import datetime, timedelta, UTC
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.api import dependencies
+from src.api.dependencies import get_current_user, get_transaction_export_service, get_user_service
+from src.api.routes.transaction import EXPORT_CHUNK_ROWS, csv_chunks, ndjson_chunks
+from src.core.models.transaction import Transaction
+from src.core.models.user import User
+from src.core.models.wallet import Wallet
+from src.core.services.wallet_service import UnauthorizedWalletAccessError, WalletNotFoundError
+from src.infra.database.models import Base
+from src.infra.database.sqlalchemy_connection import get_sqlalchemy_session
+from src.infra.database.transaction_archive import TransactionArchive
+from src.infra.repositories.transaction_repository import SQLAlchemyTransactionRepository
+from src.infra.repositories.user_repository import SQLAlchemyUserRepository
+from src.infra.repositories.wallet_repository import SQLAlchemyWalletRepository
+
+
+def make_transactions(count: int) -> list[Transaction]:
+    transactions = []
+    for i in range(count):
+        transaction = Transaction.create("wallet-1", f"dest-{i}", 1000 + i)
+        transaction.created_at = datetime(2025, 1, 1, 0, 0, i, tzinfo=UTC)
+        transactions.append(transaction)
+    return transactions
+
+
+class StubExportService:
+    def __init__(self, transactions):
+        self.transactions = transactions
+        self.calls = []
+
+    def iter_history(self, *, user_id, wallet_address=None, batch_size=1000):
+        self.calls.append((user_id, wallet_address))
+        if wallet_address == "missing":
+            raise WalletNotFoundError("Wallet not found")
+        if wallet_address == "foreign":
+            raise UnauthorizedWalletAccessError("Unauthorized")
+        return iter(self.transactions)
+
+
+@pytest.fixture
+def export_service():
+    return StubExportService(make_transactions(3))
+
+
+@pytest.fixture
+def client(app, export_service):
+    app.dependency_overrides[get_current_user] = lambda: User(api_key="key", id="user-1")
+    app.dependency_overrides[get_transaction_export_service] = lambda: export_service
+
+    with TestClient(app) as client:
+        yield client
+
+    app.dependency_overrides.clear()
+
+
+def test_export_ndjson(client, export_service):
+    response = client.get("/transactions/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == [t.id for t in export_service.transactions]
+    assert rows[0]["fee_satoshis"] == 15
+    assert rows[0]["created_at"] == "2025-01-01T00:00:00+00:00"
+    assert export_service.calls == [("user-1", None)]
+
+
+def test_export_csv_for_one_wallet(client, export_service):
+    response = client.get("/transactions/export", params={"format": "csv", "wallet_address": "wallet-1"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="transactions.csv"' in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["to_wallet_address"] for row in rows] == ["dest-0", "dest-1", "dest-2"]
+    assert export_service.calls == [("user-1", "wallet-1")]
+
+
+@pytest.mark.parametrize("address, status", [("missing", 404), ("foreign", 403)])
+def test_export_checks_wallet_before_streaming(client, address, status):
+    response = client.get("/transactions/export", params={"wallet_address": address})
+
+    assert response.status_code == status
+
+
+def test_export_rejects_unknown_format(client):
+    assert client.get("/transactions/export", params={"format": "xml"}).status_code == 422
+
+
+def test_export_requires_valid_api_key(app):
+    class RejectingUserService:
+        def authenticate_user(self, api_key):
+            return None
+
+    app.dependency_overrides[get_user_service] = lambda: RejectingUserService()
+    try:
+        with TestClient(app) as client:
+            assert client.get("/transactions/export", headers={"X-API-Key": "bad"}).status_code == 401
+            assert client.get("/transactions/export").status_code == 422
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_export_streams_live_and_archived_rows_through_the_request_session(app, tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'wallet.db'}")
+    Base.metadata.create_all(engine)
+    archive = TransactionArchive(tmp_path / "archive")
+    monkeypatch.setattr(dependencies, "transaction_archive", archive)
+
+    user = User.create(api_key="key")
+    wallet = Wallet.create(user.id)
+    count = 2 * EXPORT_CHUNK_ROWS + 200
+    transactions = []
+    for i in range(count):
+        transaction = Transaction.create(wallet.address, f"dest-{i}", 1000 + i)
+        transaction.created_at = datetime(2023, 1, 1, tzinfo=UTC) + timedelta(days=i)
+        transactions.append(transaction)
+
+    with Session(engine) as session:
+        SQLAlchemyUserRepository(session).save(user)
+        SQLAlchemyWalletRepository(session).save(wallet)
+        SQLAlchemyTransactionRepository(session).save_many(transactions)
+        session.commit()
+        archived = archive.move_chunk(session, datetime(2025, 1, 1, tzinfo=UTC), chunk_size=count)
+        session.commit()
+    assert 0 < archived < count
+    engine.dispose()
+
+    sessions, closed = [], []
+
+    def request_session():
+        session = Session(bind=engine)
+        sessions.append(session)
+        try:
+            yield session
+        finally:
+            session.close()
+            closed.append(session)
+
+    app.dependency_overrides[get_sqlalchemy_session] = request_session
+    app.dependency_overrides[get_current_user] = lambda: user
+    try:
+        with TestClient(app) as client:
+            response = client.get("/transactions/export")
+    finally:
+        app.dependency_overrides.clear()
+        engine.dispose()
+
+    assert response.status_code == 200
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    expected = sorted(transactions, key=lambda t: (t.created_at, t.id))
+    assert [row["id"] for row in rows] == [t.id for t in expected]
+    assert len(sessions) == 1
+    assert closed == sessions
+
+
+def test_chunks_are_produced_lazily():
+    consumed = []
+
+    def history():
+        for transaction in make_transactions(5):
+            consumed.append(transaction.id)
+            yield transaction
+
+    chunks = ndjson_chunks(history(), chunk_rows=2)
+    first = next(chunks)
+
+    assert len(first.splitlines()) == 2
+    assert len(consumed) == 2
+
+
+def test_csv_of_empty_history_is_header_only():
+    assert list(csv_chunks([])) == [
+        "id,from_wallet_address,to_wallet_address,amount_satoshis,fee_satoshis,is_internal_transfer,created_at\n"
+    ]
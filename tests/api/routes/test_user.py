@@ -1,12 +1,11 @@
 import pytest
 from fastapi.testclient import TestClient
-from src.main import app
 from src.api.dependencies import get_user_service
 from src.core.services.user_service import UserRegistrationResult
 
 
 @pytest.fixture
-def client_with_mock():
+def client_with_mock(app):
     class MockUserService:
         def register_user(self):
             return UserRegistrationResult(user_id="mock-id", api_key="mock-key")
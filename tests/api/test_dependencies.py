@@ -0,0 +1,54 @@
+from fastapi import Depends
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from src.api.dependencies import get_wallet_service
+from src.core.models.wallet import Wallet
+from src.core.services.wallet_service import WalletService
+from src.infra.database.models import Base
+from src.infra.database.sqlalchemy_connection import get_sqlalchemy_session
+from src.infra.repositories.wallet_adjustment_repository import SQLAlchemyWalletAdjustmentRepository
+from src.infra.repositories.wallet_repository import SQLAlchemyWalletRepository
+
+
+def test_wallet_service_records_adjustments_in_the_request_commit(app, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'wallet.db'}")
+    Base.metadata.create_all(engine)
+    wallet = Wallet.create("user-1")
+    with Session(engine) as session:
+        SQLAlchemyWalletRepository(session).save(wallet)
+        session.commit()
+
+    commits = []
+
+    def request_session():
+        with Session(bind=engine) as session:
+            event.listen(session, "after_commit", lambda _: commits.append(session))
+            yield session
+
+    @app.post("/test/deposit")
+    def deposit(
+            amount: int,
+            commit: bool,
+            session: Session = Depends(get_sqlalchemy_session),
+            service: WalletService = Depends(get_wallet_service),
+    ):
+        service.deposit(user_id="user-1", address=wallet.address, amount_satoshis=amount)
+        if commit:
+            session.commit()
+
+    app.dependency_overrides[get_sqlalchemy_session] = request_session
+    try:
+        with TestClient(app) as client:
+            assert client.post("/test/deposit", params={"amount": 500, "commit": True}).status_code == 200
+            assert client.post("/test/deposit", params={"amount": 7, "commit": False}).status_code == 200
+    finally:
+        app.dependency_overrides.clear()
+
+    assert len(commits) == 1
+    with Session(engine) as session:
+        stored = SQLAlchemyWalletRepository(session).get_by_address(wallet.address)
+        assert stored.balance_satoshis == wallet.balance_satoshis + 500
+        assert SQLAlchemyWalletAdjustmentRepository(session).total(wallet.address) == 500
+    engine.dispose()
@@ -0,0 +1,14 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.infra.database.models import Base
+
+
+@pytest.fixture
+def app_session_factory(tmp_path):
+    """Sessions for create_app in tests, so the rate history never lands in data/."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
@@ -18,12 +18,29 @@ class InMemoryWalletRepository(WalletRepositoryInterface):
             None,
         )
 
+    def get_many_by_addresses(self, addresses):
+        return {w.address: w for w in self._wallets.values() if w.address in set(addresses)}
+
     def get_by_user_id(self, user_id: str):
         return [w for w in self._wallets.values() if w.user_id == user_id]
 
     def update(self, wallet: Wallet) -> None:
         self._wallets[wallet.id] = wallet
 
+    def debit(self, address: str, amount_satoshis: int) -> bool:
+        wallet = self.get_by_address(address)
+        if wallet is None or wallet.balance_satoshis < amount_satoshis:
+            return False
+        wallet.balance_satoshis -= amount_satoshis
+        return True
+
+    def credit(self, address: str, amount_satoshis: int) -> bool:
+        wallet = self.get_by_address(address)
+        if wallet is None:
+            return False
+        wallet.balance_satoshis += amount_satoshis
+        return True
+
 
 def test_save_and_get_by_id():
     repo = InMemoryWalletRepository()
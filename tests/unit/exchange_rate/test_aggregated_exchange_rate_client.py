@@ -0,0 +1,271 @@
+import json
+import threading
+import time
+from dataclasses import replace
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from src.core.interfaces.exchange_rate import ExchangeRateError
+from src.infra.exchange_rate.aggregated_exchange_rate_client import (
+    AggregatedExchangeRateClient,
+    LatencyWindow,
+    RateSource,
+)
+
+
+class StubRateServer:
+    """
+    Local HTTP server; each path answers with a configured delay, status, USD and EUR rate.
+    """
+
+    def __init__(self) -> None:
+        self.routes: dict[str, tuple[float, int, str, str]] = {}
+        self.hits: dict[str, int] = {}
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                delay, status, rate, eur = server.routes[self.path]
+                server.hits[self.path] = server.hits.get(self.path, 0) + 1
+                time.sleep(delay)
+                body = json.dumps({"data": {"rates": {"USD": rate, "EUR": eur}}}).encode()
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, args=(0.01,), daemon=True)
+
+    def source(
+            self, name: str, *, delay: float = 0.0, status: int = 200, rate: str = "45000", eur: str = "41000"
+    ) -> RateSource:
+        self.routes[f"/{name}"] = (delay, status, rate, eur)
+        host, port = self._httpd.server_address
+        return RateSource(name=name, url=f"http://{host}:{port}/{name}", rate_path=("data", "rates", "USD"))
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def stub_server():
+    server = StubRateServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+class TestAggregatedExchangeRateClient:
+
+    @pytest.mark.asyncio
+    async def test_first_answer_wins(self, stub_server):
+        sources = [stub_server.source("a", rate="45000")]
+        async with httpx.AsyncClient() as http_client:
+            client = AggregatedExchangeRateClient(http_client, sources)
+            snapshot = await client.get_rate_snapshot()
+
+        assert snapshot.rate == Decimal("45000")
+        assert snapshot.source == "a"
+
+    @pytest.mark.asyncio
+    async def test_hedges_slow_primary(self, stub_server):
+        sources = [
+            stub_server.source("slow", delay=1.0, rate="40000"),
+            stub_server.source("fast", rate="45000"),
+        ]
+        async with httpx.AsyncClient() as http_client:
+            client = AggregatedExchangeRateClient(
+                http_client, sources, hedge_delay_seconds=0.05, latency_budget_seconds=2.0
+            )
+            started = time.monotonic()
+            rate = await client.get_btc_to_usd_rate()
+            elapsed = time.monotonic() - started
+
+        assert rate == Decimal("45000")
+        assert elapsed < 0.5
+        assert stub_server.hits["/fast"] == 1
+
+    @pytest.mark.asyncio
+    async def test_hedge_not_sent_when_primary_is_fast(self, stub_server):
+        sources = [stub_server.source("a"), stub_server.source("b")]
+        async with httpx.AsyncClient() as http_client:
+            client = AggregatedExchangeRateClient(http_client, sources, hedge_delay_seconds=0.5)
+            await client.get_btc_to_usd_rate()
+
+        assert stub_server.hits == {"/a": 1}
+
+    @pytest.mark.asyncio
+    async def test_failed_source_triggers_immediate_hedge(self, stub_server):
+        sources = [stub_server.source("broken", status=500), stub_server.source("ok", rate="45000")]
+        async with httpx.AsyncClient() as http_client:
+            client = AggregatedExchangeRateClient(http_client, sources, hedge_delay_seconds=5.0)
+            rate = await client.get_btc_to_usd_rate()
+
+        assert rate == Decimal("45000")
+
+    @pytest.mark.asyncio
+    async def test_median_of_quorum(self, stub_server):
+        sources = [
+            stub_server.source("a", rate="44000"),
+            stub_server.source("b", rate="45000"),
+            stub_server.source("c", rate="90000"),
+        ]
+        async with httpx.AsyncClient() as http_client:
+            client = AggregatedExchangeRateClient(http_client, sources, quorum=3)
+            snapshot = await client.get_rate_snapshot()
+
+        assert snapshot.rate == Decimal("45000")
+        assert snapshot.source == "a+b+c"
+
+    @pytest.mark.asyncio
+    async def test_budget_returns_median_of_arrived_answers(self, stub_server):
+        sources = [
+            stub_server.source("a", rate="44000"),
+            stub_server.source("b", rate="46000"),
+            stub_server.source("slow", delay=1.0, rate="90000"),
+        ]
+        async with httpx.AsyncClient() as http_client:
+            client = AggregatedExchangeRateClient(http_client, sources, quorum=3, latency_budget_seconds=0.3)
+            started = time.monotonic()
+            rate = await client.get_btc_to_usd_rate()
+            elapsed = time.monotonic() - started
+
+        assert rate == Decimal("45000")
+        assert elapsed < 0.6
+
+    @pytest.mark.asyncio
+    async def test_nothing_within_budget_raises(self, stub_server):
+        sources = [stub_server.source("slow", delay=1.0)]
+        async with httpx.AsyncClient() as http_client:
+            client = AggregatedExchangeRateClient(http_client, sources, latency_budget_seconds=0.2)
+            with pytest.raises(ExchangeRateError, match="budget"):
+                await client.get_btc_to_usd_rate()
+
+    @pytest.mark.asyncio
+    async def test_all_sources_failing_raises(self, stub_server):
+        sources = [stub_server.source("a", status=500), stub_server.source("b", status=503)]
+        async with httpx.AsyncClient() as http_client:
+            client = AggregatedExchangeRateClient(http_client, sources, hedge_delay_seconds=0.01)
+            with pytest.raises(ExchangeRateError):
+                await client.get_btc_to_usd_rate()
+
+    @pytest.mark.asyncio
+    async def test_source_with_high_p95_drops_out(self, stub_server):
+        sources = [stub_server.source("slow", delay=0.3), stub_server.source("a"), stub_server.source("b")]
+        async with httpx.AsyncClient() as http_client:
+            client = AggregatedExchangeRateClient(http_client, sources, quorum=2, max_p95_seconds=0.1)
+            for _ in range(AggregatedExchangeRateClient.MIN_SAMPLES):
+                client._latencies["slow"].record(0.3)
+
+            assert [s.name for s in client.healthy_sources()] == ["a", "b"]
+
+            await client.get_btc_to_usd_rate()
+
+        assert "/slow" not in stub_server.hits
+
+    @pytest.mark.asyncio
+    async def test_all_sources_unhealthy_fails_open(self, stub_server):
+        sources = [stub_server.source("slow", delay=0.3)]
+        async with httpx.AsyncClient() as http_client:
+            client = AggregatedExchangeRateClient(http_client, sources, max_p95_seconds=0.1)
+            for _ in range(AggregatedExchangeRateClient.MIN_SAMPLES):
+                client._latencies["slow"].record(0.3)
+
+            assert await client.get_btc_to_usd_rate() == Decimal("45000")
+
+    @pytest.mark.asyncio
+    async def test_slow_source_is_tried_last(self, stub_server):
+        sources = [stub_server.source("flaky", status=500), stub_server.source("ok")]
+        async with httpx.AsyncClient() as http_client:
+            client = AggregatedExchangeRateClient(http_client, sources, hedge_delay_seconds=0.5)
+            await client.get_btc_to_usd_rate()
+
+            assert [s.name for s in client.healthy_sources()] == ["ok", "flaky"]
+
+    @pytest.mark.asyncio
+    async def test_convert_many(self, stub_server):
+        async with httpx.AsyncClient() as http_client:
+            client = AggregatedExchangeRateClient(http_client, [stub_server.source("a", rate="45000.50")])
+            batch = await client.convert_many([50_000_000])
+
+        assert batch.amounts_usd == [Decimal("22500.25")]
+
+    @pytest.mark.asyncio
+    async def test_currency_table_comes_from_a_source_that_has_one(self, stub_server):
+        sources = [
+            stub_server.source("plain", rate="45000"),
+            replace(stub_server.source("table", rate="46000"), table_path=("data", "rates")),
+        ]
+        async with httpx.AsyncClient() as http_client:
+            client = AggregatedExchangeRateClient(http_client, sources, quorum=2)
+            snapshot = await client.get_rate_snapshot()
+
+        assert snapshot.rate == Decimal("45500")
+        assert snapshot.rate_for("EUR") == Decimal("41000")
+
+    @pytest.mark.asyncio
+    async def test_every_currency_is_the_median_of_its_quotes(self, stub_server):
+        sources = [
+            replace(stub_server.source(name, rate=usd, eur=eur), table_path=("data", "rates"))
+            for name, usd, eur in (("a", "44000", "40000"), ("b", "45000", "41000"), ("c", "90000", "99000"))
+        ]
+        async with httpx.AsyncClient() as http_client:
+            client = AggregatedExchangeRateClient(http_client, sources, quorum=3)
+            snapshot = await client.get_rate_snapshot()
+
+        assert snapshot.rate == Decimal("45000")
+        assert snapshot.rate_for("EUR") == Decimal("41000")
+        assert snapshot.rates["USD"] == Decimal("45000")
+
+    @pytest.mark.asyncio
+    async def test_non_finite_quotes_are_skipped(self, stub_server):
+        sources = [
+            replace(stub_server.source(name, rate=usd, eur=eur), table_path=("data", "rates"))
+            for name, usd, eur in (("a", "NaN", "40000"), ("b", "45000", "Infinity"), ("c", "46000", "41000"))
+        ]
+        async with httpx.AsyncClient() as http_client:
+            client = AggregatedExchangeRateClient(http_client, sources, quorum=2)
+            snapshot = await client.get_rate_snapshot()
+
+        assert snapshot.rate == Decimal("45500")
+        assert snapshot.rate_for("EUR") == Decimal("41000")
+
+    def test_invalid_quorum_raises(self):
+        source = RateSource(name="a", url="http://127.0.0.1/a", rate_path=("last",))
+        with pytest.raises(ValueError):
+            AggregatedExchangeRateClient(httpx.AsyncClient(), [source], quorum=2)
+
+
+class TestLatencyWindow:
+
+    def test_p95(self):
+        window = LatencyWindow(window_seconds=60)
+        for latency in range(1, 101):
+            window.record(latency / 100)
+
+        assert window.p95() == 0.95
+
+    def test_samples_expire(self):
+        now = [0.0]
+        window = LatencyWindow(window_seconds=10, clock=lambda: now[0])
+        window.record(5.0)
+        now[0] = 11.0
+
+        assert window.p95() is None
+        assert len(window) == 0
@@ -0,0 +1,135 @@
+from decimal import Decimal
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from src.config import Settings
+from src.core.interfaces.exchange_rate import ExchangeRateError
+from src.infra.exchange_rate.httpx_exchange_rate_client import HttpxExchangeRateClient, create_http_client
+from src.main import create_app
+
+
+def rates_handler(usd: str = "45000.50", status_code: int = 200):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(
+            status_code,
+            json={'data': {'currency': 'BTC', 'rates': {'USD': usd, 'EUR': '41000.25', 'GBP': '35000'}}},
+        )
+
+    return handler, calls
+
+
+class TestHttpxExchangeRateClient:
+
+    @pytest.mark.asyncio
+    async def test_get_btc_to_usd_rate_success(self):
+        handler, calls = rates_handler()
+        async with create_http_client(transport=httpx.MockTransport(handler)) as http_client:
+            client = HttpxExchangeRateClient(http_client)
+            rate = await client.get_btc_to_usd_rate()
+
+        assert rate == Decimal("45000.50")
+        assert len(calls) == 1
+        assert "coinbase" in str(calls[0].url)
+
+    @pytest.mark.asyncio
+    async def test_reuses_the_shared_client(self):
+        handler, calls = rates_handler()
+        async with create_http_client(transport=httpx.MockTransport(handler)) as http_client:
+            client = HttpxExchangeRateClient(http_client, api_url="http://rates.test/btc")
+            await client.get_btc_to_usd_rate()
+            await client.get_btc_to_usd_rate()
+
+            assert not http_client.is_closed
+
+        assert [str(c.url) for c in calls] == ["http://rates.test/btc"] * 2
+
+    @pytest.mark.asyncio
+    async def test_http_error_raises_exchange_rate_error(self):
+        handler, _ = rates_handler(status_code=500)
+        async with create_http_client(transport=httpx.MockTransport(handler)) as http_client:
+            client = HttpxExchangeRateClient(http_client)
+            with pytest.raises(ExchangeRateError):
+                await client.get_btc_to_usd_rate()
+
+    @pytest.mark.asyncio
+    async def test_transport_error_raises_exchange_rate_error(self):
+        def handler(request):
+            raise httpx.ConnectTimeout("timeout", request=request)
+
+        async with create_http_client(transport=httpx.MockTransport(handler)) as http_client:
+            client = HttpxExchangeRateClient(http_client)
+            with pytest.raises(ExchangeRateError):
+                await client.get_btc_to_usd_rate()
+
+    @pytest.mark.asyncio
+    async def test_invalid_payload_raises_exchange_rate_error(self):
+        async with create_http_client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={'invalid': 'format'}))
+        ) as http_client:
+            client = HttpxExchangeRateClient(http_client)
+            with pytest.raises(ExchangeRateError):
+                await client.get_btc_to_usd_rate()
+
+    @pytest.mark.asyncio
+    async def test_conversions(self):
+        handler, _ = rates_handler()
+        async with create_http_client(transport=httpx.MockTransport(handler)) as http_client:
+            client = HttpxExchangeRateClient(http_client)
+
+            assert await client.satoshis_to_usd(50_000_000) == Decimal("22500.25")
+            assert await client.btc_to_usd(Decimal("1")) == Decimal("45000.50")
+
+            with pytest.raises(ValueError, match="cannot be negative"):
+                await client.satoshis_to_usd(-1)
+
+    @pytest.mark.asyncio
+    async def test_convert_many_fetches_rate_once(self):
+        handler, calls = rates_handler()
+        async with create_http_client(transport=httpx.MockTransport(handler)) as http_client:
+            client = HttpxExchangeRateClient(http_client)
+            batch = await client.convert_many([100_000_000, 50_000_000])
+
+        assert batch.amounts_usd == [Decimal("45000.50"), Decimal("22500.25")]
+        assert batch.rate == Decimal("45000.50")
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_other_currencies_come_from_the_same_fetch(self):
+        handler, calls = rates_handler()
+        async with create_http_client(transport=httpx.MockTransport(handler)) as http_client:
+            client = HttpxExchangeRateClient(http_client)
+            batch = await client.convert_many_to("eur", [100_000_000, 50_000_000])
+
+        assert batch.currency == "EUR"
+        assert batch.amounts == [Decimal("41000.25"), Decimal("20500.125")]
+        assert batch.snapshot.rates["GBP"] == Decimal("35000")
+        assert len(calls) == 1
+
+    def test_pool_limits_are_applied(self):
+        http_client = create_http_client(max_connections=3, max_keepalive_connections=2)
+        pool = http_client._transport._pool
+
+        assert pool._max_connections == 3
+        assert pool._max_keepalive_connections == 2
+
+
+def test_app_lifespan_owns_the_client(app_session_factory, tmp_path):
+    app = create_app(
+        Settings(
+            EXCHANGE_RATE_API_URL="http://127.0.0.1:9/unreachable",
+            EXCHANGE_RATE_SHARED_FILE=tmp_path / "rate.bin",
+        ),
+        session_factory=app_session_factory,
+    )
+
+    with TestClient(app):
+        client = app.state.exchange_rate_client._client
+        assert isinstance(client, HttpxExchangeRateClient)
+        assert not client._client.is_closed
+
+    assert client._client.is_closed
@@ -0,0 +1,195 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, UTC
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.config import Settings
+from src.core.interfaces.exchange_rate import ExchangeRateError
+from src.core.models.exchange_rate import RateSnapshot
+from src.core.services.exchange_rate_service import BaseAsyncExchangeRateService
+from src.infra.database.models import Base
+from src.infra.exchange_rate.rate_refresher import RateRefresher
+from src.infra.repositories.rate_history_repository import InMemoryRateHistoryRepository
+from src.main import create_app
+
+
+class StubAsyncSource(BaseAsyncExchangeRateService):
+    def __init__(self, rates):
+        self._rates = list(rates)
+        self.calls = 0
+
+    async def get_btc_to_usd_rate(self) -> Decimal:
+        self.calls += 1
+        rate = self._rates.pop(0) if len(self._rates) > 1 else self._rates[0]
+        if isinstance(rate, Exception):
+            raise rate
+        return rate
+
+    async def get_rate_snapshot(self) -> RateSnapshot:
+        return RateSnapshot.now(rate=await self.get_btc_to_usd_rate(), source="stub")
+
+
+class TestRateRefresher:
+
+    def test_not_ready_before_first_fetch(self):
+        refresher = RateRefresher(StubAsyncSource([Decimal("1")]))
+
+        assert refresher.is_ready is False
+        with pytest.raises(ExchangeRateError, match="not available"):
+            refresher.get_btc_to_usd_rate()
+
+    @pytest.mark.asyncio
+    async def test_refresh_once_publishes_snapshot(self):
+        refresher = RateRefresher(StubAsyncSource([Decimal("45000.50")]))
+
+        await refresher.refresh_once()
+
+        assert refresher.is_ready
+        assert refresher.snapshot.rate == Decimal("45000.50")
+        assert refresher.snapshot.source == "stub"
+        assert refresher.satoshis_to_usd(50_000_000) == Decimal("22500.25")
+        assert refresher.convert_many([100_000_000]).amounts_usd == [Decimal("45000.50")]
+
+    @pytest.mark.asyncio
+    async def test_refresh_records_history(self):
+        history = InMemoryRateHistoryRepository()
+        refresher = RateRefresher(StubAsyncSource([Decimal("1"), Decimal("2")]), history=history)
+
+        first = await refresher.refresh_once()
+        await refresher.refresh_once()
+
+        assert history.count() == 2
+        assert history.rate_at(first.fetched_at) == Decimal("1")
+
+    @pytest.mark.asyncio
+    async def test_background_task_polls_on_interval(self):
+        source = StubAsyncSource([Decimal("1"), Decimal("2"), Decimal("3")])
+        refresher = RateRefresher(source, interval_seconds=0.01)
+
+        refresher.start()
+        await asyncio.sleep(0.1)
+        await refresher.stop()
+
+        assert source.calls >= 3
+        assert refresher.snapshot.rate == Decimal("3")
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_previous_snapshot(self):
+        source = StubAsyncSource([Decimal("45000"), ExchangeRateError("down")])
+        refresher = RateRefresher(source, interval_seconds=0.01)
+
+        refresher.start()
+        await asyncio.sleep(0.05)
+        await refresher.stop()
+
+        assert source.calls >= 2
+        assert refresher.get_btc_to_usd_rate() == Decimal("45000")
+
+    @pytest.mark.asyncio
+    async def test_failures_before_first_fetch_keep_it_not_ready(self):
+        source = StubAsyncSource([ExchangeRateError("down")])
+        refresher = RateRefresher(source, interval_seconds=0.01)
+
+        refresher.start()
+        await asyncio.sleep(0.05)
+        await refresher.stop()
+
+        assert source.calls >= 2
+        assert refresher.is_ready is False
+
+    @pytest.mark.asyncio
+    async def test_unexpected_errors_do_not_stop_the_loop(self):
+        class FailingHistory(InMemoryRateHistoryRepository):
+            def record(self, snapshot):
+                raise RuntimeError("history store down")
+
+        source = StubAsyncSource([Decimal("1"), Decimal("2"), Decimal("3")])
+        refresher = RateRefresher(source, interval_seconds=0.01, history=FailingHistory())
+
+        refresher.start()
+        await asyncio.sleep(0.05)
+        assert not refresher._task.done()
+        await refresher.stop()
+
+        assert source.calls >= 3
+        assert refresher.snapshot.rate == Decimal("3")
+
+    def test_snapshot_past_max_staleness_raises(self):
+        refresher = RateRefresher(StubAsyncSource([Decimal("1")]), max_staleness_seconds=60)
+        refresher.snapshot = RateSnapshot(
+            rate=Decimal("45000"),
+            fetched_at=datetime.now(UTC) - timedelta(seconds=61),
+            source="stub",
+        )
+
+        with pytest.raises(ExchangeRateError):
+            refresher.get_btc_to_usd_rate()
+        assert refresher.is_ready is False
+
+    def test_invalid_interval_raises(self):
+        with pytest.raises(ValueError):
+            RateRefresher(StubAsyncSource([Decimal("1")]), interval_seconds=0)
+
+
+def test_ready_endpoint_waits_for_first_fetch(app_session_factory, tmp_path):
+    app = create_app(
+        Settings(EXCHANGE_RATE_SHARED_FILE=tmp_path / "rate.bin"),
+        rate_source=StubAsyncSource([ExchangeRateError("down")]),
+        session_factory=app_session_factory,
+    )
+
+    with TestClient(app) as client:
+        assert client.get("/ready").status_code == 503
+
+        app.state.exchange_rate_refresher.snapshot = RateSnapshot.now(rate=Decimal("45000"), source="stub")
+
+        response = client.get("/ready")
+        assert response.status_code == 200
+        assert response.json() == {"status": "ready"}
+
+
+def test_ready_endpoint_reports_stale_rate(app_session_factory, tmp_path):
+    app = create_app(
+        Settings(EXCHANGE_RATE_MAX_STALENESS_SECONDS=60, EXCHANGE_RATE_SHARED_FILE=tmp_path / "rate.bin"),
+        rate_source=StubAsyncSource([ExchangeRateError("down")]),
+        session_factory=app_session_factory,
+    )
+
+    with TestClient(app) as client:
+        app.state.exchange_rate_refresher.snapshot = RateSnapshot(
+            rate=Decimal("45000"),
+            fetched_at=datetime.now(UTC) - timedelta(seconds=61),
+            source="stub",
+        )
+
+        response = client.get("/ready")
+        assert response.status_code == 503
+        assert response.json() == {"status": "exchange rate is stale"}
+
+
+def test_rate_history_survives_app_restart(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+
+    settings = Settings(EXCHANGE_RATE_SHARED_FILE=tmp_path / "rate.bin")
+
+    first = create_app(settings, rate_source=StubAsyncSource([Decimal("45000")]), session_factory=session_factory)
+    with TestClient(first):
+        deadline = time.monotonic() + 5
+        while first.state.rate_history.count() == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        recorded_at = first.state.exchange_rate_refresher.snapshot.fetched_at
+
+    restarted = create_app(
+        settings, rate_source=StubAsyncSource([ExchangeRateError("down")]), session_factory=session_factory
+    )
+    with TestClient(restarted):
+        assert restarted.state.rate_history.count() == 1
+        assert restarted.state.rate_history.rate_at(recorded_at) == Decimal("45000")
+    engine.dispose()
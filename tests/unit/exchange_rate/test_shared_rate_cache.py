@@ -0,0 +1,328 @@
+import multiprocessing
+import os
+import signal
+import time
+from datetime import datetime, timedelta, UTC
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.config import Settings
+from src.core.interfaces.exchange_rate import AsyncExchangeRateInterface, ExchangeRateInterface, ExchangeRateError
+from src.core.models.exchange_rate import RateSnapshot
+from src.core.services.exchange_rate_service import BaseAsyncExchangeRateService
+from src.infra.exchange_rate.shared_rate_cache import (
+    AsyncSharedMemoryExchangeRateClient,
+    SharedMemoryExchangeRateService,
+    SharedRateFile,
+    WriterLease,
+)
+from src.main import create_app
+
+T0 = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def make_provider(rate: str = "45000.50") -> Mock:
+    provider = Mock(spec=ExchangeRateInterface)
+    provider.get_rate_snapshot.side_effect = lambda: RateSnapshot.now(rate=Decimal(rate), source="coinbase")
+    return provider
+
+
+def hammer_writes(path, seconds):
+    shared = SharedRateFile(path)
+    deadline = time.monotonic() + seconds
+    i = 1
+    while time.monotonic() < deadline:
+        # rate always equals the timestamp, so a torn read is detectable
+        shared.write(RateSnapshot(rate=Decimal(i), fetched_at=T0 + timedelta(microseconds=i), source="w"))
+        i += 1
+        if i % 100 == 0:
+            time.sleep(0)
+    shared.close()
+
+
+class KillOnPack:
+    def pack_into(self, *args):
+        os.kill(os.getpid(), signal.SIGKILL)
+
+
+def die_mid_write(path):
+    lease = WriterLease(path.with_name(path.name + ".lock"))
+    lease.try_acquire()
+    shared = SharedRateFile(path)
+    # Killed after the sequence went odd and before it goes even again.
+    shared._PAYLOAD = KillOnPack()
+    shared.write(RateSnapshot(rate=Decimal("40000"), fetched_at=T0, source="w"))
+
+
+def kill_writer_mid_write(path):
+    writer = multiprocessing.get_context("fork").Process(target=die_mid_write, args=(path,))
+    writer.start()
+    writer.join()
+    assert writer.exitcode == -signal.SIGKILL
+
+
+class StubAsyncSource(BaseAsyncExchangeRateService):
+    def __init__(self, rate: str = "45000"):
+        self._rate = Decimal(rate)
+        self.calls = 0
+
+    async def get_btc_to_usd_rate(self) -> Decimal:
+        return (await self.get_rate_snapshot()).rate
+
+    async def get_rate_snapshot(self) -> RateSnapshot:
+        self.calls += 1
+        return RateSnapshot.now(rate=self._rate, source="stub", rates={"USD": self._rate})
+
+
+class TestSharedRateFile:
+
+    def test_empty_file_reads_none(self, tmp_path):
+        shared = SharedRateFile(tmp_path / "rate.bin")
+        assert shared.read() is None
+        shared.close()
+
+    def test_round_trip(self, tmp_path):
+        writer = SharedRateFile(tmp_path / "rate.bin")
+        reader = SharedRateFile(tmp_path / "rate.bin")
+        snapshot = RateSnapshot(rate=Decimal("45000.12345678"), fetched_at=T0, source="coinbase")
+
+        writer.write(snapshot)
+
+        assert reader.read() == snapshot
+        writer.close()
+        reader.close()
+
+    def test_round_trip_keeps_currency_table(self, tmp_path):
+        writer = SharedRateFile(tmp_path / "rate.bin")
+        reader = SharedRateFile(tmp_path / "rate.bin")
+        rates = {"USD": Decimal("45000"), "EUR": Decimal("41000.25"), "JPY": Decimal("6750000")}
+        snapshot = RateSnapshot(rate=Decimal("45000"), fetched_at=T0, source="coinbase", rates=rates)
+
+        assert writer.write(snapshot) == snapshot
+        assert reader.read() == snapshot
+        assert reader.read().rate_for("eur") == Decimal("41000.25")
+        writer.close()
+        reader.close()
+
+    def test_writer_returns_what_readers_see(self, tmp_path):
+        writer = SharedRateFile(tmp_path / "rate.bin")
+        reader = SharedRateFile(tmp_path / "rate.bin")
+        rates = {
+            "EUR": Decimal("41000.123456789"),
+            "LONGCODE1": Decimal("1"),
+            "HUGE": Decimal("1e12"),
+            "NAN": Decimal("NaN"),
+        }
+
+        stored = writer.write(RateSnapshot(rate=Decimal("45000"), fetched_at=T0, source="coinbase", rates=rates))
+
+        assert stored.rates == {"EUR": Decimal("41000.12345679")}
+        assert reader.read() == stored
+        writer.close()
+        reader.close()
+
+    def test_sequence_left_odd_reads_none(self, tmp_path):
+        path = tmp_path / "rate.bin"
+        kill_writer_mid_write(path)
+        reader = SharedRateFile(path)
+
+        assert SharedRateFile._SEQUENCE.unpack_from(reader._map, 0)[0] & 1
+        assert reader.read() is None
+        reader.close()
+
+    def test_reads_are_never_torn(self, tmp_path):
+        path = tmp_path / "rate.bin"
+        reader = SharedRateFile(path)
+        writer = multiprocessing.get_context("fork").Process(target=hammer_writes, args=(path, 0.3))
+        writer.start()
+
+        reads = 0
+        while writer.is_alive():
+            snapshot = reader.read()
+            if snapshot is not None:
+                assert snapshot.fetched_at == T0 + timedelta(microseconds=int(snapshot.rate))
+                reads += 1
+
+        writer.join()
+        reader.close()
+        assert reads > 0
+
+
+class TestSharedMemoryExchangeRateService:
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        return tmp_path / "shared" / "rate.bin"
+
+    def test_first_worker_is_elected_writer(self, path):
+        provider = make_provider()
+        leader = SharedMemoryExchangeRateService(provider, path)
+        follower = SharedMemoryExchangeRateService(make_provider(), path)
+
+        assert leader.get_btc_to_usd_rate() == Decimal("45000.50")
+        assert follower.get_btc_to_usd_rate() == Decimal("45000.50")
+
+        assert leader.is_writer
+        assert not follower.is_writer
+        assert follower._provider.get_rate_snapshot.call_count == 0
+        leader.close()
+        follower.close()
+
+    def test_fresh_snapshot_is_not_refetched(self, path):
+        provider = make_provider()
+        service = SharedMemoryExchangeRateService(provider, path)
+
+        service.get_btc_to_usd_rate()
+        service.satoshis_to_usd(100)
+        service.convert_many([1, 2, 3])
+
+        assert provider.get_rate_snapshot.call_count == 1
+        service.close()
+
+    def test_follower_without_snapshot_raises(self, path):
+        leader = SharedMemoryExchangeRateService(make_provider(), path)
+        leader._lease.try_acquire()
+        follower = SharedMemoryExchangeRateService(make_provider(), path)
+
+        with pytest.raises(ExchangeRateError, match="not available"):
+            follower.get_btc_to_usd_rate()
+        leader.close()
+        follower.close()
+
+    def test_follower_serves_stale_until_max_staleness(self, path):
+        now = [T0]
+        writer = SharedRateFile(path)
+        writer.write(RateSnapshot(rate=Decimal("40000"), fetched_at=T0, source="coinbase"))
+        leader = SharedMemoryExchangeRateService(make_provider(), path)
+        leader._lease.try_acquire()
+        follower = SharedMemoryExchangeRateService(
+            make_provider(), path, ttl_seconds=10, max_staleness_seconds=60, clock=lambda: now[0]
+        )
+
+        now[0] = T0 + timedelta(seconds=30)
+        assert follower.get_btc_to_usd_rate() == Decimal("40000")
+
+        now[0] = T0 + timedelta(seconds=61)
+        with pytest.raises(ExchangeRateError):
+            follower.get_btc_to_usd_rate()
+
+        writer.close()
+        leader.close()
+        follower.close()
+
+    def test_follower_takes_over_when_writer_goes_away(self, path):
+        leader = SharedMemoryExchangeRateService(make_provider("40000"), path)
+        leader.get_btc_to_usd_rate()
+        leader.close()
+
+        follower = SharedMemoryExchangeRateService(make_provider("41000"), path, ttl_seconds=0, max_staleness_seconds=0)
+
+        assert follower.get_btc_to_usd_rate() == Decimal("41000")
+        assert follower.is_writer
+        follower.close()
+
+    def test_next_writer_recovers_from_writer_killed_mid_write(self, path):
+        kill_writer_mid_write(path)
+        service = SharedMemoryExchangeRateService(make_provider("41000"), path)
+        follower = SharedMemoryExchangeRateService(make_provider(), path)
+
+        assert service.get_btc_to_usd_rate() == Decimal("41000")
+        assert service.is_writer
+        assert follower.get_btc_to_usd_rate() == Decimal("41000")
+        service.close()
+        follower.close()
+
+    def test_follower_of_writer_killed_mid_write_reports_no_snapshot(self, path):
+        kill_writer_mid_write(path)
+        leader = SharedMemoryExchangeRateService(make_provider(), path)
+        leader._lease.try_acquire()
+        follower = SharedMemoryExchangeRateService(make_provider(), path)
+
+        with pytest.raises(ExchangeRateError, match="not available"):
+            follower.get_btc_to_usd_rate()
+        leader.close()
+        follower.close()
+
+    def test_every_worker_converts_other_currencies(self, path):
+        provider = Mock(spec=ExchangeRateInterface)
+        provider.get_rate_snapshot.side_effect = lambda: RateSnapshot.now(
+            rate=Decimal("45000"), source="coinbase", rates={"USD": Decimal("45000"), "EUR": Decimal("41000")}
+        )
+        leader = SharedMemoryExchangeRateService(provider, path)
+        follower = SharedMemoryExchangeRateService(make_provider(), path)
+
+        assert leader.satoshis_to("EUR", 50_000_000) == Decimal("20500")
+        assert follower.satoshis_to("EUR", 50_000_000) == Decimal("20500")
+        with pytest.raises(ValueError):
+            follower.satoshis_to("GBP", 1)
+        leader.close()
+        follower.close()
+
+    def test_writer_failure_serves_stale_snapshot(self, path):
+        provider = make_provider()
+        now = [datetime.now(UTC)]
+        service = SharedMemoryExchangeRateService(
+            provider, path, ttl_seconds=10, max_staleness_seconds=60, clock=lambda: now[0]
+        )
+        service.get_btc_to_usd_rate()
+
+        provider.get_rate_snapshot.side_effect = ExchangeRateError("down")
+        now[0] += timedelta(seconds=30)
+
+        assert service.get_btc_to_usd_rate() == Decimal("45000.50")
+        service.close()
+
+
+class TestAsyncSharedMemoryExchangeRateClient:
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        return tmp_path / "rate.bin"
+
+    @pytest.mark.asyncio
+    async def test_only_the_writer_calls_the_upstream(self, path):
+        leader_source, follower_source = StubAsyncSource("45000"), StubAsyncSource("1")
+        leader = AsyncSharedMemoryExchangeRateClient(leader_source, path)
+        follower = AsyncSharedMemoryExchangeRateClient(follower_source, path)
+
+        assert await leader.get_btc_to_usd_rate() == Decimal("45000")
+        assert await follower.get_btc_to_usd_rate() == Decimal("45000")
+        assert await follower.satoshis_to("usd", 100_000_000) == Decimal("45000")
+
+        assert (leader_source.calls, follower_source.calls) == (1, 0)
+        leader.close()
+        follower.close()
+
+    @pytest.mark.asyncio
+    async def test_writer_failure_without_snapshot_raises(self, path):
+        source = Mock(spec=AsyncExchangeRateInterface)
+        source.get_rate_snapshot.side_effect = ExchangeRateError("down")
+        client = AsyncSharedMemoryExchangeRateClient(source, path)
+
+        with pytest.raises(ExchangeRateError, match="down"):
+            await client.get_rate_snapshot()
+        client.close()
+
+
+def wait_for_snapshot(app):
+    deadline = time.monotonic() + 5
+    while app.state.exchange_rate_refresher.snapshot is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return app.state.exchange_rate_refresher.snapshot
+
+
+def test_app_workers_share_one_upstream_poller(tmp_path, app_session_factory):
+    settings = Settings(EXCHANGE_RATE_SHARED_FILE=tmp_path / "rate.bin")
+    sources = [StubAsyncSource("45000"), StubAsyncSource("1")]
+    apps = [create_app(settings, rate_source=source, session_factory=app_session_factory) for source in sources]
+
+    with TestClient(apps[0]):
+        leader_snapshot = wait_for_snapshot(apps[0])
+        with TestClient(apps[1]):
+            follower_snapshot = wait_for_snapshot(apps[1])
+
+    assert leader_snapshot is not None and follower_snapshot == leader_snapshot
+    assert (sources[0].calls, sources[1].calls) == (1, 0)
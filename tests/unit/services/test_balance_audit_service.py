@@ -0,0 +1,135 @@
+from datetime import datetime, timedelta, UTC
+from typing import Optional
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.core.constants import INITIAL_BALANCE_SATOSHIS
+from src.core.models.user import User
+from src.core.models.wallet import Wallet
+from src.core.services.balance_audit_service import BalanceAuditService
+from src.core.services.transfer_service import TransferService
+from src.core.services.wallet_service import WalletNotFoundError, WalletService
+from src.infra.database.models import Base
+from src.infra.database.sqlalchemy_uow import SQLAlchemyUnitOfWork
+from src.infra.repositories.transaction_repository import SQLAlchemyTransactionRepository
+from src.infra.repositories.user_repository import SQLAlchemyUserRepository
+from src.infra.repositories.wallet_adjustment_repository import SQLAlchemyWalletAdjustmentRepository
+from src.infra.repositories.wallet_checkpoint_repository import SQLAlchemyWalletCheckpointRepository
+from src.infra.repositories.wallet_repository import SQLAlchemyWalletRepository
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def wallets(session):
+    users = SQLAlchemyUserRepository(session)
+    repo = SQLAlchemyWalletRepository(session)
+    alice, bob = User.create(api_key="key-1"), User.create(api_key="key-2")
+    users.save(alice)
+    users.save(bob)
+    created = Wallet.create(alice.id), Wallet.create(bob.id)
+    for wallet in created:
+        repo.save(wallet)
+    session.commit()
+    return created
+
+
+def make_service(session, now: Optional[datetime] = None) -> BalanceAuditService:
+    now = now or datetime.now(UTC) + timedelta(hours=1)
+    return BalanceAuditService(
+        uow=SQLAlchemyUnitOfWork(session),
+        wallet_repository=SQLAlchemyWalletRepository(session),
+        checkpoint_repository=SQLAlchemyWalletCheckpointRepository(session),
+        adjustment_repository=SQLAlchemyWalletAdjustmentRepository(session),
+        clock=lambda: now,
+    )
+
+
+def transfer(session, sender: Wallet, recipient: Wallet, amount: int) -> None:
+    TransferService(
+        uow=SQLAlchemyUnitOfWork(session),
+        wallet_repository=SQLAlchemyWalletRepository(session),
+        transaction_repository=SQLAlchemyTransactionRepository(session),
+    ).transfer(user_id=sender.user_id, from_address=sender.address, to_address=recipient.address, amount_satoshis=amount)
+
+
+class TestBalanceAuditService:
+
+    def test_new_wallet_is_consistent(self, session, wallets):
+        audit = make_service(session).audit_wallet(wallets[0].address)
+
+        assert audit.verified_satoshis == INITIAL_BALANCE_SATOSHIS
+        assert audit.is_consistent
+
+    def test_transfers_are_verified_before_and_after_checkpointing(self, session, wallets):
+        alice, bob = wallets
+        for _ in range(3):
+            transfer(session, alice, bob, 1000)
+        transfer(session, bob, alice, 500)
+        service = make_service(session)
+
+        assert service.audit_wallet(alice.address).is_consistent
+
+        assert service.advance_checkpoints(batch_size=2) == 4
+        assert SQLAlchemyWalletCheckpointRepository(session).get(alice.address) is not None
+
+        transfer(session, alice, bob, 250)
+        for wallet in wallets:
+            audit = service.audit_wallet(wallet.address)
+            assert audit.is_consistent, audit
+
+    def test_deposits_and_withdrawals_are_verified(self, session, wallets):
+        alice, bob = wallets
+        wallet_service = WalletService(
+            SQLAlchemyWalletRepository(session),
+            SQLAlchemyWalletAdjustmentRepository(session),
+        )
+        wallet_service.deposit(user_id=alice.user_id, address=alice.address, amount_satoshis=5000)
+        session.commit()
+        transfer(session, alice, bob, 1000)
+        service = make_service(session)
+        service.advance_checkpoints()
+        wallet_service.withdraw(user_id=alice.user_id, address=alice.address, amount_satoshis=700)
+        session.commit()
+
+        for wallet in wallets:
+            audit = service.audit_wallet(wallet.address)
+            assert audit.is_consistent, audit
+        assert service.audit_wallet(alice.address).stored_satoshis == INITIAL_BALANCE_SATOSHIS + 5000 - 1000 - 700
+
+    def test_direct_balance_change_shows_as_drift(self, session, wallets):
+        alice, _ = wallets
+        repo = SQLAlchemyWalletRepository(session)
+        repo.credit(alice.address, 42)
+        session.commit()
+
+        audit = make_service(session).audit_wallet(alice.address)
+
+        assert not audit.is_consistent
+        assert audit.stored_satoshis - audit.verified_satoshis == 42
+
+    def test_advance_stops_after_max_batches(self, session, wallets):
+        alice, bob = wallets
+        for _ in range(5):
+            transfer(session, alice, bob, 100)
+
+        assert make_service(session).advance_checkpoints(batch_size=2, max_batches=1) == 2
+
+    def test_recent_transactions_are_not_checkpointed(self, session, wallets):
+        alice, bob = wallets
+        transfer(session, alice, bob, 100)
+
+        assert make_service(session, now=datetime.now(UTC)).advance_checkpoints(settle_seconds=60) == 0
+
+    def test_unknown_wallet(self, session):
+        with pytest.raises(WalletNotFoundError):
+            make_service(session).audit_wallet("missing")
@@ -0,0 +1,153 @@
+import threading
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.interfaces.exchange_rate import ExchangeRateInterface, ExchangeRateError
+from src.core.models.exchange_rate import RateSnapshot
+from src.core.services.cached_exchange_rate_service import CachedExchangeRateService
+
+
+def snapshot(rate: str) -> RateSnapshot:
+    return RateSnapshot.now(rate=Decimal(rate), source="stub", rates={"USD": Decimal(rate), "EUR": Decimal("41000")})
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class TestCachedExchangeRateService:
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def provider(self):
+        provider = Mock(spec=ExchangeRateInterface)
+        provider.get_rate_snapshot.return_value = snapshot("45000.50")
+        return provider
+
+    @pytest.fixture
+    def service(self, provider, clock):
+        return CachedExchangeRateService(provider, ttl_seconds=10, max_staleness_seconds=60, clock=clock)
+
+    def wait_for_refresh(self, service):
+        if service._refresh_thread is not None:
+            service._refresh_thread.join(timeout=5)
+
+    def test_first_call_fetches_from_provider(self, service, provider):
+        assert service.get_btc_to_usd_rate() == Decimal("45000.50")
+        provider.get_rate_snapshot.assert_called_once()
+
+    def test_fresh_rate_is_served_from_cache(self, service, provider, clock):
+        service.get_btc_to_usd_rate()
+        clock.advance(9)
+        service.get_btc_to_usd_rate()
+        service.satoshis_to_usd(100_000_000)
+
+        provider.get_rate_snapshot.assert_called_once()
+
+    def test_stale_rate_is_served_while_refreshing(self, service, provider, clock):
+        service.get_btc_to_usd_rate()
+        provider.get_rate_snapshot.return_value = snapshot("46000")
+        clock.advance(11)
+
+        assert service.get_btc_to_usd_rate() == Decimal("45000.50")
+        self.wait_for_refresh(service)
+
+        assert service.get_btc_to_usd_rate() == Decimal("46000")
+        assert provider.get_rate_snapshot.call_count == 2
+
+    def test_only_one_background_refresh_runs(self, provider, clock):
+        release = threading.Event()
+        service = CachedExchangeRateService(provider, ttl_seconds=10, max_staleness_seconds=60, clock=clock)
+        service.get_btc_to_usd_rate()
+
+        def slow_fetch():
+            release.wait(timeout=5)
+            return snapshot("46000")
+
+        provider.get_rate_snapshot.side_effect = slow_fetch
+        clock.advance(11)
+
+        for _ in range(20):
+            assert service.get_btc_to_usd_rate() == Decimal("45000.50")
+
+        release.set()
+        self.wait_for_refresh(service)
+
+        assert provider.get_rate_snapshot.call_count == 2
+
+    def test_failed_background_refresh_keeps_stale_rate(self, service, provider, clock):
+        service.get_btc_to_usd_rate()
+        provider.get_rate_snapshot.side_effect = ExchangeRateError("upstream down")
+        clock.advance(11)
+
+        assert service.get_btc_to_usd_rate() == Decimal("45000.50")
+        self.wait_for_refresh(service)
+
+        assert service.get_btc_to_usd_rate() == Decimal("45000.50")
+        assert isinstance(service.last_refresh_error, ExchangeRateError)
+
+    def test_past_max_staleness_refreshes_synchronously(self, service, provider, clock):
+        service.get_btc_to_usd_rate()
+        provider.get_rate_snapshot.return_value = snapshot("47000")
+        clock.advance(61)
+
+        assert service.get_btc_to_usd_rate() == Decimal("47000")
+
+    def test_past_max_staleness_raises_when_refresh_fails(self, service, provider, clock):
+        service.get_btc_to_usd_rate()
+        provider.get_rate_snapshot.side_effect = ExchangeRateError("upstream down")
+        clock.advance(61)
+
+        with pytest.raises(ExchangeRateError, match="max staleness"):
+            service.get_btc_to_usd_rate()
+
+    def test_cold_cache_failure_raises(self, service, provider):
+        provider.get_rate_snapshot.side_effect = ExchangeRateError("upstream down")
+
+        with pytest.raises(ExchangeRateError):
+            service.get_btc_to_usd_rate()
+
+    def test_conversions_use_cached_rate(self, service):
+        assert service.satoshis_to_usd(50_000_000) == Decimal("22500.25")
+        assert service.btc_to_usd(Decimal("2")) == Decimal("90001.00")
+
+    def test_invalidate_forces_refetch(self, service, provider):
+        service.get_btc_to_usd_rate()
+        service.invalidate()
+        service.get_btc_to_usd_rate()
+
+        assert provider.get_rate_snapshot.call_count == 2
+
+    def test_snapshot_records_source(self, service, provider):
+        snapshot = service.get_rate_snapshot()
+        assert snapshot.rate == Decimal("45000.50")
+        assert snapshot.source == "stub"
+
+    def test_rate_table_is_cached_with_the_snapshot(self, service, provider):
+        assert service.satoshis_to("EUR", 100_000_000) == Decimal("41000")
+        assert service.satoshis_to("usd", 50_000_000) == Decimal("22500.25")
+        provider.get_rate_snapshot.assert_called_once()
+
+    def test_convert_many_uses_one_cached_rate(self, service, provider):
+        batch = service.convert_many([100_000_000, 50_000_000, 0])
+
+        assert batch.amounts_usd == [Decimal("45000.50"), Decimal("22500.25"), Decimal("0")]
+        assert batch.rate == Decimal("45000.50")
+        provider.get_rate_snapshot.assert_called_once()
+
+    @pytest.mark.parametrize("ttl, max_staleness", [(0, 10), (-1, 10), (10, 5)])
+    def test_invalid_configuration_raises(self, provider, ttl, max_staleness):
+        with pytest.raises(ValueError):
+            CachedExchangeRateService(provider, ttl_seconds=ttl, max_staleness_seconds=max_staleness)
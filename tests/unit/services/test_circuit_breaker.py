@@ -0,0 +1,243 @@
+import asyncio
+import time
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.config import Settings
+from src.core.interfaces.exchange_rate import AsyncExchangeRateInterface, ExchangeRateInterface, ExchangeRateError
+from src.core.models.exchange_rate import RateSnapshot
+from src.core.services.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from src.core.services.circuit_breaker_exchange_rate_service import (
+    AsyncCircuitBreakerExchangeRateClient,
+    CircuitBreakerExchangeRateService,
+)
+from src.main import create_app
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def breaker(self, clock):
+        return CircuitBreaker(window_size=10, min_calls=4, failure_rate_threshold=0.5, open_seconds=30, clock=clock)
+
+    def trip(self, breaker):
+        for _ in range(4):
+            breaker.before_call()
+            breaker.record_failure(0.01)
+
+    def test_starts_closed(self, breaker):
+        assert breaker.state == CircuitState.CLOSED
+        breaker.before_call()
+
+    def test_opens_when_failure_rate_reached(self, breaker):
+        self.trip(breaker)
+
+        assert breaker.state == CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_stays_closed_below_min_calls(self, breaker):
+        for _ in range(3):
+            breaker.record_failure(0.01)
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_stays_closed_below_failure_rate(self, breaker):
+        for _ in range(3):
+            breaker.record_success(0.01)
+        breaker.record_failure(0.01)
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_opens_on_slow_calls(self, clock):
+        breaker = CircuitBreaker(min_calls=2, slow_call_seconds=1.0, slow_call_rate_threshold=1.0, clock=clock)
+        breaker.record_success(1.5)
+        breaker.record_success(2.0)
+
+        assert breaker.state == CircuitState.OPEN
+
+    def test_half_opens_after_cooldown(self, breaker, clock):
+        self.trip(breaker)
+        clock.now = 30
+
+        assert breaker.state == CircuitState.HALF_OPEN
+
+    def test_half_open_allows_single_probe(self, breaker, clock):
+        self.trip(breaker)
+        clock.now = 30
+
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError, match="probe"):
+            breaker.before_call()
+
+    def test_successful_probe_closes(self, breaker, clock):
+        self.trip(breaker)
+        clock.now = 30
+        breaker.before_call()
+        breaker.record_success(0.01)
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.stats().window_failure_rate == 0.0
+
+    def test_failed_probe_reopens(self, breaker, clock):
+        self.trip(breaker)
+        clock.now = 30
+        breaker.before_call()
+        breaker.record_failure(0.01)
+
+        assert breaker.state == CircuitState.OPEN
+        clock.now = 59
+        assert breaker.state == CircuitState.OPEN
+
+    def test_stats_and_listeners(self, breaker, clock):
+        transitions = []
+        breaker.add_listener(lambda old, new: transitions.append((old, new, breaker.stats().state)))
+
+        self.trip(breaker)
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        stats = breaker.stats()
+        assert stats.state == CircuitState.OPEN
+        assert stats.total_calls == 4
+        assert stats.failed_calls == 4
+        assert stats.rejected_calls == 1
+        assert stats.state_changes == 1
+        assert transitions == [(CircuitState.CLOSED, CircuitState.OPEN, CircuitState.OPEN)]
+
+    def test_invalid_configuration_raises(self):
+        with pytest.raises(ValueError):
+            CircuitBreaker(window_size=3, min_calls=5)
+
+
+class TestCircuitBreakerExchangeRateService:
+
+    @pytest.fixture
+    def provider(self):
+        provider = Mock(spec=ExchangeRateInterface)
+        provider.get_rate_snapshot.return_value = RateSnapshot.now(rate=Decimal("45000.50"), source="stub")
+        return provider
+
+    def test_passes_rates_through(self, provider):
+        service = CircuitBreakerExchangeRateService(provider)
+
+        assert service.get_btc_to_usd_rate() == Decimal("45000.50")
+        assert service.satoshis_to_usd(50_000_000) == Decimal("22500.25")
+        assert service.breaker.stats().successful_calls == 2
+
+    def test_open_breaker_fails_fast(self, provider):
+        def slow_failure():
+            time.sleep(0.05)
+            raise ExchangeRateError("timeout")
+
+        provider.get_rate_snapshot.side_effect = slow_failure
+        service = CircuitBreakerExchangeRateService(provider, CircuitBreaker(min_calls=2, window_size=2))
+
+        for _ in range(2):
+            with pytest.raises(ExchangeRateError):
+                service.get_btc_to_usd_rate()
+
+        started = time.monotonic()
+        with pytest.raises(CircuitOpenError):
+            service.satoshis_to_usd(100)
+        assert time.monotonic() - started < 0.01
+        assert provider.get_rate_snapshot.call_count == 2
+
+    def test_unexpected_error_is_recorded_as_failure(self, provider):
+        clock = FakeClock()
+        breaker = CircuitBreaker(min_calls=1, window_size=1, open_seconds=30, clock=clock)
+        service = CircuitBreakerExchangeRateService(provider, breaker)
+        provider.get_rate_snapshot.side_effect = RuntimeError("bad payload")
+
+        with pytest.raises(RuntimeError):
+            service.get_btc_to_usd_rate()
+        assert breaker.state == CircuitState.OPEN
+
+        clock.now = 31
+        with pytest.raises(RuntimeError):
+            service.get_btc_to_usd_rate()
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.stats().failed_calls == 2
+
+    def test_calls_are_timed_with_the_breaker_clock(self, provider):
+        clock = FakeClock()
+        snapshot = provider.get_rate_snapshot.return_value
+
+        def slow_answer():
+            clock.now += 5
+            return snapshot
+
+        provider.get_rate_snapshot.side_effect = slow_answer
+        service = CircuitBreakerExchangeRateService(provider, CircuitBreaker(slow_call_seconds=2, clock=clock))
+
+        service.get_btc_to_usd_rate()
+
+        assert service.breaker.stats().slow_calls == 1
+
+
+class TestAsyncCircuitBreakerExchangeRateClient:
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_releases_half_open_slot(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(min_calls=1, window_size=1, open_seconds=30, clock=clock)
+        breaker.before_call()
+        breaker.record_failure(0.01)
+        clock.now = 31
+
+        started = asyncio.Event()
+        client = Mock(spec=AsyncExchangeRateInterface)
+
+        async def hang():
+            started.set()
+            await asyncio.Event().wait()
+
+        client.get_rate_snapshot.side_effect = hang
+        service = AsyncCircuitBreakerExchangeRateClient(client, breaker)
+
+        probe = asyncio.create_task(service.get_rate_snapshot())
+        await started.wait()
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.stats().failed_calls == 1
+
+        async def answer():
+            return RateSnapshot.now(rate=Decimal("45000"), source="stub")
+
+        client.get_rate_snapshot.side_effect = answer
+        assert (await service.get_rate_snapshot()).rate == Decimal("45000")
+        assert breaker.state == CircuitState.CLOSED
+
+
+def test_exchange_rate_health_endpoint_reports_circuit(app_session_factory, tmp_path):
+    source = Mock(spec=AsyncExchangeRateInterface)
+    source.get_rate_snapshot.side_effect = ExchangeRateError("down")
+    app = create_app(
+        Settings(EXCHANGE_RATE_SHARED_FILE=tmp_path / "rate.bin"),
+        rate_source=source,
+        session_factory=app_session_factory,
+    )
+
+    with TestClient(app) as client:
+        body = client.get("/health/exchange-rate").json()
+
+    assert body["circuit"]["state"] in {"closed", "open"}
+    assert "rejected_calls" in body["circuit"]
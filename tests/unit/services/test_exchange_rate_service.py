@@ -1,7 +1,7 @@
 import pytest
 from decimal import Decimal
 from unittest.mock import Mock, patch
-import requests
+import httpx
 
 from src.core.services.exchange_rate_service import ExchangeRateService
 from src.core.interfaces.exchange_rate import ExchangeRateError
@@ -27,7 +27,7 @@ class TestExchangeRateService:
         mock_resp.raise_for_status = Mock()
         return mock_resp
 
-    @patch('requests.get')
+    @patch('httpx.get')
     def test_get_btc_to_usd_rate_success(self, mock_get, service, mock_api_response):
         mock_get.return_value = mock_api_response
         rate = service.get_btc_to_usd_rate()
@@ -36,7 +36,7 @@ class TestExchangeRateService:
         assert isinstance(rate, Decimal)
         mock_get.assert_called_once()
 
-    @patch('requests.get')
+    @patch('httpx.get')
     def test_get_btc_to_usd_rate_uses_correct_url(self, mock_get, service, mock_api_response):
         mock_get.return_value = mock_api_response
         service.get_btc_to_usd_rate()
@@ -46,21 +46,21 @@ class TestExchangeRateService:
         assert "BTC" in call_args[0][0]
         assert call_args[1]['timeout'] == 5
 
-    @patch('requests.get')
+    @patch('httpx.get')
     def test_api_timeout_raises_error(self, mock_get, service):
-        mock_get.side_effect = requests.Timeout("Timeout")
+        mock_get.side_effect = httpx.ReadTimeout("Timeout")
 
         with pytest.raises(ExchangeRateError):
             service.get_btc_to_usd_rate()
 
-    @patch('requests.get')
+    @patch('httpx.get')
     def test_api_http_error_raises_error(self, mock_get, service):
-        mock_get.side_effect = requests.HTTPError("500 Error")
+        mock_get.side_effect = httpx.HTTPStatusError("500 Error", request=Mock(), response=Mock())
 
         with pytest.raises(ExchangeRateError):
             service.get_btc_to_usd_rate()
 
-    @patch('requests.get')
+    @patch('httpx.get')
     def test_invalid_json_raises_error(self, mock_get, service):
         mock_resp = Mock()
         mock_resp.json.return_value = {'invalid': 'format'}
@@ -70,21 +70,21 @@ class TestExchangeRateService:
         with pytest.raises(ExchangeRateError):
             service.get_btc_to_usd_rate()
 
-    @patch('requests.get')
+    @patch('httpx.get')
     def test_satoshis_to_usd_correct_conversion(self, mock_get, service, mock_api_response):
         mock_get.return_value = mock_api_response
         usd = service.satoshis_to_usd(100_000_000)
 
         assert usd == Decimal('45000.50')
 
-    @patch('requests.get')
+    @patch('httpx.get')
     def test_satoshis_to_usd_fractional_btc(self, mock_get, service, mock_api_response):
         mock_get.return_value = mock_api_response
         usd = service.satoshis_to_usd(50_000_000)
 
         assert usd == Decimal('22500.25')
 
-    @patch('requests.get')
+    @patch('httpx.get')
     def test_satoshis_to_usd_zero(self, mock_get, service, mock_api_response):
         mock_get.return_value = mock_api_response
         assert service.satoshis_to_usd(0) == Decimal('0')
@@ -93,21 +93,21 @@ class TestExchangeRateService:
         with pytest.raises(ValueError, match="cannot be negative"):
             service.satoshis_to_usd(-1000)
 
-    @patch('requests.get')
+    @patch('httpx.get')
     def test_btc_to_usd_correct_conversion(self, mock_get, service, mock_api_response):
         mock_get.return_value = mock_api_response
         usd = service.btc_to_usd(Decimal('1.0'))
 
         assert usd == Decimal('45000.50')
 
-    @patch('requests.get')
+    @patch('httpx.get')
     def test_btc_to_usd_fractional_amounts(self, mock_get, service, mock_api_response):
         mock_get.return_value = mock_api_response
         usd = service.btc_to_usd(Decimal('0.5'))
 
         assert usd == Decimal('22500.25')
 
-    @patch('requests.get')
+    @patch('httpx.get')
     def test_btc_to_usd_zero(self, mock_get, service, mock_api_response):
         mock_get.return_value = mock_api_response
         assert service.btc_to_usd(Decimal('0')) == Decimal('0')
@@ -116,7 +116,7 @@ class TestExchangeRateService:
         with pytest.raises(ValueError, match="cannot be negative"):
             service.btc_to_usd(Decimal('-1.0'))
 
-    @patch('requests.get')
+    @patch('httpx.get')
     def test_decimal_precision_maintained(self, mock_get, service):
         mock_resp = Mock()
         mock_resp.json.return_value = {
@@ -131,4 +131,136 @@ class TestExchangeRateService:
         mock_get.return_value = mock_resp
 
         rate = service.get_btc_to_usd_rate()
-        assert rate == Decimal('45000.123456')
\ No newline at end of file
+        assert rate == Decimal('45000.123456')
+
+    @patch('httpx.get')
+    def test_convert_many_fetches_rate_once(self, mock_get, service, mock_api_response):
+        mock_get.return_value = mock_api_response
+        batch = service.convert_many([100_000_000, 50_000_000, 1, 0])
+
+        assert batch.amounts_usd == [
+            Decimal('45000.50'),
+            Decimal('22500.25'),
+            Decimal('0.0004500050'),
+            Decimal('0'),
+        ]
+        assert batch.rate == Decimal('45000.50')
+        assert batch.fetched_at is not None
+        mock_get.assert_called_once()
+
+    @patch('httpx.get')
+    def test_convert_many_matches_satoshis_to_usd(self, mock_get, service, mock_api_response):
+        mock_get.return_value = mock_api_response
+        amounts = [1, 7, 12_345, 99_999_999, 2_100_000_000_000_000]
+
+        batch = service.convert_many(amounts)
+
+        assert batch.amounts_usd == [service.satoshis_to_usd(a) for a in amounts]
+
+    @patch('httpx.get')
+    def test_convert_many_empty(self, mock_get, service, mock_api_response):
+        mock_get.return_value = mock_api_response
+        assert service.convert_many([]).amounts_usd == []
+
+    @patch('httpx.get')
+    def test_convert_many_negative_raises_error(self, mock_get, service, mock_api_response):
+        mock_get.return_value = mock_api_response
+        with pytest.raises(ValueError, match="cannot be negative"):
+            service.convert_many([100, -1])
+
+    @pytest.fixture
+    def mock_rate_table_response(self):
+        mock_resp = Mock()
+        mock_resp.json.return_value = {
+            'data': {
+                'currency': 'BTC',
+                'rates': {
+                    'USD': '45000.50',
+                    'EUR': '41000.25',
+                    'GBP': '35000',
+                    'XYZ': 'not-a-number',
+                }
+            }
+        }
+        mock_resp.raise_for_status = Mock()
+        return mock_resp
+
+    @patch('httpx.get')
+    def test_satoshis_to_other_currency(self, mock_get, service, mock_rate_table_response):
+        mock_get.return_value = mock_rate_table_response
+
+        assert service.satoshis_to('EUR', 50_000_000) == Decimal('20500.125')
+        assert service.satoshis_to('usd', 100_000_000) == Decimal('45000.50')
+
+    @patch('httpx.get')
+    def test_convert_many_to_fetches_table_once(self, mock_get, service, mock_rate_table_response):
+        mock_get.return_value = mock_rate_table_response
+        batch = service.convert_many_to('GBP', [100_000_000, 1, 0])
+
+        assert batch.currency == 'GBP'
+        assert batch.amounts == [Decimal('35000'), Decimal('0.00035'), Decimal('0')]
+        assert batch.rate == Decimal('35000')
+        assert batch.snapshot.rates['EUR'] == Decimal('41000.25')
+        mock_get.assert_called_once()
+
+    @patch('httpx.get')
+    def test_unparsable_table_entries_are_skipped(self, mock_get, service, mock_rate_table_response):
+        mock_get.return_value = mock_rate_table_response
+        snapshot = service.get_rate_snapshot()
+
+        assert 'XYZ' not in snapshot.rates
+        assert snapshot.rate == Decimal('45000.50')
+
+    @patch('httpx.get')
+    def test_non_finite_and_non_positive_entries_are_skipped(self, mock_get, service):
+        mock_resp = Mock()
+        mock_resp.json.return_value = {
+            'data': {
+                'currency': 'BTC',
+                'rates': {'USD': '45000', 'EUR': 'NaN', 'GBP': 'Infinity', 'JPY': '-1', 'CHF': '0', 'CAD': '61000'}
+            }
+        }
+        mock_get.return_value = mock_resp
+
+        snapshot = service.get_rate_snapshot()
+
+        assert snapshot.rates == {'USD': Decimal('45000'), 'CAD': Decimal('61000')}
+
+    @patch('httpx.get')
+    def test_non_finite_usd_rate_raises_error(self, mock_get, service):
+        mock_resp = Mock()
+        mock_resp.json.return_value = {'data': {'currency': 'BTC', 'rates': {'USD': 'NaN', 'EUR': '41000'}}}
+        mock_get.return_value = mock_resp
+
+        with pytest.raises(ExchangeRateError):
+            service.get_rate_snapshot()
+
+    @patch('httpx.get')
+    def test_unknown_currency_raises_error(self, mock_get, service, mock_rate_table_response):
+        mock_get.return_value = mock_rate_table_response
+
+        with pytest.raises(ValueError, match="No BTC rate"):
+            service.satoshis_to('JPY', 1000)
+
+    @patch('httpx.get')
+    def test_convert_many_to_negative_raises_error(self, mock_get, service, mock_rate_table_response):
+        mock_get.return_value = mock_rate_table_response
+
+        with pytest.raises(ValueError, match="cannot be negative"):
+            service.convert_many_to('EUR', [100, -1])
+
+    def test_injected_client_is_used(self):
+        def handler(request):
+            return httpx.Response(200, json={'data': {'currency': 'BTC', 'rates': {'USD': '45000.50'}}})
+
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            service = ExchangeRateService(client=client)
+
+            assert service.get_btc_to_usd_rate() == Decimal('45000.50')
+
+    def test_injected_client_status_error_raises_error(self):
+        with httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(503))) as client:
+            service = ExchangeRateService(client=client)
+
+            with pytest.raises(ExchangeRateError):
+                service.get_btc_to_usd_rate()
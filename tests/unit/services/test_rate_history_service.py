@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta, UTC
+from decimal import Decimal
+
+from src.core.models.exchange_rate import RateSnapshot
+from src.core.models.transaction import Transaction
+from src.core.services.rate_history_service import RateHistoryService
+from src.infra.repositories.rate_history_repository import InMemoryRateHistoryRepository
+
+T0 = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def make_transaction(minutes: int, amount: int) -> Transaction:
+    transaction = Transaction.create("wallet-1", "wallet-2", amount, False)
+    transaction.created_at = T0 + timedelta(minutes=minutes)
+    return transaction
+
+
+class TestRateHistoryService:
+
+    def setup_method(self):
+        self.repo = InMemoryRateHistoryRepository()
+        self.service = RateHistoryService(self.repo)
+        self.service.record(RateSnapshot(rate=Decimal("40000"), fetched_at=T0, source="test"))
+        self.service.record(RateSnapshot(rate=Decimal("50000"), fetched_at=T0 + timedelta(hours=1), source="test"))
+
+    def test_values_transactions_at_historical_rate(self):
+        early = make_transaction(30, 100_000_000)
+        late = make_transaction(90, 50_000_000)
+
+        valuations = self.service.value_transactions([early, late])
+
+        assert valuations[0].transaction_id == early.id
+        assert valuations[0].rate == Decimal("40000")
+        assert valuations[0].amount_usd == Decimal("40000")
+        assert valuations[0].fee_usd == Decimal("600")
+        assert valuations[1].rate == Decimal("50000")
+        assert valuations[1].amount_usd == Decimal("25000")
+
+    def test_transactions_without_history_are_unvalued(self):
+        before = make_transaction(-1, 1000)
+        undated = Transaction.create("wallet-1", "wallet-2", 1000, False)
+        undated.created_at = None
+
+        valuations = self.service.value_transactions([before, undated, make_transaction(1, 1000)])
+
+        assert valuations[0].amount_usd is None
+        assert valuations[1].amount_usd is None
+        assert valuations[2].rate == Decimal("40000")
+
+    def test_empty_list(self):
+        assert self.service.value_transactions([]) == []
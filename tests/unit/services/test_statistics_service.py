@@ -1,8 +1,12 @@
 import pytest
+from datetime import datetime, timedelta, UTC
 from unittest.mock import Mock
 
 from src.core.services.statistics_service import StatisticsService, PlatformStatistics
 from src.core.interfaces.transaction_repository import TransactionRepositoryInterface
+from src.core.interfaces.transaction_rollup_repository import TransactionRollupRepositoryInterface
+from src.core.interfaces.unit_of_work import UnitOfWorkInterface
+from src.core.models.transaction_rollup import RollupGranularity, TransactionRollup
 
 
 class TestStatisticsService:
@@ -62,4 +66,114 @@ class TestStatisticsService:
     def test_service_uses_injected_repository(self, mock_transaction_repository):
         service = StatisticsService(transaction_repository=mock_transaction_repository)
 
-        assert service._transaction_repository is mock_transaction_repository
\ No newline at end of file
+        assert service._transaction_repository is mock_transaction_repository
+
+    def test_check_reports_consistent_counters(self, service, mock_transaction_repository):
+        mock_transaction_repository.count_all.return_value = 3
+        mock_transaction_repository.get_total_fees_collected.return_value = 450
+        mock_transaction_repository.scan_platform_totals.return_value = (3, 450)
+
+        check = service.check_platform_statistics()
+
+        assert check.is_consistent
+        assert check.actual == PlatformStatistics(total_transactions=3, platform_profit_satoshis=450)
+
+    def test_check_reports_drift(self, service, mock_transaction_repository):
+        mock_transaction_repository.count_all.return_value = 2
+        mock_transaction_repository.get_total_fees_collected.return_value = 300
+        mock_transaction_repository.scan_platform_totals.return_value = (3, 450)
+
+        check = service.check_platform_statistics()
+
+        assert not check.is_consistent
+        assert check.stored.total_transactions == 2
+
+    def test_rebuild_commits(self, mock_transaction_repository):
+        uow = Mock(spec=UnitOfWorkInterface)
+        service = StatisticsService(transaction_repository=mock_transaction_repository, uow=uow)
+        mock_transaction_repository.count_all.return_value = 3
+        mock_transaction_repository.get_total_fees_collected.return_value = 450
+
+        stats = service.rebuild_platform_statistics()
+
+        mock_transaction_repository.rebuild_platform_stats.assert_called_once()
+        uow.commit.assert_called_once()
+        assert stats.total_transactions == 3
+
+    def test_rebuild_without_unit_of_work_raises(self, service):
+        with pytest.raises(ValueError, match="unit of work"):
+            service.rebuild_platform_statistics()
+
+
+class TestTransactionTimeSeries:
+    BASE = datetime(2025, 1, 1, tzinfo=UTC)
+
+    @pytest.fixture
+    def rollup_repository(self):
+        return Mock(spec=TransactionRollupRepositoryInterface)
+
+    @pytest.fixture
+    def uow(self):
+        return Mock(spec=UnitOfWorkInterface)
+
+    @pytest.fixture
+    def service(self, rollup_repository, uow):
+        return StatisticsService(
+            transaction_repository=Mock(spec=TransactionRepositoryInterface),
+            uow=uow,
+            rollup_repository=rollup_repository
+        )
+
+    def test_fills_empty_buckets_with_zeros(self, service, rollup_repository):
+        stored = TransactionRollup(bucket_start=self.BASE + timedelta(hours=1), transaction_count=4, fees_satoshis=60)
+        rollup_repository.get_rollups.return_value = [stored]
+
+        series = service.get_transaction_time_series(self.BASE + timedelta(minutes=10), self.BASE + timedelta(hours=3))
+
+        assert [b.bucket_start for b in series] == [self.BASE + timedelta(hours=h) for h in range(3)]
+        assert [b.transaction_count for b in series] == [0, 4, 0]
+        rollup_repository.get_rollups.assert_called_once_with(
+            RollupGranularity.HOUR, self.BASE, self.BASE + timedelta(hours=3)
+        )
+
+    def test_daily_series(self, service, rollup_repository):
+        rollup_repository.get_rollups.return_value = []
+
+        series = service.get_transaction_time_series(self.BASE, self.BASE + timedelta(days=31), RollupGranularity.DAY)
+
+        assert len(series) == 31
+
+    def test_end_before_start_raises(self, service):
+        with pytest.raises(ValueError, match="after start"):
+            service.get_transaction_time_series(self.BASE, self.BASE)
+
+    def test_too_many_points_raises(self, service):
+        with pytest.raises(ValueError, match="cannot exceed"):
+            service.get_transaction_time_series(self.BASE, self.BASE + timedelta(days=3650))
+
+    def test_rebuild_commits_per_chunk(self, service, rollup_repository, uow):
+        rollup_repository.transaction_time_range.return_value = (
+            self.BASE + timedelta(hours=5), self.BASE + timedelta(days=9, hours=1)
+        )
+
+        chunks = service.rebuild_transaction_rollups(chunk_days=4)
+
+        assert chunks == 3
+        assert [c.args for c in rollup_repository.rebuild_range.call_args_list] == [
+            (self.BASE, self.BASE + timedelta(days=4)),
+            (self.BASE + timedelta(days=4), self.BASE + timedelta(days=8)),
+            (self.BASE + timedelta(days=8), self.BASE + timedelta(days=10)),
+        ]
+        assert uow.commit.call_count == 3
+
+    def test_rebuild_on_empty_ledger(self, service, rollup_repository, uow):
+        rollup_repository.transaction_time_range.return_value = None
+
+        assert service.rebuild_transaction_rollups() == 0
+        uow.commit.assert_not_called()
+
+    def test_time_series_without_rollup_repository_raises(self):
+        service = StatisticsService(transaction_repository=Mock(spec=TransactionRepositoryInterface))
+
+        with pytest.raises(ValueError, match="rollup repository"):
+            service.get_transaction_time_series(self.BASE, self.BASE + timedelta(hours=1))
@@ -0,0 +1,58 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.interfaces.transaction_repository import TransactionRepositoryInterface
+from src.core.interfaces.wallet_repository import WalletRepositoryInterface
+from src.core.models.transaction import TransactionFilter
+from src.core.models.wallet import Wallet
+from src.core.services.transaction_export_service import TransactionExportService
+from src.core.services.wallet_service import UnauthorizedWalletAccessError, WalletNotFoundError
+
+
+@pytest.fixture
+def wallet_repository():
+    return Mock(spec=WalletRepositoryInterface)
+
+
+@pytest.fixture
+def transaction_repository():
+    repository = Mock(spec=TransactionRepositoryInterface)
+    repository.iter_transactions.return_value = iter(["tx"])
+    return repository
+
+
+@pytest.fixture
+def service(wallet_repository, transaction_repository):
+    return TransactionExportService(wallet_repository, transaction_repository)
+
+
+class TestTransactionExportService:
+
+    def test_full_history_covers_every_wallet(self, service, wallet_repository, transaction_repository):
+        wallet_repository.get_by_user_id.return_value = [Wallet.create("user-1"), Wallet.create("user-1")]
+
+        assert list(service.iter_history(user_id="user-1", batch_size=10)) == ["tx"]
+
+        transaction_repository.iter_transactions.assert_called_once_with(
+            TransactionFilter(wallet_addresses=[w.address for w in wallet_repository.get_by_user_id.return_value]),
+            batch_size=10,
+        )
+
+    def test_user_without_wallets_has_empty_history(self, service, wallet_repository, transaction_repository):
+        wallet_repository.get_by_user_id.return_value = []
+
+        assert list(service.iter_history(user_id="user-1")) == []
+        transaction_repository.iter_transactions.assert_not_called()
+
+    def test_single_wallet_must_be_owned(self, service, wallet_repository):
+        wallet_repository.get_by_address.return_value = Wallet.create("someone-else")
+
+        with pytest.raises(UnauthorizedWalletAccessError):
+            service.iter_history(user_id="user-1", wallet_address="addr")
+
+    def test_single_wallet_must_exist(self, service, wallet_repository):
+        wallet_repository.get_by_address.return_value = None
+
+        with pytest.raises(WalletNotFoundError):
+            service.iter_history(user_id="user-1", wallet_address="addr")
@@ -0,0 +1,140 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.core.models.user import User
+from src.core.models.wallet import Wallet
+from src.core.services.transfer_service import InsufficientFundsError, TransferService
+from src.core.services.wallet_service import UnauthorizedWalletAccessError, WalletNotFoundError
+from src.infra.database.models import Base
+from src.infra.database.sqlalchemy_uow import SQLAlchemyUnitOfWork
+from src.infra.repositories.transaction_repository import SQLAlchemyTransactionRepository
+from src.infra.repositories.user_repository import SQLAlchemyUserRepository
+from src.infra.repositories.wallet_repository import SQLAlchemyWalletRepository
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'wallet.db'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def wallets(engine):
+    with Session(engine) as session:
+        users = SQLAlchemyUserRepository(session)
+        repo = SQLAlchemyWalletRepository(session)
+        alice, bob = User.create(api_key="key-1"), User.create(api_key="key-2")
+        users.save(alice)
+        users.save(bob)
+        created = {
+            "alice": Wallet.create(alice.id),
+            "alice_savings": Wallet.create(alice.id),
+            "bob": Wallet.create(bob.id),
+        }
+        for wallet in created.values():
+            wallet.balance_satoshis = 10_000
+            repo.save(wallet)
+        session.commit()
+        return created
+
+
+def make_service(session: Session) -> TransferService:
+    return TransferService(
+        uow=SQLAlchemyUnitOfWork(session),
+        wallet_repository=SQLAlchemyWalletRepository(session),
+        transaction_repository=SQLAlchemyTransactionRepository(session),
+    )
+
+
+def balance(engine, address: str) -> int:
+    with Session(engine) as session:
+        return SQLAlchemyWalletRepository(session).get_by_address(address).balance_satoshis
+
+
+class TestTransferService:
+
+    def test_external_transfer_moves_amount_minus_fee(self, engine, wallets):
+        alice, bob = wallets["alice"], wallets["bob"]
+
+        with Session(engine) as session:
+            transaction = make_service(session).transfer(
+                user_id=alice.user_id, from_address=alice.address, to_address=bob.address, amount_satoshis=1000
+            )
+
+        assert transaction.fee_satoshis == 15
+        assert transaction.is_internal_transfer is False
+        assert balance(engine, alice.address) == 9_000
+        assert balance(engine, bob.address) == 10_985
+
+        with Session(engine) as session:
+            repo = SQLAlchemyTransactionRepository(session)
+            assert repo.get_by_id(transaction.id).amount_satoshis == 1000
+            assert repo.get_total_fees_collected() == 15
+
+    def test_transfer_between_own_wallets_is_free(self, engine, wallets):
+        alice, savings = wallets["alice"], wallets["alice_savings"]
+
+        with Session(engine) as session:
+            transaction = make_service(session).transfer(
+                user_id=alice.user_id, from_address=alice.address, to_address=savings.address, amount_satoshis=1000
+            )
+
+        assert transaction.is_internal_transfer is True
+        assert balance(engine, savings.address) == 11_000
+
+    def test_insufficient_funds_changes_nothing(self, engine, wallets):
+        alice, bob = wallets["alice"], wallets["bob"]
+
+        with Session(engine) as session:
+            with pytest.raises(InsufficientFundsError):
+                make_service(session).transfer(
+                    user_id=alice.user_id, from_address=alice.address, to_address=bob.address, amount_satoshis=10_001
+                )
+
+        assert balance(engine, alice.address) == 10_000
+        assert balance(engine, bob.address) == 10_000
+        with Session(engine) as session:
+            assert SQLAlchemyTransactionRepository(session).count_all() == 0
+
+    def test_sender_must_belong_to_user(self, engine, wallets):
+        alice, bob = wallets["alice"], wallets["bob"]
+
+        with Session(engine) as session:
+            with pytest.raises(UnauthorizedWalletAccessError):
+                make_service(session).transfer(
+                    user_id=bob.user_id, from_address=alice.address, to_address=bob.address, amount_satoshis=1
+                )
+
+    def test_unknown_recipient(self, engine, wallets):
+        alice = wallets["alice"]
+
+        with Session(engine) as session:
+            with pytest.raises(WalletNotFoundError):
+                make_service(session).transfer(
+                    user_id=alice.user_id, from_address=alice.address, to_address="missing", amount_satoshis=1
+                )
+
+    def test_concurrent_transfers_never_overdraw(self, engine, wallets):
+        alice, bob = wallets["alice"], wallets["bob"]
+
+        def send() -> bool:
+            with Session(engine) as session:
+                try:
+                    make_service(session).transfer(
+                        user_id=alice.user_id, from_address=alice.address, to_address=bob.address, amount_satoshis=1000
+                    )
+                except InsufficientFundsError:
+                    return False
+                return True
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: send(), range(20)))
+
+        assert results.count(True) == 10
+        assert balance(engine, alice.address) == 0
+        assert balance(engine, bob.address) == 10_000 + 10 * 985
@@ -11,8 +11,10 @@ from src.core.services.wallet_service import (
     WalletLimitExceededError,
     WalletNotFoundError,
     WalletService,
+    WalletUpdateStats,
 )
-from src.core.interfaces.wallet_repository import WalletRepositoryInterface
+from src.core.interfaces.wallet_adjustment_repository import WalletAdjustmentRepositoryInterface
+from src.core.interfaces.wallet_repository import StaleWalletError, WalletRepositoryInterface
 
 
 class InMemoryWalletRepository(WalletRepositoryInterface):
@@ -30,6 +32,9 @@ class InMemoryWalletRepository(WalletRepositoryInterface):
     def get_by_address(self, address: str) -> Optional[Wallet]:
         return self._by_address.get(address)
 
+    def get_many_by_addresses(self, addresses) -> dict[str, Wallet]:
+        return {a: self._by_address[a] for a in addresses if a in self._by_address}
+
     def get_by_user_id(self, user_id: str) -> list[Wallet]:
         return [w for w in self._by_id.values() if w.user_id == user_id]
 
@@ -39,10 +44,54 @@ class InMemoryWalletRepository(WalletRepositoryInterface):
         self._by_id[wallet.id] = wallet
         self._by_address[wallet.address] = wallet
 
+    def debit(self, address: str, amount_satoshis: int) -> bool:
+        wallet = self._by_address.get(address)
+        if wallet is None or wallet.balance_satoshis < amount_satoshis:
+            return False
+        wallet.balance_satoshis -= amount_satoshis
+        return True
+
+    def credit(self, address: str, amount_satoshis: int) -> bool:
+        wallet = self._by_address.get(address)
+        if wallet is None:
+            return False
+        wallet.balance_satoshis += amount_satoshis
+        return True
+
+
+class InMemoryWalletAdjustmentRepository(WalletAdjustmentRepositoryInterface):
+    def __init__(self) -> None:
+        self.totals: dict[str, int] = {}
+
+    def add(self, wallet_address: str, amount_satoshis: int) -> None:
+        self.totals[wallet_address] = self.totals.get(wallet_address, 0) + amount_satoshis
+
+    def total(self, wallet_address: str) -> int:
+        return self.totals.get(wallet_address, 0)
+
+
+class ConflictingWalletRepository(InMemoryWalletRepository):
+    """Loses the first `conflicts` updates to a concurrent deposit of 1 satoshi."""
+
+    def __init__(self, conflicts: int) -> None:
+        super().__init__()
+        self.conflicts = conflicts
+
+    def get_by_address(self, address: str) -> Optional[Wallet]:
+        wallet = super().get_by_address(address)
+        return replace(wallet) if wallet is not None else None
+
+    def update(self, wallet: Wallet) -> None:
+        if self.conflicts:
+            self.conflicts -= 1
+            self._by_address[wallet.address].balance_satoshis += 1
+            raise StaleWalletError
+        super().update(wallet)
+
 
 def make_service() -> tuple[WalletService, InMemoryWalletRepository]:
     repo = InMemoryWalletRepository()
-    return WalletService(repo), repo
+    return WalletService(repo, InMemoryWalletAdjustmentRepository()), repo
 
 
 def test_create_wallet_success() -> None:
@@ -153,3 +202,82 @@ def test_withdraw_rejects_non_positive_amount() -> None:
 
     with pytest.raises(ValueError):
         service.withdraw(user_id="user-1", address=w.address, amount_satoshis=-5)
+
+
+def test_get_wallets_by_addresses_returns_owned_wallets() -> None:
+    service, repo = make_service()
+    wallets = [Wallet.create("user-1") for _ in range(3)]
+    for w in wallets:
+        repo.save(w)
+
+    found = service.get_wallets_by_addresses(user_id="user-1", addresses=[w.address for w in wallets])
+
+    assert found == {w.address: w for w in wallets}
+
+
+def test_get_wallets_by_addresses_rejects_foreign_wallet() -> None:
+    service, repo = make_service()
+    own, foreign = Wallet.create("user-1"), Wallet.create("user-2")
+    repo.save(own)
+    repo.save(foreign)
+
+    with pytest.raises(UnauthorizedWalletAccessError):
+        service.get_wallets_by_addresses(user_id="user-1", addresses=[own.address, foreign.address])
+
+
+def test_get_wallets_by_addresses_rejects_unknown_address() -> None:
+    service, repo = make_service()
+    own = Wallet.create("user-1")
+    repo.save(own)
+
+    with pytest.raises(WalletNotFoundError):
+        service.get_wallets_by_addresses(user_id="user-1", addresses=[own.address, "missing", own.address])
+
+
+def test_deposit_retries_on_conflict_against_fresh_balance() -> None:
+    repo = ConflictingWalletRepository(conflicts=2)
+    service = WalletService(repo, InMemoryWalletAdjustmentRepository(), max_update_attempts=3)
+    w = Wallet.create("user-1")
+    w.balance_satoshis = 100
+    repo.save(w)
+
+    updated = service.deposit(user_id="user-1", address=w.address, amount_satoshis=50)
+
+    assert updated.balance_satoshis == 152
+    assert repo.get_by_address(w.address).balance_satoshis == 152
+    assert service.metrics.stats() == WalletUpdateStats(updates=1, conflicts=2, retries=2, exhausted=0)
+
+
+def test_withdraw_gives_up_after_max_attempts() -> None:
+    repo = ConflictingWalletRepository(conflicts=3)
+    service = WalletService(repo, InMemoryWalletAdjustmentRepository(), max_update_attempts=2)
+    w = Wallet.create("user-1")
+    w.balance_satoshis = 100
+    repo.save(w)
+
+    with pytest.raises(StaleWalletError):
+        service.withdraw(user_id="user-1", address=w.address, amount_satoshis=50)
+
+    assert repo.get_by_address(w.address).balance_satoshis == 102
+    assert service.metrics.stats() == WalletUpdateStats(updates=0, conflicts=2, retries=1, exhausted=1)
+
+
+def test_max_update_attempts_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        WalletService(InMemoryWalletRepository(), InMemoryWalletAdjustmentRepository(), max_update_attempts=0)
+
+
+def test_deposits_and_withdrawals_are_recorded_as_adjustments() -> None:
+    repo = ConflictingWalletRepository(conflicts=1)
+    adjustments = InMemoryWalletAdjustmentRepository()
+    service = WalletService(repo, adjustments)
+    w = Wallet.create("user-1")
+    w.balance_satoshis = 100
+    repo.save(w)
+
+    service.deposit(user_id="user-1", address=w.address, amount_satoshis=50)
+    service.withdraw(user_id="user-1", address=w.address, amount_satoshis=30)
+    with pytest.raises(ValueError):
+        service.withdraw(user_id="user-1", address=w.address, amount_satoshis=1000)
+
+    assert adjustments.total(w.address) == 20
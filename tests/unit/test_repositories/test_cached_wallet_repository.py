@@ -0,0 +1,177 @@
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.core.interfaces.wallet_repository import WalletRepositoryInterface
+from src.core.models.wallet import Wallet
+from src.infra.database.models import Base
+from src.infra.repositories.cached_wallet_repository import CachedWalletRepository, WalletCache
+from src.infra.repositories.wallet_repository import SQLAlchemyWalletRepository
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return WalletCache(max_entries=2, ttl_seconds=10, clock=clock)
+
+
+@pytest.fixture
+def inner():
+    repository = Mock(spec=WalletRepositoryInterface)
+    wallets = {}
+    repository.get_by_address.side_effect = lambda address: wallets.get(address)
+    repository.wallets = wallets
+    return repository
+
+
+def add_wallet(inner, balance: int = 100) -> Wallet:
+    wallet = Wallet.create("user-1")
+    wallet.balance_satoshis = balance
+    inner.wallets[wallet.address] = wallet
+    return wallet
+
+
+class TestWalletCache:
+
+    def test_second_read_is_a_hit(self, cache, inner):
+        wallet = add_wallet(inner)
+        repo = CachedWalletRepository(inner, cache)
+
+        assert repo.get_by_address(wallet.address) == wallet
+        assert repo.get_by_address(wallet.address) == wallet
+
+        assert inner.get_by_address.call_count == 1
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+    def test_cached_wallet_is_a_copy(self, cache, inner):
+        wallet = add_wallet(inner)
+        repo = CachedWalletRepository(inner, cache)
+        repo.get_by_address(wallet.address)
+
+        repo.get_by_address(wallet.address).deposit(50)
+
+        assert repo.get_by_address(wallet.address).balance_satoshis == 100
+
+    def test_entries_expire_after_ttl(self, cache, inner, clock):
+        wallet = add_wallet(inner)
+        repo = CachedWalletRepository(inner, cache)
+        repo.get_by_address(wallet.address)
+
+        clock.now = 11
+        repo.get_by_address(wallet.address)
+
+        assert inner.get_by_address.call_count == 2
+
+    def test_least_recently_used_entry_is_evicted(self, cache, inner):
+        first, second, third = (add_wallet(inner) for _ in range(3))
+        repo = CachedWalletRepository(inner, cache)
+        for wallet in (first, second, first, third):
+            repo.get_by_address(wallet.address)
+
+        repo.get_by_address(first.address)
+        repo.get_by_address(second.address)
+
+        assert cache.stats().evictions == 2
+        assert [c.args[0] for c in inner.get_by_address.call_args_list] == [
+            first.address, second.address, third.address, second.address
+        ]
+
+    def test_put_started_before_an_invalidation_is_dropped(self, cache, inner):
+        wallet = add_wallet(inner)
+        read_version = cache.begin()
+        cache.invalidate(wallet.address)
+
+        assert cache.put(wallet, read_version) is False
+        assert cache.get(wallet.address) is None
+        assert cache.stats().rejected_stale_writes == 1
+
+    def test_put_is_checked_against_evicted_invalidations(self, cache, inner):
+        stale, other, another = (add_wallet(inner) for _ in range(3))
+        read_version = cache.begin()
+        cache.invalidate(stale.address)
+        cache.put(other, cache.begin())
+        cache.put(another, cache.begin())
+
+        assert cache.put(stale, read_version) is False
+
+    def test_write_bypasses_cache_until_transaction_ends(self, cache, inner):
+        wallet = add_wallet(inner)
+        repo = CachedWalletRepository(inner, cache)
+        repo.get_by_address(wallet.address)
+
+        repo.update(wallet)
+        repo.get_by_address(wallet.address)
+        repo.get_by_address(wallet.address)
+        assert inner.get_by_address.call_count == 3
+
+        repo.end_transaction()
+        repo.get_by_address(wallet.address)
+        repo.get_by_address(wallet.address)
+        assert inner.get_by_address.call_count == 4
+
+    def test_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            WalletCache(max_entries=0)
+        with pytest.raises(ValueError):
+            WalletCache(ttl_seconds=0)
+
+
+class TestCachedWalletRepositoryWithSessions:
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'wallets.db'}")
+        Base.metadata.create_all(engine)
+        yield engine
+        engine.dispose()
+
+    def test_commit_evicts_a_value_cached_by_another_session_meanwhile(self, engine):
+        cache = WalletCache()
+        wallet = Wallet.create("user-1")
+        with Session(engine) as session:
+            SQLAlchemyWalletRepository(session).save(wallet)
+            session.commit()
+
+        writer_session, reader_session = Session(engine), Session(engine)
+        writer = CachedWalletRepository(SQLAlchemyWalletRepository(writer_session), cache).bind_to_session(writer_session)
+        reader = CachedWalletRepository(SQLAlchemyWalletRepository(reader_session), cache)
+
+        writer.credit(wallet.address, 500)
+        # Not committed yet: the reader caches the old balance.
+        assert reader.get_by_address(wallet.address).balance_satoshis == wallet.balance_satoshis
+        writer_session.commit()
+
+        assert reader.get_by_address(wallet.address).balance_satoshis == wallet.balance_satoshis + 500
+        writer_session.close()
+        reader_session.close()
+
+
+def test_get_many_fetches_only_misses_in_one_call(cache, inner):
+    first, second = add_wallet(inner), add_wallet(inner)
+    inner.get_many_by_addresses.side_effect = lambda addresses: {
+        a: inner.wallets[a] for a in addresses if a in inner.wallets
+    }
+    repo = CachedWalletRepository(inner, cache)
+    repo.get_by_address(first.address)
+
+    found = repo.get_many_by_addresses([first.address, second.address, "missing"])
+
+    assert found == {first.address: first, second.address: second}
+    inner.get_many_by_addresses.assert_called_once_with([second.address, "missing"])
+    assert repo.get_many_by_addresses([first.address, second.address]) == found
+    assert inner.get_many_by_addresses.call_count == 1
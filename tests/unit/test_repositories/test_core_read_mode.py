@@ -0,0 +1,86 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.core.models.user import User
+from src.core.models.wallet import Wallet
+from src.infra.database.models import Base
+from src.infra.repositories.user_repository import SQLAlchemyUserRepository
+from src.infra.repositories.wallet_repository import SQLAlchemyWalletRepository
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def user_with_wallets(session):
+    user = User.create(api_key="key-1")
+    users = SQLAlchemyUserRepository(session)
+    wallets = SQLAlchemyWalletRepository(session)
+    users.save(user)
+    created = [Wallet.create(user.id) for _ in range(2)]
+    for wallet in created:
+        wallets.save(wallet)
+    users.save(User.create(api_key="key-2"))
+    session.commit()
+    session.expunge_all()
+    return user, created
+
+
+class TestWalletRepositoryCoreReads:
+
+    def test_reads_match_orm_reads(self, session, user_with_wallets):
+        user, created = user_with_wallets
+        orm = SQLAlchemyWalletRepository(session)
+        core = SQLAlchemyWalletRepository(session, core_reads=True)
+
+        assert core.get_by_id(created[0].id) == orm.get_by_id(created[0].id)
+        assert core.get_by_address(created[1].address) == orm.get_by_address(created[1].address)
+        assert sorted(core.get_by_user_id(user.id), key=lambda w: w.id) == sorted(
+            orm.get_by_user_id(user.id), key=lambda w: w.id
+        )
+
+    def test_missing_wallet(self, session):
+        core = SQLAlchemyWalletRepository(session, core_reads=True)
+
+        assert core.get_by_id("missing") is None
+        assert core.get_by_address("missing") is None
+        assert core.get_by_user_id("missing") == []
+
+    def test_core_reads_skip_the_identity_map(self, session, user_with_wallets):
+        user, _ = user_with_wallets
+        SQLAlchemyWalletRepository(session, core_reads=True).get_by_user_id(user.id)
+
+        assert len(session.identity_map) == 0
+
+
+class TestUserRepositoryCoreReads:
+
+    def test_reads_match_orm_reads(self, session, user_with_wallets):
+        user, _ = user_with_wallets
+        core_user = SQLAlchemyUserRepository(session, core_reads=True).get_by_id(user.id)
+        session.expunge_all()
+        orm_user = SQLAlchemyUserRepository(session).get_by_id(user.id)
+
+        assert core_user.id == orm_user.id
+        assert core_user.api_key == orm_user.api_key
+        assert sorted(core_user.wallet_ids) == sorted(orm_user.wallet_ids)
+        assert len(core_user.wallet_ids) == 2
+
+    def test_user_without_wallets(self, session, user_with_wallets):
+        user = SQLAlchemyUserRepository(session, core_reads=True).get_user_by_api_key("key-2")
+
+        assert user.api_key == "key-2"
+        assert user.wallet_ids == []
+
+    def test_missing_user(self, session):
+        core = SQLAlchemyUserRepository(session, core_reads=True)
+
+        assert core.get_by_id("missing") is None
+        assert core.get_user_by_api_key("missing") is None
@@ -40,6 +40,7 @@ def test_migrations_create_tables(tmp_path: Path) -> None:
     assert "schema_migrations" in tables
     assert "users" in tables
     assert "wallets" in tables
+    assert "wallet_adjustments" in tables
 
 
 def test_migrations_are_idempotent(tmp_path: Path) -> None:
@@ -50,3 +51,87 @@ def test_migrations_are_idempotent(tmp_path: Path) -> None:
 
     assert len(first) >= 3
     assert second == []
+
+
+def test_migrations_replace_wallet_indexes_with_composite_ones(tmp_path: Path) -> None:
+    db_file = tmp_path / "test.db"
+    run_migrations(db_path=db_file, migrations_dir=default_migrations_dir())
+
+    conn = sqlite3.connect(db_file)
+    try:
+        indexes = {
+            r[0]
+            for r in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='transactions';"
+            ).fetchall()
+        }
+    finally:
+        conn.close()
+
+    assert "idx_transactions_from_wallet_created" in indexes
+    assert "idx_transactions_to_wallet_created" in indexes
+    assert "idx_transactions_from_wallet" not in indexes
+    assert "idx_transactions_to_wallet" not in indexes
+    assert "idx_transactions_created_id" in indexes
+    assert "idx_transactions_created_at" not in indexes
+
+
+def test_aggregate_migrations_seed_from_existing_transactions(tmp_path: Path) -> None:
+    db_file = tmp_path / "test.db"
+    migrations = sorted(default_migrations_dir().glob("*.sql"))
+    before_stats = tmp_path / "before_stats"
+    before_stats.mkdir()
+    for path in migrations:
+        if path.name < "007":
+            (before_stats / path.name).write_text(path.read_text())
+
+    run_migrations(db_path=db_file, migrations_dir=before_stats)
+    conn = sqlite3.connect(db_file)
+    try:
+        conn.executemany(
+            "INSERT INTO transactions VALUES (?, 'a', 'b', ?, ?, 0, '2025-01-01 00:00:00');",
+            [("tx-1", 1000, 15), ("tx-2", 2000, 30)],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    run_migrations(db_path=db_file, migrations_dir=default_migrations_dir())
+
+    conn = sqlite3.connect(db_file)
+    try:
+        row = conn.execute("SELECT transaction_count, total_fees_satoshis FROM platform_stats;").fetchone()
+        daily = conn.execute(
+            "SELECT bucket_start_us, transaction_count, volume_satoshis FROM transaction_rollups_daily;"
+        ).fetchall()
+    finally:
+        conn.close()
+
+    assert row == (2, 45)
+    assert daily == [(1_735_689_600_000_000, 2, 3000)]
+
+
+def test_wallet_version_migration_starts_existing_wallets_at_zero(tmp_path: Path) -> None:
+    db_file = tmp_path / "test.db"
+    before_version = tmp_path / "before_version"
+    before_version.mkdir()
+    for path in default_migrations_dir().glob("*.sql"):
+        if path.name < "010":
+            (before_version / path.name).write_text(path.read_text())
+
+    run_migrations(db_path=db_file, migrations_dir=before_version)
+    conn = sqlite3.connect(db_file)
+    try:
+        conn.execute("INSERT INTO users (id, api_key) VALUES ('user-1', 'key');")
+        conn.execute("INSERT INTO wallets (address, user_id, balance_sats) VALUES ('addr', 'user-1', 100);")
+        conn.commit()
+    finally:
+        conn.close()
+
+    run_migrations(db_path=db_file, migrations_dir=default_migrations_dir())
+
+    conn = sqlite3.connect(db_file)
+    try:
+        assert conn.execute("SELECT version FROM wallets WHERE address = 'addr';").fetchone() == (0,)
+    finally:
+        conn.close()
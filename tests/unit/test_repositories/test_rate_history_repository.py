@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta, UTC
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.core.models.exchange_rate import RateSnapshot
+from src.infra.database.models import Base
+from src.infra.repositories.rate_history_repository import (
+    InMemoryRateHistoryRepository,
+    SessionPerCallRateHistoryRepository,
+    SQLAlchemyRateHistoryRepository,
+)
+
+T0 = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def snapshot(minutes: int, rate: str) -> RateSnapshot:
+    return RateSnapshot(rate=Decimal(rate), fetched_at=T0 + timedelta(minutes=minutes), source="test")
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def session(engine):
+    session = Session(engine)
+    yield session
+    session.close()
+
+
+@pytest.fixture(params=["memory", "sqlalchemy", "session_per_call"])
+def repo(request, engine, session):
+    if request.param == "memory":
+        return InMemoryRateHistoryRepository()
+    if request.param == "session_per_call":
+        return SessionPerCallRateHistoryRepository(sessionmaker(bind=engine))
+    return SQLAlchemyRateHistoryRepository(session)
+
+
+class TestRateHistoryRepository:
+
+    def test_empty_history_has_no_rate(self, repo):
+        assert repo.rate_at(T0) is None
+        assert repo.count() == 0
+
+    def test_rate_as_of_time(self, repo):
+        repo.record(snapshot(0, "40000"))
+        repo.record(snapshot(10, "41000.12345678"))
+        repo.record(snapshot(20, "42000"))
+
+        assert repo.rate_at(T0 - timedelta(seconds=1)) is None
+        assert repo.rate_at(T0) == Decimal("40000")
+        assert repo.rate_at(T0 + timedelta(minutes=9)) == Decimal("40000")
+        assert repo.rate_at(T0 + timedelta(minutes=10)) == Decimal("41000.12345678")
+        assert repo.rate_at(T0 + timedelta(days=1)) == Decimal("42000")
+        assert repo.count() == 3
+
+    def test_out_of_order_records_stay_sorted(self, repo):
+        repo.record(snapshot(20, "42000"))
+        repo.record(snapshot(0, "40000"))
+        repo.record(snapshot(10, "41000"))
+
+        assert repo.rate_at(T0 + timedelta(minutes=15)) == Decimal("41000")
+
+    def test_bulk_lookup(self, repo):
+        for minute in range(0, 100, 10):
+            repo.record(snapshot(minute, str(40000 + minute)))
+
+        times = [T0 + timedelta(minutes=m) for m in (55, -5, 0, 99, 31)]
+
+        assert repo.rates_at(times) == [
+            Decimal("40050"), None, Decimal("40000"), Decimal("40090"), Decimal("40030"),
+        ]
+        assert repo.rates_at([]) == []
+
+    def test_naive_times_are_utc(self, repo):
+        repo.record(snapshot(0, "40000"))
+
+        assert repo.rate_at(T0.replace(tzinfo=None)) == Decimal("40000")
+
+
+def test_sqlalchemy_history_ignores_duplicate_timestamps(session):
+    repo = SQLAlchemyRateHistoryRepository(session)
+    repo.record(snapshot(0, "40000"))
+    repo.record(snapshot(0, "40001"))
+    session.commit()
+
+    assert repo.count() == 1
+
+
+def test_session_per_call_history_commits_each_sample(engine):
+    SessionPerCallRateHistoryRepository(sessionmaker(bind=engine)).record(snapshot(0, "40000"))
+
+    with Session(engine) as session:
+        assert SQLAlchemyRateHistoryRepository(session).rate_at(T0) == Decimal("40000")
@@ -0,0 +1,166 @@
+from datetime import datetime, timedelta, UTC
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from src.core.models.transaction import Transaction
+from src.core.models.transaction_rollup import RollupGranularity
+from src.infra.database import platform_stats
+from src.infra.database.archive_transactions import archive_transactions
+from src.infra.database.models import Base, TransactionModel
+from src.infra.database.transaction_archive import TransactionArchive, TransactionArchiveError
+from src.infra.repositories.transaction_repository import SQLAlchemyTransactionRepository
+from src.infra.repositories.transaction_rollup_repository import SQLAlchemyTransactionRollupRepository
+from src.infra.repositories.wallet_checkpoint_repository import SQLAlchemyWalletCheckpointRepository
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'live.db'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return TransactionArchive(tmp_path / "archive", period="year")
+
+
+@pytest.fixture
+def ledger(engine):
+    """
+    One wallet-1 -> wallet-2 transfer on the first of every quarter, 2023 through 2025.
+    """
+    transactions = []
+    for year in (2023, 2024, 2025):
+        for month in (1, 4, 7, 10):
+            transaction = Transaction.create("wallet-1", "wallet-2", 1000)
+            transaction.created_at = datetime(year, month, 1, tzinfo=UTC)
+            transactions.append(transaction)
+
+    with Session(engine) as session:
+        SQLAlchemyTransactionRepository(session).save_many(transactions)
+        session.commit()
+    return transactions
+
+
+def live_count(session) -> int:
+    return session.execute(select(func.count()).select_from(TransactionModel)).scalar_one()
+
+
+class TestTransactionArchive:
+
+    def test_move_chunk_writes_one_file_per_period(self, engine, archive, ledger, tmp_path):
+        with Session(engine) as session:
+            moved = archive.move_chunk(session, datetime(2025, 1, 1, tzinfo=UTC), chunk_size=100)
+            session.commit()
+
+            assert moved == 8
+            assert live_count(session) == 4
+        assert archive.keys() == ["2024", "2023"]
+        assert archive.path_for("2023").exists()
+
+    def test_move_chunk_respects_chunk_size(self, engine, archive, ledger):
+        with Session(engine) as session:
+            assert archive.move_chunk(session, datetime(2030, 1, 1, tzinfo=UTC), chunk_size=5) == 5
+            session.commit()
+            assert archive.move_chunk(session, datetime(2030, 1, 1, tzinfo=UTC), chunk_size=5) == 5
+            session.commit()
+
+            assert live_count(session) == 2
+
+    def test_history_reads_across_archives(self, engine, archive, ledger):
+        with Session(engine) as session:
+            archive.move_chunk(session, datetime(2025, 1, 1, tzinfo=UTC), chunk_size=100)
+            session.commit()
+
+        with Session(engine) as session:
+            repo = SQLAlchemyTransactionRepository(session, archive=archive)
+            expected = [t.id for t in sorted(ledger, key=lambda t: t.created_at, reverse=True)]
+
+            assert [t.id for t in repo.get_by_wallet_address("wallet-2")] == expected
+            assert [t.id for t in repo.get_by_user_wallets(["wallet-1", "wallet-2"])] == expected
+            assert repo.get_by_id(ledger[0].id).id == ledger[0].id
+            assert [t.id for t in repo.iter_transactions(batch_size=3)] == expected[::-1]
+
+            pages, cursor = [], None
+            while True:
+                page = repo.get_page_by_wallet_address("wallet-1", limit=5, cursor=cursor)
+                pages.extend(t.id for t in page.transactions)
+                if not page.has_more:
+                    break
+                cursor = page.next_cursor
+            assert pages == expected
+
+    def test_repository_without_archive_sees_live_rows_only(self, engine, archive, ledger):
+        with Session(engine) as session:
+            archive.move_chunk(session, datetime(2025, 1, 1, tzinfo=UTC), chunk_size=100)
+            session.commit()
+
+            assert len(SQLAlchemyTransactionRepository(session).get_by_wallet_address("wallet-1")) == 4
+
+    def test_totals_and_rollups_include_archives(self, engine, archive, ledger):
+        with Session(engine) as session:
+            archive.move_chunk(session, datetime(2025, 1, 1, tzinfo=UTC), chunk_size=100)
+            session.commit()
+
+        with Session(engine) as session:
+            repo = SQLAlchemyTransactionRepository(session, archive=archive)
+            rollups = SQLAlchemyTransactionRollupRepository(session, archive=archive)
+
+            assert repo.scan_platform_totals() == (12, 12 * 15)
+            assert rollups.transaction_time_range()[0] == datetime(2023, 1, 1)
+
+            rollups.rebuild_range(datetime(2023, 1, 1, tzinfo=UTC), datetime(2026, 1, 1, tzinfo=UTC))
+            daily = rollups.get_rollups(RollupGranularity.DAY, datetime(2023, 1, 1), datetime(2026, 1, 1))
+            assert sum(r.transaction_count for r in daily) == 12
+
+    def test_archive_job_stops_at_checkpointed_transactions(self, engine, archive, ledger):
+        with Session(engine) as session:
+            assert archive_transactions(session, archive, timedelta(days=30), chunk_size=3) == 0
+
+            SQLAlchemyWalletCheckpointRepository(session).advance(
+                datetime(2024, 6, 1, tzinfo=UTC), limit=100, opening_balance_satoshis=0
+            )
+            session.commit()
+
+            # Strictly before the newest checkpointed transaction.
+            assert archive_transactions(session, archive, timedelta(days=30), chunk_size=3) == 5
+            assert live_count(session) == 7
+
+    def test_reading_unattached_archive_inside_write_transaction_fails(self, engine, archive, ledger):
+        with Session(engine) as session:
+            archive.move_chunk(session, datetime(2025, 1, 1, tzinfo=UTC), chunk_size=100)
+            session.commit()
+        engine.dispose()  # start from connections without the archives attached
+
+        with Session(engine) as session:
+            repo = SQLAlchemyTransactionRepository(session, archive=archive)
+            repo.save(Transaction.create("wallet-1", "wallet-2", 1000))
+
+            with pytest.raises(TransactionArchiveError):
+                repo.get_by_wallet_address("wallet-1")
+
+    def test_platform_stats_cli_counts_archived_transactions(self, engine, archive, ledger, monkeypatch, capsys):
+        monkeypatch.setattr(platform_stats, "engine", engine)
+        monkeypatch.setattr(platform_stats, "init_db", lambda: None)
+        monkeypatch.setattr(platform_stats, "configured_archive", lambda: archive)
+        with Session(engine) as session:
+            archive.move_chunk(session, datetime(2025, 1, 1, tzinfo=UTC), chunk_size=5)
+            session.commit()
+
+        assert platform_stats.main([]) == 0
+        assert platform_stats.main(["--rebuild", "--rebuild-rollups"]) == 0
+        assert "total_transactions=12, platform_profit_satoshis=180" in capsys.readouterr().out
+
+        with Session(engine) as session:
+            daily = SQLAlchemyTransactionRollupRepository(session).get_rollups(
+                RollupGranularity.DAY, datetime(2023, 1, 1), datetime(2026, 1, 1)
+            )
+            assert sum(r.transaction_count for r in daily) == 12
+
+    def test_invalid_period(self, tmp_path):
+        with pytest.raises(ValueError):
+            TransactionArchive(tmp_path, period="week")
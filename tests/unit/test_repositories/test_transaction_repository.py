@@ -1,11 +1,11 @@
 import pytest
-from datetime import datetime, UTC
-from sqlalchemy import create_engine
+from datetime import datetime, timedelta, UTC
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session
 
-from src.core.models.transaction import Transaction
-from src.infra.database.models import Base, TransactionModel
-from src.infra.repositories.transaction_repository import SQLTransactionRepository
+from src.core.models.transaction import InvalidCursorError, Transaction, TransactionCursor, TransactionFilter
+from src.infra.database.models import Base, PlatformStatsModel, TransactionModel
+from src.infra.repositories.transaction_repository import SQLAlchemyTransactionRepository
 
 
 @pytest.fixture
@@ -23,9 +23,9 @@ def session(in_memory_db):
     session.close()
 
 
-@pytest.fixture
-def transaction_repo(session):
-    return SQLTransactionRepository(session)
+@pytest.fixture(params=[False, True], ids=["orm_reads", "core_reads"])
+def transaction_repo(request, session):
+    return SQLAlchemyTransactionRepository(session, core_reads=request.param)
 
 
 @pytest.fixture
@@ -229,4 +229,390 @@ class TestTransactionRepository:
         assert len(results) == 3
         assert results[0].amount_satoshis == 3000
         assert results[1].amount_satoshis == 2000
-        assert results[2].amount_satoshis == 1000
\ No newline at end of file
+        assert results[2].amount_satoshis == 1000
+
+
+def make_history(session, transaction_repo, count, wallet="wallet-1", same_timestamp_every=1):
+    base = datetime(2025, 1, 1, tzinfo=UTC)
+    transactions = []
+    for i in range(count):
+        tx = Transaction.create(wallet, f"wallet-to-{i}", 1000 + i, False)
+        tx.created_at = base + timedelta(seconds=i // same_timestamp_every)
+        transaction_repo.save(tx)
+        transactions.append(tx)
+    session.commit()
+    return transactions
+
+
+class TestTransactionPagination:
+
+    def test_first_page_is_newest_first(self, transaction_repo, session):
+        make_history(session, transaction_repo, 5)
+
+        page = transaction_repo.get_page_by_wallet_address("wallet-1", limit=2)
+
+        assert [tx.amount_satoshis for tx in page.transactions] == [1004, 1003]
+        assert page.has_more
+
+    def test_walking_all_pages_returns_every_transaction_once(self, transaction_repo, session):
+        created = make_history(session, transaction_repo, 23, same_timestamp_every=4)
+
+        seen, cursor = [], None
+        while True:
+            page = transaction_repo.get_page_by_wallet_address("wallet-1", limit=5, cursor=cursor)
+            seen.extend(tx.id for tx in page.transactions)
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+
+        assert len(seen) == 23
+        assert set(seen) == {tx.id for tx in created}
+
+    def test_last_page_has_no_cursor(self, transaction_repo, session):
+        make_history(session, transaction_repo, 4)
+
+        page = transaction_repo.get_page_by_wallet_address("wallet-1", limit=4)
+
+        assert len(page.transactions) == 4
+        assert page.next_cursor is None
+
+    def test_user_wallets_pages(self, transaction_repo, session):
+        make_history(session, transaction_repo, 3, wallet="wallet-a")
+        make_history(session, transaction_repo, 3, wallet="wallet-b")
+        make_history(session, transaction_repo, 3, wallet="wallet-other")
+
+        first = transaction_repo.get_page_by_user_wallets(["wallet-a", "wallet-b"], limit=4)
+        second = transaction_repo.get_page_by_user_wallets(["wallet-a", "wallet-b"], limit=4, cursor=first.next_cursor)
+
+        assert len(first.transactions) == 4
+        assert len(second.transactions) == 2
+        assert second.next_cursor is None
+        assert {tx.from_wallet_address for tx in first.transactions + second.transactions} == {"wallet-a", "wallet-b"}
+
+    def test_user_wallets_empty_list(self, transaction_repo):
+        page = transaction_repo.get_page_by_user_wallets([])
+        assert page.transactions == []
+        assert page.next_cursor is None
+
+    @pytest.mark.parametrize("limit", [0, -1, SQLAlchemyTransactionRepository.MAX_PAGE_SIZE + 1])
+    def test_invalid_page_size_raises(self, transaction_repo, limit):
+        with pytest.raises(ValueError, match="Page size"):
+            transaction_repo.get_page_by_wallet_address("wallet-1", limit=limit)
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "", "W10", "eyJhIjoxfQ"])
+    def test_invalid_cursor_raises(self, transaction_repo, cursor):
+        with pytest.raises(InvalidCursorError):
+            transaction_repo.get_page_by_wallet_address("wallet-1", cursor=cursor)
+
+    def test_cursor_round_trip(self):
+        cursor = TransactionCursor(created_at=datetime(2025, 1, 1, 12, 30, 0, 123456, tzinfo=UTC), id="tx-1")
+        assert TransactionCursor.decode(cursor.encode()) == cursor
+
+
+class TestIterTransactions:
+
+    def test_streams_every_transaction_oldest_first(self, transaction_repo, session):
+        created = make_history(session, transaction_repo, 25)
+
+        streamed = list(transaction_repo.iter_transactions(batch_size=4))
+
+        assert [tx.id for tx in streamed] == [tx.id for tx in created]
+        assert streamed[0].fee_satoshis == created[0].fee_satoshis
+
+    def test_is_lazy_and_keeps_no_orm_objects(self, transaction_repo, session):
+        make_history(session, transaction_repo, 10)
+        session.expunge_all()
+
+        iterator = transaction_repo.iter_transactions(batch_size=3)
+        first = next(iterator)
+
+        assert first.amount_satoshis == 1000
+        assert len(session.identity_map) == 0
+        iterator.close()
+
+    def test_filters(self, transaction_repo, session):
+        make_history(session, transaction_repo, 5, wallet="wallet-a")
+        make_history(session, transaction_repo, 5, wallet="wallet-b")
+        internal = Transaction.create("wallet-a", "wallet-b", 500, True)
+        internal.created_at = datetime(2025, 1, 1, 0, 0, 2, tzinfo=UTC)
+        transaction_repo.save(internal)
+        session.commit()
+
+        by_wallet = TransactionFilter(wallet_addresses=["wallet-a"])
+        by_time = TransactionFilter(
+            created_from=datetime(2025, 1, 1, 0, 0, 1, tzinfo=UTC),
+            created_before=datetime(2025, 1, 1, 0, 0, 3, tzinfo=UTC),
+        )
+        internal_only = TransactionFilter(is_internal_transfer=True)
+
+        assert len(list(transaction_repo.iter_transactions(by_wallet))) == 6
+        assert len(list(transaction_repo.iter_transactions(by_time))) == 5
+        assert [tx.id for tx in transaction_repo.iter_transactions(internal_only)] == [internal.id]
+        assert list(transaction_repo.iter_transactions(TransactionFilter(wallet_addresses=[]))) == []
+
+    def test_batches_with_shared_timestamps_lose_nothing(self, transaction_repo, session):
+        created = make_history(session, transaction_repo, 10, same_timestamp_every=4)
+
+        streamed = list(transaction_repo.iter_transactions(TransactionFilter(wallet_addresses=["wallet-1"]), 3))
+
+        assert [tx.id for tx in streamed] == [tx.id for tx in sorted(created, key=lambda t: (t.created_at, t.id))]
+
+    def test_writers_commit_while_an_export_is_in_progress(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'wallet.db'}")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            make_history(session, SQLAlchemyTransactionRepository(session), 10)
+
+        with Session(engine) as reader, Session(engine) as writer:
+            iterator = SQLAlchemyTransactionRepository(reader).iter_transactions(batch_size=3)
+            streamed = [next(iterator)]
+
+            SQLAlchemyTransactionRepository(writer).save(Transaction.create("wallet-2", "wallet-3", 5000, False))
+            writer.commit()
+
+            streamed.extend(iterator)
+
+        assert len(streamed) == 11
+        engine.dispose()
+
+    def test_invalid_batch_size_raises(self, transaction_repo):
+        with pytest.raises(ValueError, match="Batch size"):
+            next(transaction_repo.iter_transactions(batch_size=0))
+
+
+class TestWalletHistoryQueryPlan:
+
+    def query_plans(self, engine, call) -> list[str]:
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            call()
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        with engine.connect() as conn:
+            return [
+                row[3]
+                for statement, parameters in statements
+                for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)
+            ]
+
+    def assert_index_ordered_merge(self, plan):
+        assert any("MERGE (UNION ALL)" in line for line in plan), plan
+        assert any("idx_transactions_from_wallet_created" in line for line in plan), plan
+        assert any("idx_transactions_to_wallet_created" in line for line in plan), plan
+        assert not any("TEMP B-TREE" in line for line in plan), plan
+
+    def test_wallet_history_uses_no_sort(self, in_memory_db, transaction_repo, session):
+        make_history(session, transaction_repo, 3)
+
+        plan = self.query_plans(in_memory_db, lambda: transaction_repo.get_by_wallet_address("wallet-1"))
+
+        self.assert_index_ordered_merge(plan)
+
+    def test_user_wallets_history_uses_no_sort(self, in_memory_db, transaction_repo, session):
+        make_history(session, transaction_repo, 3)
+
+        plan = self.query_plans(
+            in_memory_db, lambda: transaction_repo.get_by_user_wallets(["wallet-1", "wallet-2", "wallet-3"])
+        )
+
+        self.assert_index_ordered_merge(plan)
+
+    def test_page_after_cursor_seeks_the_index(self, in_memory_db, transaction_repo, session):
+        make_history(session, transaction_repo, 5)
+        cursor = transaction_repo.get_page_by_wallet_address("wallet-1", limit=2).next_cursor
+
+        plan = self.query_plans(
+            in_memory_db, lambda: transaction_repo.get_page_by_user_wallets(["wallet-1", "wallet-2"], 2, cursor)
+        )
+
+        self.assert_index_ordered_merge(plan)
+        assert any("(created_at,id)<" in line for line in plan), plan
+
+    def test_export_batches_seek_the_index(self, in_memory_db, transaction_repo, session):
+        make_history(session, transaction_repo, 5)
+        by_wallets = TransactionFilter(wallet_addresses=["wallet-1", "wallet-2"])
+
+        plan = self.query_plans(in_memory_db, lambda: list(transaction_repo.iter_transactions(by_wallets, 2)))
+
+        self.assert_index_ordered_merge(plan)
+        assert any("(created_at,id)>" in line for line in plan), plan
+
+    def test_full_export_walks_the_created_index(self, in_memory_db, transaction_repo, session):
+        make_history(session, transaction_repo, 5)
+
+        plan = self.query_plans(in_memory_db, lambda: list(transaction_repo.iter_transactions(batch_size=2)))
+
+        assert any("idx_transactions_created_id" in line for line in plan), plan
+        assert not any("TEMP B-TREE" in line for line in plan), plan
+
+    def test_transfers_between_own_wallets_appear_once(self, transaction_repo, session):
+        tx = Transaction.create("wallet-1", "wallet-2", 1000, True)
+        transaction_repo.save(tx)
+        session.commit()
+
+        assert [t.id for t in transaction_repo.get_by_user_wallets(["wallet-1", "wallet-2"])] == [tx.id]
+        assert [t.id for t in transaction_repo.get_by_user_wallets(["wallet-1", "wallet-1"])] == [tx.id]
+
+    def test_many_wallets_fall_back_to_a_single_merge(self, transaction_repo, session, monkeypatch):
+        monkeypatch.setattr(SQLAlchemyTransactionRepository, "MAX_MERGED_WALLETS", 1)
+        tx1 = Transaction.create("wallet-1", "wallet-2", 1000, True)
+        tx2 = Transaction.create("wallet-3", "wallet-1", 2000, False)
+        transaction_repo.save(tx1)
+        transaction_repo.save(tx2)
+        session.commit()
+
+        results = transaction_repo.get_by_user_wallets(["wallet-1", "wallet-2"])
+
+        assert [t.id for t in results] == [tx2.id, tx1.id]
+
+
+class TestPlatformStats:
+
+    def test_save_updates_counters_in_the_same_transaction(self, transaction_repo, session):
+        transaction_repo.save(Transaction.create("wallet-1", "wallet-2", 10000, False))
+        transaction_repo.save(Transaction.create("wallet-2", "wallet-3", 20000, False))
+        session.commit()
+
+        row = session.get(PlatformStatsModel, SQLAlchemyTransactionRepository.PLATFORM_STATS_ID)
+        assert (row.transaction_count, row.total_fees_satoshis) == (2, 450)
+
+    def test_rollback_discards_counter_updates(self, transaction_repo, session):
+        transaction_repo.save(Transaction.create("wallet-1", "wallet-2", 10000, False))
+        session.commit()
+        transaction_repo.save(Transaction.create("wallet-1", "wallet-2", 20000, False))
+        session.rollback()
+
+        assert transaction_repo.count_all() == 1
+        assert transaction_repo.get_total_fees_collected() == 150
+
+    def test_reads_do_not_scan_transactions(self, in_memory_db, transaction_repo, session):
+        transaction_repo.save(Transaction.create("wallet-1", "wallet-2", 10000, False))
+        session.commit()
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(in_memory_db, "before_cursor_execute", capture)
+        try:
+            transaction_repo.count_all()
+            transaction_repo.get_total_fees_collected()
+        finally:
+            event.remove(in_memory_db, "before_cursor_execute", capture)
+
+        assert statements
+        assert all("transactions" not in statement for statement in statements)
+
+    def test_missing_row_is_seeded_from_existing_transactions(self, transaction_repo, session):
+        transaction_repo.save(Transaction.create("wallet-1", "wallet-2", 10000, False))
+        transaction_repo.save(Transaction.create("wallet-1", "wallet-2", 20000, False))
+        session.commit()
+        session.query(PlatformStatsModel).delete()
+        session.commit()
+
+        assert transaction_repo.count_all() == 2
+        assert transaction_repo.get_total_fees_collected() == 450
+
+        transaction_repo.save(Transaction.create("wallet-1", "wallet-2", 10000, False))
+        session.commit()
+
+        row = session.get(PlatformStatsModel, SQLAlchemyTransactionRepository.PLATFORM_STATS_ID)
+        assert (row.transaction_count, row.total_fees_satoshis) == (3, 600)
+
+    def test_missing_row_is_seeded_on_bulk_save(self, transaction_repo, session):
+        transaction_repo.save(Transaction.create("wallet-1", "wallet-2", 10000, False))
+        session.commit()
+        session.query(PlatformStatsModel).delete()
+        session.commit()
+
+        transaction_repo.save_many([Transaction.create("wallet-1", "wallet-2", 20000, False)])
+        session.commit()
+
+        row = session.get(PlatformStatsModel, SQLAlchemyTransactionRepository.PLATFORM_STATS_ID)
+        assert (row.transaction_count, row.total_fees_satoshis) == (2, 450)
+
+    def test_rebuild_recomputes_from_scratch(self, transaction_repo, session):
+        transaction_repo.save(Transaction.create("wallet-1", "wallet-2", 10000, False))
+        transaction_repo.save(Transaction.create("wallet-1", "wallet-2", 5000, True))
+        session.commit()
+        session.get(PlatformStatsModel, SQLAlchemyTransactionRepository.PLATFORM_STATS_ID).transaction_count = 99
+        session.commit()
+
+        assert transaction_repo.scan_platform_totals() == (2, 150)
+        transaction_repo.rebuild_platform_stats()
+        session.commit()
+
+        assert transaction_repo.count_all() == 2
+        assert transaction_repo.get_total_fees_collected() == 150
+
+    def test_rebuild_on_empty_ledger(self, transaction_repo, session):
+        transaction_repo.rebuild_platform_stats()
+        session.commit()
+
+        assert transaction_repo.count_all() == 0
+        assert transaction_repo.scan_platform_totals() == (0, 0)
+
+
+class TestSaveMany:
+
+    def test_inserts_every_transaction_and_updates_counters(self, transaction_repo, session):
+        transactions = [Transaction.create("wallet-1", f"dest-{i}", 10000 + i, i % 2 == 0) for i in range(50)]
+
+        transaction_repo.save_many(transactions)
+        session.commit()
+
+        assert session.query(TransactionModel).count() == 50
+        assert transaction_repo.count_all() == 50
+        assert transaction_repo.get_total_fees_collected() == sum(t.fee_satoshis for t in transactions)
+        assert transaction_repo.get_by_id(transactions[7].id).amount_satoshis == 10007
+
+    def test_uses_one_executemany_per_chunk(self, in_memory_db, transaction_repo, session, monkeypatch):
+        monkeypatch.setattr(SQLAlchemyTransactionRepository, "BULK_INSERT_CHUNK_SIZE", 10)
+        inserts = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT INTO transactions"):
+                inserts.append(executemany)
+
+        event.listen(in_memory_db, "before_cursor_execute", capture)
+        try:
+            transaction_repo.save_many(
+                Transaction.create("wallet-1", "wallet-2", 1000, False) for _ in range(25)
+            )
+        finally:
+            event.remove(in_memory_db, "before_cursor_execute", capture)
+
+        assert len(inserts) == 3
+        assert len(session.identity_map) == 0
+
+    def test_rollback_discards_batch(self, transaction_repo, session):
+        transaction_repo.save_many([Transaction.create("wallet-1", "wallet-2", 1000, False)])
+        session.rollback()
+
+        assert transaction_repo.count_all() == 0
+        assert transaction_repo.scan_platform_totals() == (0, 0)
+
+    def test_empty_batch_is_a_no_op(self, transaction_repo, session):
+        transaction_repo.save_many([])
+        session.commit()
+
+        assert transaction_repo.count_all() == 0
+
+
+def test_core_reads_keep_the_identity_map_empty(session):
+    repo = SQLAlchemyTransactionRepository(session, core_reads=True)
+    repo.save_many(Transaction.create("wallet-1", f"wallet-{i}", 1000, False) for i in range(2, 12))
+    session.commit()
+
+    history = repo.get_by_wallet_address("wallet-1")
+    repo.get_by_id(history[0].id)
+    repo.get_page_by_wallet_address("wallet-1", limit=3)
+
+    assert len(history) == 10
+    assert len(session.identity_map) == 0
@@ -0,0 +1,135 @@
+from datetime import datetime, timedelta, UTC
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.core.models.transaction import Transaction
+from src.core.models.transaction_rollup import RollupGranularity
+from src.infra.database.models import Base, HourlyTransactionRollupModel
+from src.infra.repositories.transaction_repository import SQLAlchemyTransactionRepository
+from src.infra.repositories.transaction_rollup_repository import SQLAlchemyTransactionRollupRepository
+
+BASE = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def transaction_repo(session):
+    return SQLAlchemyTransactionRepository(session)
+
+
+@pytest.fixture
+def rollup_repo(session):
+    return SQLAlchemyTransactionRollupRepository(session)
+
+
+def make_transaction(amount: int, at: datetime, internal: bool = False) -> Transaction:
+    transaction = Transaction.create("wallet-1", "wallet-2", amount, internal)
+    transaction.created_at = at
+    return transaction
+
+
+def history(count: int) -> list[Transaction]:
+    return [make_transaction(1000 + i, BASE + timedelta(minutes=37 * i), internal=i % 5 == 0) for i in range(count)]
+
+
+class TestTransactionRollupRepository:
+
+    def test_save_updates_hourly_and_daily_buckets(self, transaction_repo, rollup_repo, session):
+        transaction_repo.save(make_transaction(10000, BASE + timedelta(minutes=5)))
+        transaction_repo.save(make_transaction(20000, BASE + timedelta(minutes=50), internal=True))
+        transaction_repo.save(make_transaction(30000, BASE + timedelta(hours=1, minutes=1)))
+        session.commit()
+
+        hourly = rollup_repo.get_rollups(RollupGranularity.HOUR, BASE, BASE + timedelta(days=1))
+        daily = rollup_repo.get_rollups(RollupGranularity.DAY, BASE, BASE + timedelta(days=1))
+
+        assert [r.bucket_start for r in hourly] == [BASE, BASE + timedelta(hours=1)]
+        first = hourly[0]
+        assert (first.transaction_count, first.internal_count, first.external_count) == (2, 1, 1)
+        assert (first.volume_satoshis, first.internal_volume_satoshis, first.external_volume_satoshis) == (
+            30000, 20000, 10000
+        )
+        assert first.fees_satoshis == 150
+        assert len(daily) == 1
+        assert daily[0].transaction_count == 3
+        assert daily[0].fees_satoshis == 600
+
+    def test_save_many_matches_save(self, transaction_repo, rollup_repo, session):
+        transactions = history(60)
+        transaction_repo.save_many(transactions[:30])
+        for transaction in transactions[30:]:
+            transaction_repo.save(transaction)
+        session.commit()
+
+        daily = rollup_repo.get_rollups(RollupGranularity.DAY, BASE, BASE + timedelta(days=5))
+
+        assert sum(r.transaction_count for r in daily) == 60
+        assert sum(r.volume_satoshis for r in daily) == sum(t.amount_satoshis for t in transactions)
+
+    def test_rollback_discards_bucket_updates(self, transaction_repo, rollup_repo, session):
+        transaction_repo.save(make_transaction(10000, BASE))
+        session.rollback()
+
+        assert rollup_repo.get_rollups(RollupGranularity.HOUR, BASE, BASE + timedelta(days=1)) == []
+
+    def test_rebuild_matches_incremental_updates(self, transaction_repo, rollup_repo, session):
+        transaction_repo.save_many(history(100))
+        session.commit()
+        end = BASE + timedelta(days=4)
+        incremental = {
+            g: rollup_repo.get_rollups(g, BASE, end) for g in RollupGranularity
+        }
+
+        rollup_repo.rebuild_range(BASE, end)
+        session.commit()
+
+        for granularity in RollupGranularity:
+            assert rollup_repo.get_rollups(granularity, BASE, end) == incremental[granularity]
+
+    def test_rebuild_repairs_drift_only_inside_the_range(self, transaction_repo, rollup_repo, session):
+        transaction_repo.save_many(history(100))
+        session.commit()
+        for bucket in session.query(HourlyTransactionRollupModel):
+            bucket.transaction_count = 0
+        session.commit()
+
+        rollup_repo.rebuild_range(BASE, BASE + timedelta(days=1))
+        session.commit()
+
+        hourly = rollup_repo.get_rollups(RollupGranularity.HOUR, BASE, BASE + timedelta(days=4))
+        assert all(r.transaction_count > 0 for r in hourly if r.bucket_start < BASE + timedelta(days=1))
+        assert all(r.transaction_count == 0 for r in hourly if r.bucket_start >= BASE + timedelta(days=1))
+
+    def test_rebuild_requires_day_boundaries(self, rollup_repo):
+        with pytest.raises(ValueError, match="day boundaries"):
+            rollup_repo.rebuild_range(BASE + timedelta(hours=1), BASE + timedelta(days=1))
+
+    def test_get_rollups_filters_by_range(self, transaction_repo, rollup_repo, session):
+        transaction_repo.save_many(history(100))
+        session.commit()
+
+        hourly = rollup_repo.get_rollups(
+            RollupGranularity.HOUR, BASE + timedelta(hours=2, minutes=30), BASE + timedelta(hours=5)
+        )
+
+        assert [r.bucket_start.hour for r in hourly] == [2, 3, 4]
+
+    def test_transaction_time_range(self, transaction_repo, rollup_repo, session):
+        assert rollup_repo.transaction_time_range() is None
+
+        transaction_repo.save_many(history(3))
+        session.commit()
+
+        earliest, latest = rollup_repo.transaction_time_range()
+        assert earliest == BASE.replace(tzinfo=None)
+        assert latest == (BASE + timedelta(minutes=74)).replace(tzinfo=None)
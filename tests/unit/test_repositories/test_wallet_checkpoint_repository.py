@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta, UTC
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.core.models.transaction import Transaction
+from src.infra.database.models import Base
+from src.infra.repositories.transaction_repository import SQLAlchemyTransactionRepository
+from src.infra.repositories.wallet_checkpoint_repository import SQLAlchemyWalletCheckpointRepository
+
+BASE = datetime(2025, 1, 1, tzinfo=UTC)
+OPENING = 10_000
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def checkpoint_repo(session):
+    return SQLAlchemyWalletCheckpointRepository(session)
+
+
+@pytest.fixture
+def ledger(session):
+    """
+    a -> b 1000 (fee 15), b -> a 400 (fee 6), a -> c 200 (fee 3), one minute apart.
+    """
+    transactions = []
+    for minute, (source, destination, amount) in enumerate([("a", "b", 1000), ("b", "a", 400), ("a", "c", 200)]):
+        transaction = Transaction.create(source, destination, amount)
+        transaction.created_at = BASE + timedelta(minutes=minute)
+        transactions.append(transaction)
+    SQLAlchemyTransactionRepository(session).save_many(transactions)
+    session.commit()
+    return transactions
+
+
+class TestWalletCheckpointRepository:
+
+    def test_advance_without_transactions(self, checkpoint_repo):
+        assert checkpoint_repo.advance(BASE, limit=10, opening_balance_satoshis=OPENING) == 0
+        assert checkpoint_repo.latest_cursor() is None
+        assert checkpoint_repo.get("a") is None
+
+    def test_advance_applies_every_transaction(self, checkpoint_repo, ledger):
+        applied = checkpoint_repo.advance(BASE + timedelta(hours=1), limit=10, opening_balance_satoshis=OPENING)
+
+        assert applied == 3
+        assert checkpoint_repo.get("a").balance_satoshis == OPENING - 1000 + 394 - 200
+        assert checkpoint_repo.get("b").balance_satoshis == OPENING + 985 - 400
+        assert checkpoint_repo.get("c").balance_satoshis == OPENING + 197
+        assert checkpoint_repo.get("b").cursor.id == ledger[1].id
+        assert checkpoint_repo.latest_cursor().id == ledger[2].id
+
+    def test_advance_resumes_in_batches(self, checkpoint_repo, ledger):
+        until = BASE + timedelta(hours=1)
+
+        assert checkpoint_repo.advance(until, limit=2, opening_balance_satoshis=OPENING) == 2
+        assert checkpoint_repo.latest_cursor().id == ledger[1].id
+        assert checkpoint_repo.get("c") is None
+
+        assert checkpoint_repo.advance(until, limit=2, opening_balance_satoshis=OPENING) == 1
+        assert checkpoint_repo.advance(until, limit=2, opening_balance_satoshis=OPENING) == 0
+        assert checkpoint_repo.get("a").balance_satoshis == OPENING - 1000 + 394 - 200
+
+    def test_advance_leaves_unsettled_transactions(self, checkpoint_repo, ledger):
+        assert checkpoint_repo.advance(BASE + timedelta(minutes=1), limit=10, opening_balance_satoshis=OPENING) == 1
+        assert checkpoint_repo.latest_cursor().id == ledger[0].id
+
+    def test_balance_delta_counts_only_transactions_after_cursor(self, checkpoint_repo, ledger):
+        assert checkpoint_repo.balance_delta("a", None) == -1000 + 394 - 200
+
+        checkpoint_repo.advance(BASE + timedelta(minutes=1), limit=10, opening_balance_satoshis=OPENING)
+        checkpoint = checkpoint_repo.get("a")
+
+        assert checkpoint.balance_satoshis + checkpoint_repo.balance_delta("a", checkpoint.cursor) == OPENING - 806
+
+    def test_invalid_batch_size(self, checkpoint_repo):
+        with pytest.raises(ValueError):
+            checkpoint_repo.advance(BASE, limit=0, opening_balance_satoshis=OPENING)
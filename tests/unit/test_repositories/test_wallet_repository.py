@@ -0,0 +1,157 @@
+from dataclasses import replace
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from src.core.interfaces.wallet_repository import StaleWalletError
+from src.core.models.wallet import Wallet
+from src.core.services.wallet_service import WalletService
+from src.infra.database.models import Base
+from src.infra.repositories.wallet_adjustment_repository import SQLAlchemyWalletAdjustmentRepository
+from src.infra.repositories.wallet_repository import SQLAlchemyWalletRepository, WalletNotFound
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def session(engine):
+    session = Session(engine)
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def wallet(session):
+    wallet = Wallet.create("user-1")
+    SQLAlchemyWalletRepository(session).save(wallet)
+    session.commit()
+    session.expunge_all()
+    return wallet
+
+
+@pytest.fixture
+def statements(engine):
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append(statement.split()[0].upper())
+
+    event.listen(engine, "before_cursor_execute", capture)
+    yield captured
+    event.remove(engine, "before_cursor_execute", capture)
+
+
+@pytest.fixture(params=[False, True], ids=["orm_reads", "core_reads"])
+def service(request, session):
+    return WalletService(
+        SQLAlchemyWalletRepository(session, core_reads=request.param),
+        SQLAlchemyWalletAdjustmentRepository(session),
+    )
+
+
+class TestWalletBalanceUpdates:
+
+    def test_deposit_is_one_read_and_two_writes(self, service, session, wallet, statements):
+        service.deposit(user_id="user-1", address=wallet.address, amount_satoshis=50)
+        session.commit()
+
+        assert statements == ["SELECT", "UPDATE", "INSERT"]
+
+    def test_withdraw_is_one_read_and_two_writes(self, service, session, wallet, statements):
+        service.withdraw(user_id="user-1", address=wallet.address, amount_satoshis=50)
+        session.commit()
+
+        assert statements == ["SELECT", "UPDATE", "INSERT"]
+
+    def test_update_persists_balance_and_refreshes_loaded_wallet(self, session, wallet):
+        repo = SQLAlchemyWalletRepository(session)
+        loaded = repo.get_by_address(wallet.address)
+
+        loaded.deposit(25)
+        repo.update(loaded)
+
+        assert repo.get_by_address(wallet.address).balance_satoshis == wallet.balance_satoshis + 25
+        session.commit()
+        session.expunge_all()
+        assert repo.get_by_id(wallet.id).balance_satoshis == wallet.balance_satoshis + 25
+
+    def test_update_missing_wallet(self, session):
+        with pytest.raises(WalletNotFound):
+            SQLAlchemyWalletRepository(session).update(Wallet.create("user-1"))
+
+
+class TestGetManyByAddresses:
+
+    @pytest.fixture(params=[False, True], ids=["orm_reads", "core_reads"])
+    def repo(self, request, session):
+        return SQLAlchemyWalletRepository(session, core_reads=request.param)
+
+    @pytest.fixture
+    def wallets(self, session):
+        created = [Wallet.create(f"user-{i % 2}") for i in range(7)]
+        for wallet in created:
+            SQLAlchemyWalletRepository(session).save(wallet)
+        session.commit()
+        session.expunge_all()
+        return created
+
+    def test_returns_known_wallets_by_address(self, repo, wallets):
+        addresses = [wallets[0].address, "missing", wallets[3].address, wallets[0].address]
+
+        assert repo.get_many_by_addresses(addresses) == {w.address: w for w in (wallets[0], wallets[3])}
+
+    def test_empty_input(self, repo, statements):
+        assert repo.get_many_by_addresses([]) == {}
+        assert statements == []
+
+    def test_queries_in_chunks(self, repo, wallets, statements, monkeypatch):
+        monkeypatch.setattr(SQLAlchemyWalletRepository, "IN_CHUNK_SIZE", 3)
+
+        found = repo.get_many_by_addresses(w.address for w in wallets)
+
+        assert found == {w.address: w for w in wallets}
+        assert statements == ["SELECT"] * 3
+
+    def test_update_bumps_version(self, session, wallet):
+        repo = SQLAlchemyWalletRepository(session)
+        loaded = repo.get_by_address(wallet.address)
+
+        loaded.deposit(25)
+        repo.update(loaded)
+
+        assert loaded.version == wallet.version + 1
+        session.commit()
+        session.expunge_all()
+        assert repo.get_by_id(wallet.id).version == wallet.version + 1
+
+    def test_update_from_stale_read_is_rejected(self, session, wallet):
+        repo = SQLAlchemyWalletRepository(session)
+        first = repo.get_by_address(wallet.address)
+        stale = replace(first)
+
+        first.deposit(25)
+        repo.update(first)
+        stale.deposit(100)
+
+        with pytest.raises(StaleWalletError):
+            repo.update(stale)
+
+        current = repo.get_by_address(wallet.address)
+        assert current.balance_satoshis == wallet.balance_satoshis + 25
+        assert current.version == wallet.version + 1
+
+    def test_conditional_updates_bump_version(self, session, wallet):
+        repo = SQLAlchemyWalletRepository(session)
+
+        assert repo.debit(wallet.address, 10)
+        assert repo.credit(wallet.address, 5)
+        session.commit()
+        session.expunge_all()
+
+        assert repo.get_by_id(wallet.id).version == wallet.version + 2
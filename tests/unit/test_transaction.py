@@ -159,4 +159,44 @@ class TestTransactionMethods:
             amount_satoshis=100000,
             is_internal_transfer=True
         )
-        assert transaction.get_recipient_amount() == 100000
\ No newline at end of file
+        assert transaction.get_recipient_amount() == 100000
+
+class TestCompactTransaction:
+
+    def test_round_trip(self):
+        transaction = Transaction.create("wallet_abc", "wallet_xyz", 100000)
+
+        restored = transaction.to_compact().to_transaction()
+
+        assert restored == transaction
+        assert restored.created_at.tzinfo is not None
+
+    def test_stores_epoch_micros(self):
+        transaction = Transaction.create("wallet_abc", "wallet_xyz", 100000)
+        transaction.created_at = datetime(1970, 1, 1, 0, 0, 1, 5, tzinfo=timezone.utc)
+
+        assert transaction.to_compact().created_at_us == 1_000_005
+
+    def test_addresses_are_interned(self):
+        first = Transaction.create("".join(["wallet", "_abc"]), "wallet_xyz", 1000).to_compact()
+        second = Transaction.create("".join(["wallet", "_abc"]), "wallet_xyz", 2000).to_compact()
+
+        assert first.from_wallet_address is second.from_wallet_address
+
+    def test_is_frozen(self):
+        compact = Transaction.create("wallet_abc", "wallet_xyz", 1000).to_compact()
+
+        with pytest.raises(AttributeError):
+            compact.amount_satoshis = 1
+
+    def test_unpersisted_transaction_cannot_be_compacted(self):
+        transaction = Transaction("wallet_abc", "wallet_xyz", 1000, 15)
+
+        with pytest.raises(ValueError, match="persisted"):
+            transaction.to_compact()
+
+    def test_models_have_no_instance_dict(self):
+        transaction = Transaction.create("wallet_abc", "wallet_xyz", 1000)
+
+        assert not hasattr(transaction, "__dict__")
+        assert not hasattr(transaction.to_compact(), "__dict__")